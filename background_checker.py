@@ -1,13 +1,51 @@
 # background_checker.py
 
+import argparse
+import signal
+import threading
 import time
+from datetime import datetime
 from src.database.db_manager import DBManager
 from src.core.config_manager import ConfigManager
-from src.core.tracker import check_single_product
+from src.core.tracker import run_product_checks, profile_run_from_config
+from src.scraping.webdriver_pool import WebDriverManager
+from src.utils import constants
 
-def run_checks():
+def check_due_products(db: DBManager, config: ConfigManager, cancel_event: threading.Event | None = None,
+                       profile: bool = False, profile_dir: str | None = None) -> bool:
     """
-    Veritabanındaki tüm aktif ürünleri döngüye alarak fiyatlarını kontrol eder.
+    Kontrol zamanı gelmiş aktif ürünlerin fiyatlarını kontrol eder. Her ürünün bir
+    sonraki kontrol zamanı, fiyat değişkenliğine, hedefe yakınlığına ve son hatalara
+    göre ayarlanır (bkz. src/core/check_policy.py).
+    :param profile: True ise (veya 'profile_runs' ayarı '1' ise) çalıştırmanın CPU ve
+                    bellek profili `profile_dir` altına kaydedilir.
+    :return: Tur çalıştıysa True, başka bir kontrol sürdüğü için atlandıysa False.
+    """
+    run_lock = db.run_lock()
+    if not run_lock.acquire():
+        print("Başka bir fiyat kontrolü zaten çalışıyor (GUI veya başka bir görev), bu tur atlandı.")
+        return False
+    try:
+        active_products = db.get_due_products(
+            per_site_limit=config.get_int('check_budget_per_site', constants.DEFAULT_CHECK_BUDGET_PER_SITE))
+
+        if not active_products:
+            print("Kontrol zamanı gelmiş aktif ürün bulunmuyor.")
+            return True
+
+        print(f"Kontrol zamanı gelmiş {len(active_products)} adet aktif ürün bulundu.")
+        # Web sitelerine karşı nazik olmak için bekleme artık site başına hız sınırıyla yapılıyor
+        # (ayarlar: 'rate_limit_interval', 'rate_limit_burst').
+        with profile_run_from_config(config, force=profile, output_root=profile_dir, label="background"):
+            run_product_checks(active_products, db, config, cancel_event=cancel_event)
+        return True
+    finally:
+        run_lock.release()
+
+def run_checks(profile: bool = False, profile_dir: str | None = None):
+    """
+    Tek seferlik kontrol (cron/Görev Zamanlayıcı için): zamanı gelmiş ürünleri
+    kontrol eder ve tüm kaynakları kapatarak çıkar.
     """
     print("="*50)
     print(f"Arka Plan Fiyat Kontrolü Başladı - {time.ctime()}")
@@ -16,28 +54,129 @@ def run_checks():
     db = None
     try:
         db = DBManager()
-        config = ConfigManager(db)
-
-        active_products = db.get_active_products_for_check()
-
-        if not active_products:
-            print("Takip edilen aktif ürün bulunmuyor.")
-            return
-
-        print(f"Kontrol edilecek {len(active_products)} adet aktif ürün bulundu.")
-        for product in active_products:
-            check_single_product(product, db, config)
-            # Web sitelerine karşı nazik olmak ve engellenmemek için istekler arasına bir bekleme koyuyoruz.
-            time.sleep(5) 
-        
+        check_due_products(db, ConfigManager(db), profile=profile, profile_dir=profile_dir)
     except Exception as e:
         print(f"Arka plan denetleyicisinde beklenmedik bir hata oluştu: {e}")
     finally:
         if db:
             db.close()
+        WebDriverManager.close_all()
         print("\nFiyat kontrolü tamamlandı.")
         print("="*50)
 
+class CheckerDaemon:
+    """
+    Sürekli çalışan arka plan denetleyicisi. Veritabanı bağlantısı ve tarayıcılar
+    turlar arasında açık tutulur; her tur yalnızca zamanı gelmiş ürünleri kontrol
+    eder ve bir sonraki tur, en yakın kontrol zamanında (en geç `interval` saniye
+    sonra) başlar.
+
+    SIGTERM/SIGINT: devam eden tur yeni ürün almayı bırakır, çekilmiş sonuçlar
+    kaydedilir ve kaynaklar kapatılarak çıkılır.
+    SIGHUP: ayarlar bir sonraki turdan önce veritabanından yeniden okunur.
+
+    Atlanan (kilit başka süreçte) veya hata veren turlardan sonra ürünlerin
+    kontrol zamanı geçmiş kalır; bu durumda her ardışık başarısızlıkta iki katına
+    çıkan bir bekleme (DAEMON_RETRY_DELAY'den `interval`a kadar) uygulanır.
+    """
+
+    def __init__(self, interval: float | None = None, profile: bool = False, profile_dir: str | None = None):
+        """
+        :param interval: İki tur arası en uzun bekleme (saniye); None ise ayardan okunur.
+        :param profile: True ise her tur ayrı bir dizine profillenir.
+        """
+        self.interval_override = interval
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.reload_requested = False
+        self.failed_rounds = 0
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGTERM, self._on_stop_signal)
+        signal.signal(signal.SIGINT, self._on_stop_signal)
+        if hasattr(signal, 'SIGHUP'):  # Windows'ta yoktur
+            signal.signal(signal.SIGHUP, self._on_reload_signal)
+
+    def _on_stop_signal(self, signum, frame):
+        print(f"\nSinyal alındı ({signal.Signals(signum).name}), denetleyici durduruluyor...")
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def _on_reload_signal(self, signum, frame):
+        print("\nSIGHUP alındı, ayarlar yeniden yüklenecek.")
+        self.reload_requested = True
+        self.wake_event.set()
+
+    def _interval(self, config: ConfigManager) -> float:
+        if self.interval_override is not None:
+            return self.interval_override
+        return config.get_float('daemon_interval_seconds', constants.DEFAULT_DAEMON_INTERVAL)
+
+    def _seconds_until_next_round(self, db: DBManager, config: ConfigManager) -> float:
+        interval = self._interval(config)
+        next_check = db.get_next_check_time()
+        if next_check is None:
+            return interval
+        wait = max(0.0, min(interval, (next_check - datetime.now()).total_seconds()))
+        if self.failed_rounds:
+            # Geçmişte kalan kontrol zamanı yüzünden durmadan tur denenmesin
+            retry_delay = constants.DAEMON_RETRY_DELAY * 2 ** min(self.failed_rounds - 1, 10)
+            wait = max(wait, min(interval, retry_delay))
+        return wait
+
+    def run(self):
+        print("="*50)
+        print(f"Arka Plan Fiyat Denetleyicisi (daemon) Başladı - {time.ctime()}")
+        print("="*50)
+        db = DBManager()
+        config = ConfigManager(db)
+        try:
+            while not self.stop_event.is_set():
+                if self.reload_requested:
+                    self.reload_requested = False
+                    config.invalidate()
+                    print("Ayarlar yeniden yüklendi.")
+                try:
+                    print(f"\nKontrol turu başladı - {time.ctime()}")
+                    completed = check_due_products(db, config, cancel_event=self.stop_event,
+                                                   profile=self.profile, profile_dir=self.profile_dir)
+                except Exception as e:
+                    print(f"Kontrol turunda beklenmedik bir hata oluştu: {e}")
+                    completed = False
+                self.failed_rounds = 0 if completed else self.failed_rounds + 1
+
+                wait = self._seconds_until_next_round(db, config)
+                print(f"Bir sonraki tur {wait:.0f} saniye sonra.")
+                self.wake_event.wait(wait)
+                self.wake_event.clear()
+        finally:
+            db.close()
+            WebDriverManager.close_all()
+            print("\nArka plan denetleyicisi durduruldu.")
+            print("="*50)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PricePal arka plan fiyat denetleyicisi")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Tek seferlik çalışmak yerine sürekli çalış (tarayıcılar açık tutulur)")
+    parser.add_argument('--interval', type=float, default=None,
+                        help="Daemon modunda iki tur arası en uzun bekleme, saniye "
+                             f"(varsayılan: 'daemon_interval_seconds' ayarı veya {constants.DEFAULT_DAEMON_INTERVAL})")
+    parser.add_argument('--profile', action='store_true',
+                        help="Çalıştırmanın CPU profilini ve bellek anlık görüntülerini kaydet")
+    parser.add_argument('--profile-dir', default=None,
+                        help=f"Profil çıktılarının kök dizini (varsayılan: {constants.PROFILE_DIR})")
+    args = parser.parse_args(argv)
+
+    if args.daemon:
+        daemon = CheckerDaemon(interval=args.interval, profile=args.profile, profile_dir=args.profile_dir)
+        daemon.install_signal_handlers()
+        daemon.run()
+    else:
+        run_checks(profile=args.profile, profile_dir=args.profile_dir)
+
 
 if __name__ == "__main__":
-    run_checks()
\ No newline at end of file
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/block_benchmark.py
+"""
+Canlı ürün sayfalarını tarayıcıda her kaynak engelleme profiliyle açar ve
+aktarılan bayt, istek sayısı ve yüklenme süresini karşılaştırır. Her profilde
+sonucun engellemesiz ('off') sonuçla aynı olduğu da doğrulanır.
+
+Kullanım:
+    python benchmarks/block_benchmark.py <url> [<url> ...] [--profiles off,standard] [--rounds 3]
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import fixture_utils  # noqa: F401  (proje kökünü sys.path'e ekler)
+
+from src.scraping import scraper_factory, resource_blocking
+from src.scraping.base_scraper import BaseScraper
+from src.scraping.webdriver_pool import WebDriverManager
+
+def measure(url: str, profile: str, rounds: int) -> tuple[dict | None, list[dict]]:
+    BaseScraper.configure(BaseScraper.page_ready_timeout, block_profile=profile, block_profile_overrides={})
+    result, samples = None, []
+    for _ in range(rounds):
+        scraper = scraper_factory.get_scraper(url)
+        with contextlib.redirect_stdout(io.StringIO()):
+            # HTTP yolu atlanır; ölçülen tarayıcı yüküdür
+            fetched = scraper._fetch_browser({})
+            result = scraper.parse(fetched['html'])
+        if fetched['metrics']:
+            samples.append(fetched['metrics'])
+    return result, samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Tarayıcı kaynak engelleme profillerinin ölçümü")
+    parser.add_argument("urls", nargs="+", help="Ürün sayfalarının adresleri")
+    parser.add_argument("--profiles", default=",".join(resource_blocking.BLOCK_PROFILES),
+                        help="Virgülle ayrılmış profil listesi")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = [profile.strip() for profile in args.profiles.split(",") if profile.strip()]
+    try:
+        for url in args.urls:
+            print(url)
+            baseline = None
+            for profile in profiles:
+                result, samples = measure(url, profile, args.rounds)
+                baseline = baseline if baseline is not None else result
+                if not samples:
+                    print(f"  {profile:<11} ölçüm alınamadı")
+                    continue
+                median = lambda key: statistics.median(sample[key] for sample in samples)
+                same = "OK" if result == baseline else "FARKLI SONUÇ"
+                print(f"  {profile:<11} {median('bytes') / 1024:8.0f} KB  {median('requests'):5.0f} istek"
+                      f"  {median('load_ms'):7.0f} ms  [{same}]")
+    finally:
+        WebDriverManager.close_all()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/fixture_utils.py
+"""Kayıtlı sayfa (fixture) dosyalarını yükleme ve scraper'lara enjekte etme yardımcıları."""
+
+import importlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+MANIFEST_PATH = FIXTURES_DIR / "manifest.json"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Kaydedilen sayfalardan ayıklanan kişisel/oturuma özel veriler
+_SANITIZE_RULES = [
+    (re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+"), "user@example.com"),
+    (re.compile(r'((?:session|csrf|token|ubid|customer)[\w-]*["\']?\s*[:=]\s*["\']?)[\w%.-]{8,}', re.I), r"\1REDACTED"),
+    (re.compile(r'(<input[^>]*type=["\']hidden["\'][^>]*value=["\'])[^"\']*', re.I), r"\1"),
+    (re.compile(r"<iframe\b.*?</iframe>", re.I | re.S), ""),
+]
+
+def sanitize_html(html: str) -> str:
+    """E-posta, oturum/CSRF belirteçleri, gizli form değerleri ve iframe'leri temizler."""
+    for pattern, replacement in _SANITIZE_RULES:
+        html = pattern.sub(replacement, html)
+    return html
+
+def load_manifest() -> dict:
+    with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(manifest: dict):
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+def load_scraper_class(path: str) -> type:
+    """'paket.modul:Sinif' biçimindeki yoldan scraper sınıfını yükler."""
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+def read_fixture(entry: dict) -> str:
+    with open(FIXTURES_DIR / entry['file'], 'r', encoding='utf-8') as f:
+        return f.read()
+
+def make_page_source(html: str):
+    """Scraper'a verilecek, her URL için aynı kayıtlı HTML'i döndüren sayfa kaynağı."""
+    return lambda url: html
@@ -0,0 +1,99 @@
+# benchmarks/parse_benchmark.py
+"""
+Kayıtlı sayfalar (benchmarks/fixtures) üzerinde scraper'ları ağ olmadan çalıştırır.
+Her fixture için sonucun beklenenle aynı olduğunu doğrular; ardından sayfa/sn,
+aşama süreleri (ağaç kurma, veri çıkarma, clean_price) ve en yüksek bellek
+kullanımını raporlar.
+
+Kullanım:
+    python benchmarks/parse_benchmark.py [--iterations 50] [--only amazon_product]
+
+Bir fixture beklenen sonucu vermezse çıkış kodu 1'dir.
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+import tracemalloc
+from fixture_utils import load_manifest, load_scraper_class, read_fixture, make_page_source
+
+from src.scraping import base_scraper
+
+CLEAN_PRICE_SAMPLES = ["1.299,90 TL", "₺ 24.999,00", "349,-", "12.345.678,99tl", ""]
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def benchmark_fixture(name: str, entry: dict, iterations: int) -> bool:
+    scraper_cls = load_scraper_class(entry['scraper'])
+    html = read_fixture(entry)
+    scraper = scraper_cls(entry['url'], page_source=make_page_source(html))
+
+    # Scraper'ların konsol çıktıları ölçümü bozmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = scraper.scrape()
+        ok = result == entry['expected']
+
+        fetch_times, soup_times, extract_times = [], [], []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            page, t_fetch = _timed(scraper.fetch_html)
+            soup, t_soup = _timed(scraper.make_soup, page)
+            _, t_extract = _timed(scraper.extract, soup)
+            fetch_times.append(t_fetch)
+            soup_times.append(t_soup)
+            extract_times.append(t_extract)
+        total = time.perf_counter() - started
+
+        # Bellek ölçümü zamanlamayı yavaşlattığı için ayrı bir turda yapılır
+        tracemalloc.start()
+        scraper.scrape()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    ms = lambda values: statistics.median(values) * 1000
+    print(f"[{'OK' if ok else 'HATA'}] {name} ({scraper_cls.__name__}, {len(html) / 1024:.0f} KB)")
+    if not ok:
+        print(f"    beklenen: {entry['expected']}")
+        print(f"    bulunan : {result}")
+    print(f"    verim           : {iterations / total:8.1f} sayfa/sn")
+    print(f"    sayfa kaynağı   : {ms(fetch_times):8.3f} ms (medyan)")
+    print(f"    ağaç kurma      : {ms(soup_times):8.3f} ms (medyan)")
+    print(f"    veri çıkarma    : {ms(extract_times):8.3f} ms (medyan)")
+    print(f"    en yüksek bellek: {peak / 1024 / 1024:8.2f} MB")
+    return ok
+
+def benchmark_clean_price(iterations: int):
+    rounds = iterations * 1000
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for sample in CLEAN_PRICE_SAMPLES:
+            base_scraper.BaseScraper.clean_price(sample)
+    elapsed = time.perf_counter() - started
+    calls = rounds * len(CLEAN_PRICE_SAMPLES)
+    print(f"clean_price: {calls / elapsed:,.0f} çağrı/sn ({elapsed / calls * 1e6:.2f} µs/çağrı)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Çevrimdışı scraper ayrıştırma ölçümü")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--only", help="Sadece bu isimdeki fixture'ı çalıştır")
+    args = parser.parse_args()
+
+    print(f"HTML ayrıştırıcı: {base_scraper.HTML_PARSER}\n")
+    manifest = load_manifest()
+    all_ok = True
+    for name, entry in manifest.items():
+        if args.only and name != args.only:
+            continue
+        all_ok = benchmark_fixture(name, entry, args.iterations) and all_ok
+    print()
+    benchmark_clean_price(args.iterations)
+    sys.exit(0 if all_ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# benchmarks/record_fixture.py
+"""
+Canlı bir ürün sayfasını, scraper'ın normal çekme yolu (HTTP veya tarayıcı) ile
+kaydeder, kişisel/oturum verilerinden arındırır ve beklenen sonucu manifest'e yazar.
+
+Kullanım:
+    python benchmarks/record_fixture.py <isim> <url>
+"""
+
+import argparse
+from fixture_utils import FIXTURES_DIR, load_manifest, save_manifest, sanitize_html, make_page_source
+
+from src.scraping import scraper_factory
+from src.scraping.webdriver_pool import WebDriverManager
+
+def main():
+    parser = argparse.ArgumentParser(description="Ürün sayfasını fixture olarak kaydet")
+    parser.add_argument("name", help="Fixture adı (örn. amazon_kulaklik)")
+    parser.add_argument("url", help="Ürün sayfasının adresi")
+    args = parser.parse_args()
+
+    scraper = scraper_factory.get_scraper(args.url)
+    try:
+        html = sanitize_html(scraper.fetch_html())
+    finally:
+        WebDriverManager.close_all()
+
+    # Beklenen sonuç, arındırılmış sayfanın kendisinden üretilir
+    scraper_cls = type(scraper)
+    expected = scraper_cls(args.url, page_source=make_page_source(html)).scrape()
+
+    filename = f"{args.name}.html"
+    (FIXTURES_DIR / filename).write_text(html, encoding='utf-8')
+    manifest = load_manifest()
+    manifest[args.name] = {
+        "scraper": f"{scraper_cls.__module__}:{scraper_cls.__name__}",
+        "url": args.url,
+        "file": filename,
+        "expected": expected,
+    }
+    save_manifest(manifest)
+    print(f"Kaydedildi: {filename} ({len(html) / 1024:.0f} KB) -> {expected}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/startup_benchmark.py
+"""
+Soğuk açılış ölçümü: uygulamayı her seferinde yeni bir Python sürecinde
+başlatır, ilk pencere çizilene kadar geçen süreyi ölçer ve bütçeyle
+(constants.STARTUP_TIME_BUDGET) karşılaştırır. Ekran (display) gerektirir.
+
+Kullanım:
+    python benchmarks/startup_benchmark.py [--runs 5] [--budget 2.0]
+
+Bütçe aşılırsa veya açılışta Selenium yüklenmişse çıkış kodu 1'dir.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils import constants
+
+# Alt süreçte çalışır: main.create_app() ile pencereyi kurar, ilk çizimi bekler ve ölçümü yazar.
+CHILD_CODE = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+app = main.create_app()
+app.update()
+elapsed = time.perf_counter() - t0
+print(json.dumps({
+    'startup': elapsed,
+    'selenium_loaded': 'selenium' in sys.modules,
+    'scraping_loaded': 'src.scraping.base_scraper' in sys.modules,
+}))
+app.destroy()
+"""
+
+def run_once() -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", CHILD_CODE], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['process'] = time.perf_counter() - started
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="PricePal soğuk açılış ölçümü")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=constants.STARTUP_TIME_BUDGET)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    startup = [r['startup'] for r in results]
+    process = [r['process'] for r in results]
+    median = statistics.median(startup)
+
+    print(f"Çalıştırma sayısı     : {args.runs}")
+    print(f"İlk pencere (medyan)  : {median * 1000:.0f} ms  (min {min(startup) * 1000:.0f}, max {max(startup) * 1000:.0f})")
+    print(f"Süreç toplamı (medyan): {statistics.median(process) * 1000:.0f} ms  (yorumlayıcı açılışı dahil)")
+    print(f"Bütçe                 : {args.budget * 1000:.0f} ms")
+
+    failed = False
+    if median > args.budget:
+        print("BAŞARISIZ: Açılış süresi bütçeyi aşıyor.")
+        failed = True
+    if any(r['selenium_loaded'] or r['scraping_loaded'] for r in results):
+        print("BAŞARISIZ: Açılışta Selenium/scraper modülleri yüklendi.")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
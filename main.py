@@ -5,21 +5,25 @@ from src.gui.main_window import App
 from src.core.config_manager import ConfigManager
 from src.database.db_manager import DBManager
 
-def main():
-    """Uygulamanın ana başlangıç fonksiyonu."""
+def create_app() -> App:
+    """Ana pencereyi oluşturur. Başlangıçta açılan veritabanı bağlantısı pencereyle paylaşılır."""
+    db = None
     # Önce ayarları yükleyerek temayı belirle
     try:
         db = DBManager()
         config = ConfigManager(db)
         theme = config.get('theme', 'litera') # Varsayılan tema
-        db.close() # main'in db ile işi bitti
     except Exception as e:
         print(f"Başlangıçta veritabanı/yapılandırma hatası: {e}")
         theme = 'litera' # Hata durumunda varsayılan tema
 
+    return App(themename=theme, db=db)
+
+def main():
+    """Uygulamanın ana başlangıç fonksiyonu."""
     # Ana uygulamayı oluştur ve başlat
-    app = App(themename=theme)
+    app = create_app()
     app.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
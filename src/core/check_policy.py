@@ -0,0 +1,78 @@
+# src/core/check_policy.py
+
+import sqlite3
+from datetime import datetime, timedelta
+from ..core.config_manager import ConfigManager
+from ..utils import constants
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+def update_volatility(previous: float | None, changed: bool) -> float:
+    """
+    Ürünün fiyat değişim oranını üstel hareketli ortalama ile günceller.
+    Sonuç, son kontrollerin yaklaşık ne kadarında fiyatın değiştiğini gösterir (0..1).
+    """
+    if previous is None:
+        previous = constants.DEFAULT_VOLATILITY
+    alpha = constants.VOLATILITY_SMOOTHING
+    return alpha * (1.0 if changed else 0.0) + (1 - alpha) * previous
+
+def target_proximity(price: float | None, target_price: float) -> float:
+    """
+    Fiyatın hedefe ne kadar yakın olduğunu 0..1 arasında döndürür: hedefte veya
+    altında 1, hedefin PROXIMITY_RANGE oranı kadar üstünde ve daha yukarıda 0.
+    """
+    if not price or price <= 0 or target_price <= 0:
+        return 0.0
+    gap = (price - target_price) / target_price
+    return 1.0 - _clamp(gap / constants.PROXIMITY_RANGE, 0.0, 1.0)
+
+def check_interval(volatility: float, proximity: float, consecutive_errors: int,
+                   min_interval: timedelta, max_interval: timedelta) -> timedelta:
+    """
+    Bir sonraki kontrole kadar beklenecek süreyi hesaplar. Sık değişen veya hedefe
+    yakın ürünler en kısa aralığa, durağan ve hedeften uzak olanlar en uzun aralığa
+    yaklaşır. Art arda hata alan ürünler üstel olarak geri çekilir.
+    """
+    if consecutive_errors > 0:
+        backoff = min_interval * (2 ** min(consecutive_errors, 16))
+        return min(max_interval, backoff)
+    urgency = _clamp(max(volatility, proximity), 0.0, 1.0)
+    return max_interval - (max_interval - min_interval) * urgency
+
+def plan_next_check(product: sqlite3.Row, update_data: dict, config: ConfigManager,
+                    now: datetime | None = None) -> dict:
+    """
+    Kontrol sonucuna göre ürünün zamanlama alanlarını hesaplar.
+    :param update_data: process_check_result'ın ürüne yazacağı güncelleme.
+    :return: {'next_check_at', 'volatility', 'consecutive_errors'} güncellemesi.
+    """
+    now = now or datetime.now()
+    min_interval = timedelta(minutes=config.get_float(
+        'check_interval_min_minutes', constants.DEFAULT_CHECK_INTERVAL_MIN_MINUTES))
+    max_interval = timedelta(minutes=config.get_float(
+        'check_interval_max_minutes', constants.DEFAULT_CHECK_INTERVAL_MAX_MINUTES))
+    max_interval = max(min_interval, max_interval)
+
+    volatility = product['volatility']
+    if update_data.get('status') == 'ERROR':
+        consecutive_errors = (product['consecutive_errors'] or 0) + 1
+        price = product['current_price']
+    else:
+        consecutive_errors = 0
+        price = update_data.get('current_price', product['current_price'])
+        # İlk başarılı ölçüm değişim sayılmaz; sadece önceki fiyatla fark varsa değişmiştir
+        changed = product['current_price'] is not None and price != product['current_price']
+        volatility = update_volatility(volatility, changed)
+
+    interval = check_interval(
+        volatility if volatility is not None else constants.DEFAULT_VOLATILITY,
+        target_proximity(price, product['target_price']),
+        consecutive_errors, min_interval, max_interval,
+    )
+    return {
+        'next_check_at': (now + interval).isoformat(),
+        'volatility': volatility,
+        'consecutive_errors': consecutive_errors,
+    }
@@ -1,5 +1,7 @@
 # src/core/config_manager.py
 
+import threading
+import time
 import keyring
 from ..database.db_manager import DBManager
 from ..utils import constants
@@ -9,7 +11,16 @@ class ConfigManager:
     Uygulama ayarlarını ve hassas kimlik bilgilerini yönetir.
     Ayarları veritabanından, şifreleri ise işletim sisteminin
     güvenli anahtar zincirinden (keyring) okur/yazar.
+
+    Ayarlar tek sorguyla okunup süreç içinde veritabanı dosyası başına paylaşılan
+    bir kopyada tutulur; `set` ve `set_email_credentials` bu kopyayı hemen geçersiz
+    kılar, başka süreçlerin değişiklikleri ise en geç CONFIG_CACHE_TTL saniye sonra
+    görülür. Keyring'deki şifre süreç başına bir kez okunur; SMTP kimlik doğrulaması
+    başarısız olursa (bkz. forget_email_password) veya `invalidate` ile atılır.
     """
+    _cache_lock = threading.Lock()
+    _snapshots = {}     # db_path -> (okunma zamanı (monotonic), {anahtar: değer})
+    _passwords = {}     # e-posta -> şifre
 
     def __init__(self, db_manager: DBManager):
         """
@@ -18,16 +29,49 @@ class ConfigManager:
         """
         self.db = db_manager
 
+    def _settings(self) -> dict[str, str]:
+        key = str(self.db.db_path)
+        with self._cache_lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and time.monotonic() - snapshot[0] < constants.CONFIG_CACHE_TTL:
+                return snapshot[1]
+        settings = self.db.get_all_settings()
+        with self._cache_lock:
+            self._snapshots[key] = (time.monotonic(), settings)
+        return settings
+
+    def invalidate(self):
+        """Ayarların bellekteki kopyasını ve önbelleğe alınmış şifreyi atar; sonraki okuma veritabanından yapılır."""
+        with self._cache_lock:
+            self._snapshots.pop(str(self.db.db_path), None)
+            self._passwords.clear()
+
     def get(self, key: str, default: str = None) -> str:
         """
-        Veritabanından belirli bir ayarı okur. Bulunamazsa varsayılan değeri döndürür.
+        Belirli bir ayarı okur. Bulunamazsa varsayılan değeri döndürür.
         """
-        value = self.db.get_setting(key)
+        value = self._settings().get(key)
         return value if value is not None else default
 
+    def get_int(self, key: str, default: int) -> int:
+        """Bir ayarı tamsayı olarak okur. Değer yoksa veya geçersizse varsayılanı döndürür."""
+        try:
+            return int(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: float) -> float:
+        """Bir ayarı ondalıklı sayı olarak okur. Değer yoksa veya geçersizse varsayılanı döndürür."""
+        try:
+            return float(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
     def set(self, key: str, value: str):
         """Veritabanına bir ayar yazar."""
         self.db.set_setting(key, value)
+        with self._cache_lock:
+            self._snapshots.pop(str(self.db.db_path), None)
 
     def set_email_credentials(self, email: str, password: str) -> bool:
         """
@@ -35,9 +79,13 @@ class ConfigManager:
         E-posta adresi veritabanına, şifre ise keyring'e yazılır.
         :return: İşlemin başarılı olup olmadığını belirten boolean.
         """
+        # Kayıt yarıda kalırsa eski şifre önbellekte kalmasın
+        self.forget_email_password()
         try:
             self.set('user_email', email)
             keyring.set_password(constants.SERVICE_ID, email, password)
+            with self._cache_lock:
+                self._passwords[email] = password
             print("E-posta kimlik bilgileri güvenli bir şekilde kaydedildi.")
             return True
         except Exception as e:
@@ -52,8 +100,24 @@ class ConfigManager:
         email = self.get('user_email')
         if not email:
             return None
+        with self._cache_lock:
+            if email in self._passwords:
+                return self._passwords[email]
         try:
-            return keyring.get_password(constants.SERVICE_ID, email)
+            password = keyring.get_password(constants.SERVICE_ID, email)
         except Exception as e:
             print(f"Keyring'den şifre okunurken hata oluştu: {e}")
-            return None
\ No newline at end of file
+            return None
+        if password is not None:
+            # Bulunamayan şifre önbelleğe alınmaz; sonradan kaydedilirse okunabilsin
+            with self._cache_lock:
+                self._passwords[email] = password
+        return password
+
+    def forget_email_password(self):
+        """
+        Önbelleğe alınmış şifreyi atar; sonraki okuma keyring'den yapılır. SMTP kimlik
+        doğrulaması başarısız olduğunda çağrılır (örn. şifre başka bir süreçte değiştirildiyse).
+        """
+        with self._cache_lock:
+            self._passwords.clear()
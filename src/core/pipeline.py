@@ -0,0 +1,271 @@
+# src/core/pipeline.py
+
+import multiprocessing
+import queue
+import threading
+import time
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from ..database.db_manager import DBManager
+from ..core.config_manager import ConfigManager
+from ..core.scheduler import DomainScheduler
+from ..scraping import scraper_factory
+from ..scraping.base_scraper import BaseScraper, parse_page, inspect_page
+from ..scraping.webdriver_pool import WebDriverManager
+from ..scraping.cookie_store import CookieStore
+from ..utils.url_utils import get_host
+from ..utils import constants, metrics
+
+# Aşamalar arası kuyruklarda iş akışının bittiğini bildiren işaret
+_DONE = object()
+
+class CheckPipeline:
+    """
+    Fiyat kontrolünü üç aşamalı bir boru hattı olarak yürütür:
+
+        fetch (iş parçacıkları) -> parse (süreç havuzu) -> persist (tek yazıcı)
+
+    Önceki kontrolden bu yana değişmediği tespit edilen sayfalar (bkz.
+    BaseScraper.fetch) ayrıştırılmadan doğrudan persist aşamasına geçer.
+    Düz HTTP ile çekilen sayfalar fetch aşamasında hiç ayrıştırılmaz; gerekli
+    veri kontrolü, değişiklik özeti ve veri çıkarma parse aşamasında tek
+    geçişte yapılır (bkz. BaseScraper.inspect). Yanıtta veri yoksa sayfa
+    parse iş parçacığında tarayıcıyla yeniden çekilir.
+
+    Aşamalar birbirine sınırlı boyutlu kuyruklarla bağlıdır; yavaş bir
+    ayrıştırma veya SMTP gönderimi tarayıcıları bekletmez, kuyruk dolduğunda
+    ise önceki aşama doğal olarak yavaşlar. Veritabanı yazımları, `db`
+    nesnesinin sahibi olan çağıran iş parçacığında yapılır.
+
+    `on_event` verilirse çalıştırma boyunca şu olaylar (dict) iletilir:
+        {'type': 'run_started', 'total'}
+        {'type': 'started', 'product_id', 'url'}
+        {'type': 'result', 'product_id', 'status', 'price', 'name',
+         'last_check_date', 'duration', 'unchanged', 'page_metrics', 'done', 'total'}
+            'page_metrics': sayfanın aktarılan bayt/istek sayısı/yüklenme süresi
+            ({'bytes', 'requests', 'load_ms'}); ölçülemediyse None.
+        {'type': 'run_finished', 'done', 'total', 'cancelled'}
+    'started' olayları fetch iş parçacıklarından geldiği için fonksiyon iş
+    parçacığı güvenli olmalıdır.
+    """
+
+    def __init__(self, db: DBManager, config: ConfigManager, result_handler,
+                 on_event=None, cancel_event: threading.Event | None = None):
+        """
+        :param result_handler: (product, scraped_data, error, writer, config, fetch_result)
+                               alan, sonucu kalıcı hale getiren ve ürüne yazılan güncellemeyi
+                               döndüren fonksiyon. `writer` yazmaları yalnızca tampona
+                               ekleyen bir WriteBatch'tir (aktarımı boru hattı yapar);
+                               `fetch_result` BaseScraper.fetch'in sonucudur (hata durumunda None).
+        :param on_event: İlerleme olaylarını alan fonksiyon (isteğe bağlı).
+        :param cancel_event: Set edildiğinde yeni ürünlerin çekilmesi durur; çekilmiş
+                             olanlar yine de işlenip kaydedilir.
+        """
+        self.db = db
+        self.config = config
+        self.result_handler = result_handler
+        self.on_event = on_event
+        self.cancel_event = cancel_event
+
+        driver_pool_size = config.get_int('driver_pool_size', constants.DEFAULT_DRIVER_POOL_SIZE)
+        self.fetch_workers = max(1, config.get_int('pipeline_fetch_workers', driver_pool_size))
+        self.parse_workers = max(1, config.get_int('pipeline_parse_workers', constants.DEFAULT_PARSE_WORKERS))
+        self.use_processes = config.get('pipeline_parse_processes', '1') == '1'
+        self.queue_size = max(1, config.get_int('pipeline_queue_size', self.fetch_workers * 2))
+        self.batch_size = config.get_int('db_batch_size', constants.DEFAULT_DB_BATCH_SIZE)
+        # Kuyruk beklemesinin zaman aşımı olarak da kullanılır; 0 veya negatif değer yazıcıyı düşürür
+        self.batch_interval = max(0.05, config.get_float('db_batch_interval', constants.DEFAULT_DB_BATCH_INTERVAL))
+
+        # Tarayıcı profilleri ve site çerezleri çalıştırmalar arasında saklanır
+        persistent_sessions = config.get('persistent_browser_sessions', '1') == '1'
+        WebDriverManager.configure(
+            driver_pool_size,
+            max_pages=config.get_int('driver_max_pages', constants.DEFAULT_DRIVER_MAX_PAGES),
+            max_rss_mb=config.get_float('driver_max_rss_mb', constants.DEFAULT_DRIVER_MAX_RSS_MB),
+            persistent_profiles=persistent_sessions,
+        )
+        CookieStore.configure(persistent_sessions)
+        self.block_profile = config.get('browser_block_profile', constants.DEFAULT_BLOCK_PROFILE)
+        BaseScraper.configure(config.get_float('page_ready_timeout', constants.DEFAULT_PAGE_READY_TIMEOUT),
+                              block_profile=self.block_profile)
+
+    def run(self, products: list[sqlite3.Row]) -> dict:
+        """
+        Verilen ürünlerin hepsi işlenene kadar bloklar.
+        :return: {'total', 'done', 'cancelled'}
+        """
+        if not products:
+            return {'total': 0, 'done': 0, 'cancelled': False}
+        scheduler = DomainScheduler.from_config(products, self.config)
+        # Siteye özel kaynak engelleme profilleri ('browser_block_profile:<host>')
+        BaseScraper.configure(BaseScraper.page_ready_timeout, block_profile_overrides={
+            host: self.config.get(f'browser_block_profile:{host}', self.block_profile)
+            for host in {get_host(product['url']) for product in products}
+        })
+        validators = self.db.get_page_validators([product['id'] for product in products])
+        fetched = queue.Queue(maxsize=self.queue_size)
+        parsed = queue.Queue(maxsize=self.queue_size)
+
+        executor = None
+        if self.use_processes and len(products) > 1:
+            # Süreçler parse iş parçacığından, fetch iş parçacıkları çalışırken başlatılır; fork edilen
+            # çocuk tutulu bir kilidi (örn. stdout) devralıp kilitlenmesin diye 'spawn' kullanılır
+            executor = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+
+        fetchers = [
+            threading.Thread(target=self._fetch_stage, args=(scheduler, validators, fetched),
+                             name=f"fetch-{i}", daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        parsers = [
+            threading.Thread(target=self._parse_stage, args=(validators, fetched, parsed, executor),
+                             name=f"parse-{i}", daemon=True)
+            for i in range(self.parse_workers)
+        ]
+        closer = threading.Thread(target=self._close_stages, args=(fetchers, parsers, fetched, parsed),
+                                  name="pipeline-closer", daemon=True)
+        self._emit({'type': 'run_started', 'total': len(products)})
+        done = 0
+        try:
+            for thread in fetchers + parsers:
+                thread.start()
+            closer.start()
+            done = self._persist_stage(parsed, len(products))
+        finally:
+            closer.join()
+            if executor is not None:
+                executor.shutdown()
+            cancelled = self.cancel_event is not None and self.cancel_event.is_set()
+            self._emit({'type': 'run_finished', 'done': done, 'total': len(products), 'cancelled': cancelled})
+        return {'total': len(products), 'done': done, 'cancelled': cancelled}
+
+    def _emit(self, event: dict):
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event)
+        except Exception as e:
+            print(f"İlerleme olayı iletilemedi: {e}")
+
+    def _next_product(self, scheduler: DomainScheduler):
+        with metrics.timer('rate_limit_wait'):
+            return scheduler.next_item(self.cancel_event)
+
+    def _fetch_stage(self, scheduler: DomainScheduler, validators: dict, fetched: queue.Queue):
+        while (product := self._next_product(scheduler)) is not None:
+            print(f"Kontrol ediliyor: {product['url'][:70]}...")
+            started_at = time.monotonic()
+            self._emit({'type': 'started', 'product_id': product['id'], 'url': product['url']})
+            try:
+                scraper = scraper_factory.get_scraper(product['url'])
+                fetch_result = scraper.fetch(validators.get(product['id']), verify=False)
+                fetched.put((product, started_at, scraper, fetch_result, None))
+            except Exception as e:
+                fetched.put((product, started_at, None, None, e))
+
+    @staticmethod
+    def _run_parse(executor: ProcessPoolExecutor | None, func, *args):
+        with metrics.timer('parse'):
+            if executor is not None:
+                return executor.submit(func, *args).result()
+            return func(*args)
+
+    def _parse_stage(self, validators: dict, fetched: queue.Queue, parsed: queue.Queue,
+                     executor: ProcessPoolExecutor | None):
+        while (item := fetched.get()) is not _DONE:
+            product, started_at, scraper, fetch_result, error = item
+            scraped_data = None
+            if error is None and not fetch_result['unchanged']:
+                previous = validators.get(product['id']) or {}
+                try:
+                    if not fetch_result['verified']:
+                        inspected = self._run_parse(executor, inspect_page, type(scraper), scraper.url,
+                                                    fetch_result['html'], previous.get('digest'))
+                        if inspected is None:
+                            print("  -> HTTP yanıtında veri bulunamadı, tarayıcıya geçiliyor...")
+                            fetch_result = scraper.fetch_browser(previous)
+                        else:
+                            fetch_result = {
+                                **fetch_result,
+                                'unchanged': inspected['unchanged'],
+                                'validators': {**fetch_result['validators'], 'digest': inspected['digest']},
+                                'verified': True,
+                            }
+                            scraped_data = inspected['data']
+                    if scraped_data is None and not fetch_result['unchanged']:
+                        scraped_data = self._run_parse(executor, parse_page, type(scraper), scraper.url,
+                                                       fetch_result['html'])
+                except Exception as e:
+                    error = e
+            parsed.put((product, started_at, fetch_result, scraped_data, error))
+
+    def _persist_stage(self, parsed: queue.Queue, total: int) -> int:
+        """:return: Kaydedilen sonuç sayısı."""
+        done = 0
+        drained = False
+        try:
+            # Sonuçlar tek tek commit edilmek yerine toplu olarak tek işlemde yazılır
+            with self.db.batch(self.batch_size, self.batch_interval) as batch:
+                while True:
+                    try:
+                        item = parsed.get(timeout=self.batch_interval)
+                    except queue.Empty:
+                        self._flush_if_due(batch)
+                        continue
+                    if item is _DONE:
+                        drained = True
+                        break
+                    product, started_at, fetch_result, scraped_data, error = item
+                    update_data = {}
+                    try:
+                        with metrics.timer('persist'):
+                            update_data = self.result_handler(product, scraped_data, error, batch, self.config,
+                                                              fetch_result if error is None else None) or {}
+                    except Exception as e:
+                        # Tek bir sonucun işlenememesi diğer sonuçların kaydını durdurmasın
+                        print(f"  -> Sonuç kaydedilemedi ({product['url'][:70]}): {e}")
+                    done += 1
+                    duration = time.monotonic() - started_at
+                    unchanged = error is None and fetch_result['unchanged']
+                    metrics.observe('check', duration)
+                    metrics.count_result(product['site'], update_data.get('status', 'ERROR'), unchanged)
+                    self._emit({
+                        'type': 'result',
+                        'product_id': product['id'],
+                        'status': update_data.get('status', 'ERROR'),
+                        'price': update_data.get('current_price', product['current_price']),
+                        'name': update_data.get('name', product['name']),
+                        'last_check_date': update_data.get('last_check_date', product['last_check_date']),
+                        'duration': duration,
+                        'unchanged': unchanged,
+                        'page_metrics': fetch_result.get('metrics') if fetch_result else None,
+                        'done': done,
+                        'total': total,
+                    })
+                    # Aktarım sonuçlar arasında yapılır; veritabanı hatası ürünün sonucunu değiştirmez
+                    self._flush_if_due(batch)
+        finally:
+            if not drained:
+                # Yazıcı durursa önceki aşamalar dolu kuyrukta sonsuza kadar bekler ve çalıştırma bitmez
+                while parsed.get() is not _DONE:
+                    pass
+        return done
+
+    @staticmethod
+    def _flush_if_due(batch):
+        try:
+            batch.flush_if_due()
+        except sqlite3.Error:
+            # Hata yazdırıldı, tampon korunuyor; bir sonraki denemede tekrar aktarılır
+            pass
+
+    def _close_stages(self, fetchers, parsers, fetched: queue.Queue, parsed: queue.Queue):
+        """Her aşama bittiğinde bir sonraki aşamaya bitiş işaretini iletir."""
+        for thread in fetchers:
+            thread.join()
+        for _ in parsers:
+            fetched.put(_DONE)
+        for thread in parsers:
+            thread.join()
+        parsed.put(_DONE)
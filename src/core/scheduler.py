@@ -0,0 +1,117 @@
+# src/core/scheduler.py
+
+import threading
+import time
+from collections import deque
+from ..core.config_manager import ConfigManager
+from ..utils.url_utils import get_host
+from ..utils import constants
+
+class TokenBucket:
+    """
+    Klasik token bucket: saniyede `rate` jeton dolar, en fazla `capacity`
+    jeton birikir. Her istek bir jeton harcar.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        if self.rate == float('inf'):
+            # Sınırsız hız (aralık 0): her istek için jeton hazırdır
+            self.tokens = self.capacity
+            self.updated_at = now
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Bir jeton kullanılabilir olana kadar kalan süre (saniye)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float('inf')
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class DomainScheduler:
+    """
+    İşleri host'a göre gruplayıp host'lar arasında sırayla (round-robin) dağıtır.
+    Her host'un kendi token bucket'ı vardır; bir sitenin hız sınırı diğer
+    sitelerin işlerini geciktirmez. Birden fazla iş parçacığı aynı anda
+    `next_item` çağırabilir.
+    """
+
+    def __init__(self, items, bucket_factory, key=None):
+        """
+        :param items: Dağıtılacak işler (örn. ürün satırları).
+        :param bucket_factory: host -> TokenBucket döndüren fonksiyon.
+        :param key: İşten host adını çıkaran fonksiyon. Varsayılan: item['url'] host'u.
+        """
+        key = key or (lambda item: get_host(item['url']))
+        self._queues = {}
+        for item in items:
+            self._queues.setdefault(key(item), deque()).append(item)
+        self._hosts = deque(self._queues)
+        self._buckets = {host: bucket_factory(host) for host in self._queues}
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls, items, config: ConfigManager) -> 'DomainScheduler':
+        """
+        Hız sınırlarını ayarlar tablosundan okuyarak bir zamanlayıcı oluşturur.
+        'rate_limit_interval' / 'rate_limit_burst' tüm siteler için varsayılanı,
+        'rate_limit_interval:<host>' / 'rate_limit_burst:<host>' ise siteye özel değeri belirler.
+        """
+        default_interval = config.get_float('rate_limit_interval', constants.DEFAULT_RATE_LIMIT_INTERVAL)
+        default_burst = config.get_float('rate_limit_burst', constants.DEFAULT_RATE_LIMIT_BURST)
+
+        def bucket_factory(host: str) -> TokenBucket:
+            interval = config.get_float(f'rate_limit_interval:{host}', default_interval)
+            burst = config.get_float(f'rate_limit_burst:{host}', default_burst)
+            rate = 1 / interval if interval > 0 else float('inf')
+            return TokenBucket(rate, burst)
+
+        return cls(items, bucket_factory)
+
+    def remaining(self) -> int:
+        with self._cond:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def next_item(self, stop_event: threading.Event | None = None):
+        """
+        Jetonu hazır olan ilk host'un sıradaki işini döndürür; hiçbir host hazır
+        değilse en erken hazır olacak host'u bekler.
+        :return: Sıradaki iş veya tüm işler bittiyse (ya da durdurulduysa) None.
+        """
+        with self._cond:
+            while self._hosts:
+                if stop_event is not None and stop_event.is_set():
+                    return None
+                now = time.monotonic()
+                shortest_wait = float('inf')
+                for _ in range(len(self._hosts)):
+                    host = self._hosts[0]
+                    self._hosts.rotate(-1)
+                    bucket = self._buckets[host]
+                    wait = bucket.wait_time(now)
+                    if wait > 0:
+                        shortest_wait = min(shortest_wait, wait)
+                        continue
+                    bucket.consume(now)
+                    queue = self._queues[host]
+                    item = queue.popleft()
+                    if not queue:
+                        self._hosts.remove(host)
+                    return item
+                # Durdurma isteğini kaçırmamak için en fazla kısa aralıklarla uyan
+                self._cond.wait(min(shortest_wait, constants.SCHEDULER_MAX_IDLE_WAIT))
+            return None
@@ -2,57 +2,66 @@
 
 from datetime import datetime
 import sqlite3
-from ..scraping.base_scraper import WebDriverManager
-from ..database.db_manager import DBManager
+import threading
+from ..scraping.webdriver_pool import WebDriverManager
+from ..database.db_manager import DBManager, WriteBatch
 from ..core.config_manager import ConfigManager
-from ..scraping import scraper_factory
-from ..notifications import email_sender
+from ..core.pipeline import CheckPipeline
+from ..core import check_policy
+from ..notifications.outbox import OutboxSender
 from ..utils.exceptions import ScraperError
+from ..utils import constants, metrics
+from ..utils.profiling import profile_run
 
-def check_single_product(product: sqlite3.Row, db: DBManager, config: ConfigManager):
+def process_check_result(product: sqlite3.Row, scraped_data: dict | None, error: Exception | None,
+                         db: WriteBatch, config: ConfigManager, fetch_result: dict | None = None):
     """
-    Tek bir ürünün fiyatını kontrol eder, veritabanını günceller ve
-    gerekirse bildirim gönderir.
+    Çekilen veriyi (veya oluşan hatayı) işler: fiyatı karşılaştırır, gerekirse
+    bildirimi gönderilmek üzere kuyruğa ekler ve veritabanını günceller. Yazmalar
+    WriteBatch'e eklenir; aktarımı CheckPipeline yapar.
+    :param fetch_result: BaseScraper.fetch sonucu. Sayfa değişmemişse ürünün kayıtlı
+                         fiyatı kullanılır; fiyat geçmişine yeni kayıt eklenmez.
+    Sonuca göre ürünün bir sonraki kontrol zamanı da (next_check_at) hesaplanır.
+    :return: Ürüne yazılan güncelleme ({'status': ..., 'current_price': ...}).
     """
-    print(f"Kontrol ediliyor: {product['url'][:70]}...")
     update_data = {
         'last_check_date': datetime.now().isoformat()
     }
+    unchanged = bool(fetch_result and fetch_result['unchanged'])
+    if unchanged and product['current_price'] is None:
+        # Kayıtlı fiyat yoksa değişmemiş sayfadan çıkarılacak bir sonuç da yoktur
+        unchanged = False
+        error = error or ScraperError("Sayfa değişmemiş ancak kayıtlı fiyat bulunamadı.")
 
     try:
-        # 1. Scraper'ı al ve veriyi çek
-        scraper = scraper_factory.get_scraper(product['url'])
-        scraped_data = scraper.scrape()
-        current_price = scraped_data['price']
+        if error is not None:
+            raise error
+        if unchanged:
+            print("  -> Sayfa son kontrolden beri değişmemiş.")
+            current_price = product['current_price']
+        else:
+            current_price = scraped_data['price']
+
+            # YENİ EKLENEN SATIR: Fiyat geçmişini kaydet
+            if current_price > 0:
+                db.add_price_history(product['id'], current_price)
 
-        # YENİ EKLENEN SATIR: Fiyat geçmişini kaydet
-        if current_price > 0:
-            db.add_price_history(product['id'], current_price)
+            # Ürün adı ilk kez çekiliyorsa veya değişmişse güncelle
+            if product['name'] is None or product['name'] != scraped_data['name']:
+                update_data['name'] = scraped_data['name']
+
+            update_data['current_price'] = current_price
+        if fetch_result and fetch_result['validators']:
+            db.set_page_validators(product['id'], fetch_result['validators'])
 
-        # Ürün adı ilk kez çekiliyorsa veya değişmişse güncelle
-        if product['name'] is None or product['name'] != scraped_data['name']:
-            update_data['name'] = scraped_data['name']
-        
-        update_data['current_price'] = current_price
-        
         # 2. Fiyatı karşılaştır (Bu kısım aynı kalıyor)
         if current_price > 0 and current_price <= product['target_price']:
             print(f"  -> FİYAT DÜŞTÜ! Yeni Fiyat: {current_price} TL")
             update_data['status'] = 'PRICE_ALERT'
-            
-            # 3. Bildirim gönder
-            user_email = config.get('user_email')
-            password = config.get_email_password()
-            smtp_host = config.get('smtp_host', 'smtp.gmail.com')
-            smtp_port = int(config.get('smtp_port', 587))
-            
-            if email_sender.send_price_alert_email(
-                sender_email=user_email, password=password, recipient_email=user_email,
-                smtp_host=smtp_host, smtp_port=smtp_port,
-                product_name=scraped_data['name'], new_price=current_price, product_url=product['url']
-            ):
-                # E-posta başarıyla gönderilirse, tekrar bildirim gitmemesi için takibi pasif yap
-                update_data['is_active'] = 0
+
+            # 3. Bildirimi kuyruğa ekle; gönderimi OutboxSender yapar ve gönderilince takibi pasif yapar
+            db.enqueue_notification(
+                product['id'], product['name'] if unchanged else scraped_data['name'], product['url'], current_price)
         else:
             print(f"  -> Fiyat hala yüksek: {current_price} TL")
             update_data['status'] = 'TRACKING'
@@ -63,32 +72,107 @@ def check_single_product(product: sqlite3.Row, db: DBManager, config: ConfigMana
     except Exception as e:
         print(f"  -> GENEL HATA: {e}")
         update_data['status'] = 'ERROR'
-    
+
     finally:
+        if update_data.get('status') == 'ERROR':
+            # Hatalı sonuçtan sonra sayfa bir sonraki kontrolde baştan işlensin
+            db.clear_page_validators(product['id'])
+        update_data.update(check_policy.plan_next_check(product, update_data, config))
         # 4. Veritabanını her durumda güncelle
         db.update_product(product['id'], update_data)
+    return update_data
+
+def run_product_checks(products: list[sqlite3.Row], db: DBManager, config: ConfigManager,
+                       on_event=None, cancel_event: threading.Event | None = None):
+    """
+    Ürünleri fetch -> parse -> persist boru hattından geçirerek kontrol eder.
+    Aşama eşzamanlılıkları ayarlardan okunur ('pipeline_fetch_workers',
+    'pipeline_parse_workers', 'pipeline_parse_processes', 'pipeline_queue_size').
+    :param on_event: Her ürün için ilerleme olaylarını (dict) alan, iş parçacığı
+                     güvenli bir fonksiyon (örn. queue.Queue.put). Bkz. CheckPipeline.
+    :param cancel_event: Set edildiğinde yeni ürün kontrolüne başlanmaz.
+    Çalıştırmanın aşama süreleri ve site/durum sayaçları 'check_runs' tablosuna,
+    'metrics_textfile_path' ayarlanmışsa Prometheus metin dosyasına da yazılır.
+    """
+    run = {'total': len(products), 'done': 0, 'cancelled': False}
+    with metrics.collect() as run_metrics:
+        # Alarmlar kontrol sırasında kuyruğa yazılır ve ayrı bir iş parçacığında gönderilir
+        outbox = OutboxSender(db, config)
+        outbox.start()
+        try:
+            run = CheckPipeline(db, config, process_check_result, on_event, cancel_event).run(products)
+        finally:
+            outbox.stop()
+            _record_run_metrics(db, config, run_metrics.summary(), run)
+    # Yeni fiyat kayıtlarını özetlere aktar ve eski ham kayıtları temizle
+    db.maintain_price_history(
+        raw_days=config.get_int('history_raw_retention_days', constants.DEFAULT_HISTORY_RAW_RETENTION_DAYS),
+        hourly_days=config.get_int('history_hourly_retention_days', constants.DEFAULT_HISTORY_HOURLY_RETENTION_DAYS),
+        check_runs_days=config.get_int('check_runs_retention_days', constants.DEFAULT_CHECK_RUNS_RETENTION_DAYS),
+    )
 
-# src/core/tracker.py dosyasının en altına eklenecek YENİ fonksiyon
+def _record_run_metrics(db: DBManager, config: ConfigManager, summary: dict, run: dict):
+    """Çalıştırma özetini kaydeder; ölçüm hataları kontrol sonucunu etkilemez."""
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(summary['statuses'].items()))
+    print(f"Kontrol çalıştırması {summary['duration']:.1f} sn sürdü ({run['done']}/{run['total']}; {statuses or '-'}).")
+    try:
+        db.add_check_run(summary, run)
+    except sqlite3.Error as e:
+        print(f"Çalıştırma ölçümleri kaydedilemedi: {e}")
+    textfile_path = config.get('metrics_textfile_path', '')
+    if textfile_path:
+        try:
+            metrics.write_prometheus_textfile(textfile_path, summary, run)
+        except OSError as e:
+            print(f"Prometheus metin dosyası yazılamadı: {e}")
 
+def profile_run_from_config(config: ConfigManager, force: bool = False, output_root: str | None = None,
+                            label: str = "run"):
+    """
+    'profile_runs' ayarı '1' ise (veya `force`) çalıştırmayı profilleyen bağlam
+    yöneticisini döndürür. Çıktı dizini ve özet uzunluğu ayarlardan okunur.
+    """
+    return profile_run(
+        force or config.get('profile_runs', '0') == '1',
+        output_root or config.get('profile_output_dir') or None,
+        config.get_int('profile_top_n', constants.DEFAULT_PROFILE_TOP_N),
+        label,
+    )
 
-def run_all_active_product_checks():
+def run_all_active_product_checks(on_event=None, cancel_event: threading.Event | None = None):
+    """
+    Zamanlamasından (next_check_at) bağımsız olarak tüm aktif ürünleri kontrol eder.
+    GUI gibi uzun süre çalışan çağıranlar `on_event` ile ürün bazında ilerleme
+    alabilir ve `cancel_event` ile çalıştırmayı yarıda durdurabilir.
+    Başka bir süreç kontrol çalıştırıyorsa hiçbir ürün kontrol edilmez ve
+    `on_event`'e {'type': 'run_skipped', 'reason': 'locked'} iletilir.
+    """
     db = None
+    run_lock = None
     try:
         print("Thread-uyumlu kontrol işlemi başlatılıyor...")
         db = DBManager()
+        run_lock = db.run_lock()
+        if not run_lock.acquire():
+            print("Başka bir fiyat kontrolü zaten çalışıyor, bu çalıştırma atlandı.")
+            if on_event is not None:
+                on_event({'type': 'run_skipped', 'reason': 'locked'})
+            return
         config = ConfigManager(db)
         products_to_check = db.get_active_products_for_check()
         if not products_to_check:
             print("Kontrol edilecek aktif ürün bulunamadı.")
             return
 
-        for product in products_to_check:
-            check_single_product(product, db, config)
+        with profile_run_from_config(config, label="all"):
+            run_product_checks(products_to_check, db, config, on_event, cancel_event)
     except Exception as e:
         print(f"run_all_active_product_checks içinde hata oluştu: {e}")
     finally:
+        if run_lock:
+            run_lock.release()
         if db:
             db.close()
-        # İŞLEM BİTTİĞİNDE TARAYICIYI KAPAT
-        WebDriverManager.close_driver() 
-        print("Thread-uyumlu kontrol işlemi bitti, kaynaklar serbest bırakıldı.")
\ No newline at end of file
+        # İŞLEM BİTTİĞİNDE TARAYICILARI KAPAT
+        WebDriverManager.close_all()
+        print("Thread-uyumlu kontrol işlemi bitti, kaynaklar serbest bırakıldı.")
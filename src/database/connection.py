@@ -0,0 +1,69 @@
+# src/database/connection.py
+
+import sqlite3
+import threading
+from pathlib import Path
+from ..utils import constants
+from ..utils.file_lock import FileLock
+
+class ConnectionProvider:
+    """
+    Bir veritabanı dosyası için iş parçacığı başına bir SQLite bağlantısı sağlar.
+    Bağlantılar WAL modunda açılır: okuyucular yazıcıyı, yazıcı da okuyucuları
+    bloklamaz. Kilitlenme durumunda hemen hata vermek yerine `busy_timeout`
+    kadar beklenir. Aynı dosya için süreç boyunca tek bir sağlayıcı kullanılır.
+    """
+    _providers = {}
+    _providers_lock = threading.Lock()
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+        self.schema_ready = False
+        self._local = threading.local()
+
+    @classmethod
+    def for_path(cls, db_path: Path) -> 'ConnectionProvider':
+        key = str(Path(db_path).resolve())
+        with cls._providers_lock:
+            if key not in cls._providers:
+                cls._providers[key] = cls(db_path)
+            return cls._providers[key]
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Çağıran iş parçacığına ait bağlantıyı döndürür; yoksa açar."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=constants.DB_BUSY_TIMEOUT_MS / 1000)
+        # Sütunlara isimleriyle erişim imkanı sağlar (örn: row['name'])
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA busy_timeout = {constants.DB_BUSY_TIMEOUT_MS}")
+        # WAL ile NORMAL güvenlidir: çökme sonrası veritabanı bozulmaz, sadece son işlem kaybolabilir
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{constants.DB_CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def close_connection(self):
+        """Çağıran iş parçacığının bağlantısını kapatır."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RunLock(FileLock):
+    """
+    Aynı veritabanı üzerinde iki fiyat kontrolünün (GUI, cron veya daemon)
+    aynı anda çalışmasını engelleyen, süreçler arası dosya kilidi.
+    Kilit, süreç sonlandığında işletim sistemi tarafından otomatik bırakılır.
+    """
+
+    def __init__(self, db_path: Path):
+        super().__init__(Path(f"{db_path}.run.lock"))
@@ -1,14 +1,21 @@
 # src/database/db_manager.py
 
+import json
 import sqlite3
+import time
 from pathlib import Path
-from datetime import datetime
-from ..utils import constants
+from datetime import datetime, timedelta
+from . import migrations
+from .connection import ConnectionProvider, RunLock
+from ..utils import constants, metrics
 
 class DBManager:
     """
     SQLite veritabanı ile ilgili tüm işlemleri yöneten sınıf.
     (CRUD: Create, Read, Update, Delete)
+
+    Bağlantılar ConnectionProvider üzerinden iş parçacığı başına açılır; aynı
+    DBManager nesnesi farklı iş parçacıklarından güvenle kullanılabilir.
     """
 
     def __init__(self, db_name=constants.DB_NAME):
@@ -17,31 +24,38 @@ class DBManager:
         """
         # Projenin ana dizininde veritabanı dosyasını oluşturur
         self.db_path = Path(__file__).parent.parent.parent / db_name
-        self.conn = None
+        self.provider = ConnectionProvider.for_path(self.db_path)
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            # Sütunlara isimleriyle erişim imkanı sağlar (örn: row['name'])
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
             self.setup_database()
         except sqlite3.Error as e:
             print(f"Veritabanı hatası: {e}")
             raise
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Çağıran iş parçacığına ait bağlantı."""
+        return self.provider.get_connection()
+
+    def run_lock(self) -> RunLock:
+        """Bu veritabanı için süreçler arası kontrol çalıştırma kilidini döndürür."""
+        return RunLock(self.db_path)
+
     def setup_database(self):
         """
-        schema.sql dosyasını okur ve veritabanı şemasını (tabloları) oluşturur.
+        Veritabanı şemasını sürüm numarasına (PRAGMA user_version) göre günceller.
+        Şema zaten güncelse hiçbir dosya okunmaz ve hiçbir SQL çalıştırılmaz.
+        Kontrol, süreç başına yalnızca bir kez yapılır.
         """
-        try:
-            schema_path = Path(__file__).parent / "schema.sql"
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                sql_script = f.read()
-            self.cursor.executescript(sql_script)
-            self.conn.commit()
-        except FileNotFoundError:
-            print(f"HATA: '{schema_path}' bulunamadı. Tablolar oluşturulamadı.")
-        except sqlite3.Error as e:
-            print(f"Veritabanı kurulum hatası: {e}")
+        with self.provider.lock:
+            if self.provider.schema_ready:
+                return
+            try:
+                migrations.migrate(self.conn)
+                self.provider.schema_ready = True
+            except FileNotFoundError as e:
+                print(f"HATA: '{e.filename}' bulunamadı. Tablolar oluşturulamadı.")
+            except sqlite3.Error as e:
+                print(f"Veritabanı kurulum hatası: {e}")
 
     # --- Ürün Fonksiyonları ---
 
@@ -56,9 +70,9 @@ class DBManager:
         """
         try:
             added_date = datetime.now().isoformat()
-            self.cursor.execute(sql, (url, target_price, site, added_date, 'PENDING'))
+            cursor = self.conn.execute(sql, (url, target_price, site, added_date, 'PENDING'))
             self.conn.commit()
-            return self.cursor.lastrowid
+            return cursor.lastrowid
         except sqlite3.IntegrityError:
             print(f"Hata: Bu URL ({url}) zaten takip ediliyor.")
             return None
@@ -77,73 +91,516 @@ class DBManager:
         values.append(product_id)
 
         sql = f"UPDATE products SET {fields} WHERE id = ?"
-        self.cursor.execute(sql, values)
+        self.conn.execute(sql, values)
         self.conn.commit()
 
+    # Ürüne bağlı tablolar. PRAGMA foreign_keys açık olmadığı için ON DELETE CASCADE
+    # çalışmaz; ürün silinirken bu satırlar aynı işlemde elle silinir.
+    _PRODUCT_CHILD_TABLES = ("price_history", "price_history_hourly", "price_history_daily",
+                             "page_validators", "notification_outbox")
+
     def delete_product(self, product_id: int):
-        """Bir ürünü ID'sine göre siler."""
-        sql = "DELETE FROM products WHERE id = ?"
-        self.cursor.execute(sql, (product_id,))
-        self.conn.commit()
+        """Bir ürünü ve ona bağlı geçmiş, doğrulayıcı ve bekleyen bildirim kayıtlarını siler."""
+        try:
+            for table in self._PRODUCT_CHILD_TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE product_id = ?", (product_id,))
+            self.conn.execute("DELETE FROM products WHERE id = ?", (product_id,))
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
 
     def get_all_products(self) -> list[sqlite3.Row]:
         """Tüm ürünleri listeler."""
         sql = "SELECT * FROM products ORDER BY added_date DESC"
-        self.cursor.execute(sql)
-        return self.cursor.fetchall()
+        return self.conn.execute(sql).fetchall()
+
+    def get_products_changed_since(self, since: str | None) -> list[sqlite3.Row]:
+        """
+        'updated_at' değeri verilen zamandan yeni veya ona eşit olan ürünleri listeler.
+        :param since: Önceki çağrıda görülen en büyük 'updated_at'; None ise tüm ürünler.
+        """
+        if since is None:
+            return self.get_all_products()
+        sql = "SELECT * FROM products WHERE updated_at >= ? ORDER BY added_date DESC"
+        return self.conn.execute(sql, (since,)).fetchall()
+
+    def get_product_ids(self) -> set[int]:
+        """Tüm ürünlerin ID'lerini döndürür (silinen ürünleri tespit etmek için)."""
+        return {row[0] for row in self.conn.execute("SELECT id FROM products")}
 
     def get_active_products_for_check(self) -> list[sqlite3.Row]:
         """Sadece takibi aktif olan ürünleri listeler."""
         sql = "SELECT * FROM products WHERE is_active = 1"
-        self.cursor.execute(sql)
-        return self.cursor.fetchall()
+        return self.conn.execute(sql).fetchall()
+
+    def get_due_products(self, now: datetime | None = None, per_site_limit: int = 0) -> list[sqlite3.Row]:
+        """
+        Kontrol zamanı gelmiş aktif ürünleri, en çok gecikenden başlayarak listeler.
+        Hiç zamanlanmamış ürünler (yeni veya düzenlenmiş) her zaman önce gelir.
+        :param per_site_limit: 0'dan büyükse her siteden en fazla bu kadar ürün döndürülür.
+        """
+        now = (now or datetime.now()).isoformat()
+        if per_site_limit <= 0:
+            sql = """
+                SELECT * FROM products
+                WHERE is_active = 1 AND (next_check_at IS NULL OR next_check_at <= ?)
+                ORDER BY next_check_at ASC
+            """
+            return self.conn.execute(sql, (now,)).fetchall()
+        sql = """
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY site ORDER BY next_check_at ASC) AS site_rank
+                FROM products
+                WHERE is_active = 1 AND (next_check_at IS NULL OR next_check_at <= ?)
+            )
+            WHERE site_rank <= ?
+            ORDER BY next_check_at ASC
+        """
+        return self.conn.execute(sql, (now, per_site_limit)).fetchall()
+
+    def get_next_check_time(self) -> datetime | None:
+        """
+        Aktif ürünler arasındaki en yakın kontrol zamanını döndürür. Zamanlanmamış
+        bir ürün varsa şimdiki zaman, aktif ürün yoksa None döner.
+        """
+        sql = """
+            SELECT COUNT(*) AS total, COUNT(next_check_at) AS scheduled, MIN(next_check_at) AS earliest
+            FROM products WHERE is_active = 1
+        """
+        row = self.conn.execute(sql).fetchone()
+        if not row['total']:
+            return None
+        if row['scheduled'] < row['total']:
+            return datetime.now()
+        return datetime.fromisoformat(row['earliest'])
 
     def get_product_by_id(self, product_id: int) -> sqlite3.Row | None:
         """Tek bir ürünü ID'sine göre getirir."""
         sql = "SELECT * FROM products WHERE id = ?"
-        self.cursor.execute(sql, (product_id,))
-        return self.cursor.fetchone()
+        return self.conn.execute(sql, (product_id,)).fetchone()
 
     # --- Ayar Fonksiyonları ---
 
     def get_setting(self, key: str) -> str | None:
         """Ayarlar tablosundan bir değeri okur."""
         sql = "SELECT value FROM settings WHERE key = ?"
-        self.cursor.execute(sql, (key,))
-        row = self.cursor.fetchone()
+        row = self.conn.execute(sql, (key,)).fetchone()
         return row['value'] if row else None
 
+    def get_all_settings(self) -> dict[str, str]:
+        """Tüm ayarları tek sorguyla {anahtar: değer} olarak döndürür."""
+        return {row['key']: row['value'] for row in self.conn.execute("SELECT key, value FROM settings")}
+
     def set_setting(self, key: str, value: str):
         """Ayarlar tablosuna bir değeri yazar veya günceller."""
         sql = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
-        self.cursor.execute(sql, (key, value))
+        self.conn.execute(sql, (key, value))
         self.conn.commit()
 
     def close(self):
-        """Veritabanı bağlantısını güvenli bir şekilde kapatır."""
-        if self.conn:
-            self.conn.close()
+        """Çağıran iş parçacığının veritabanı bağlantısını güvenli bir şekilde kapatır."""
+        self.provider.close_connection()
+
+    def get_price_history(self, product_id: int, since: datetime | None = None,
+                          until: datetime | None = None) -> list[sqlite3.Row]:
+        """
+        Bir ürünün fiyat geçmişini eskiden yeniye sıralı getirir. İstenen zaman
+        aralığına göre uygun çözünürlük seçilir: kısa aralıklarda ham kayıtlar,
+        daha uzunlarda saatlik, çok uzunlarda günlük özetler.
+        Her satırda en az 'price' ve 'check_date' bulunur; özet satırlarında 'price'
+        ortalama fiyattır ve ek olarak min/max/last/sample_count sütunları vardır.
+        """
+        until = until or datetime.now()
+        if since is None:
+            oldest = self._get_oldest_history_date(product_id)
+            if oldest is None:
+                return []
+            since = datetime.fromisoformat(oldest)
+        span = until - since
 
-    def __del__(self):
-        """Nesne silindiğinde bağlantının kapandığından emin olur."""
-        self.close()
+        # Ham kayıtlar saklama süresini aşmışsa, o aralık için artık özetler kullanılmalı
+        raw_cutoff = until - timedelta(days=self._get_int_setting(
+            'history_raw_retention_days', constants.DEFAULT_HISTORY_RAW_RETENTION_DAYS))
+        hourly_cutoff = until - timedelta(days=self._get_int_setting(
+            'history_hourly_retention_days', constants.DEFAULT_HISTORY_HOURLY_RETENTION_DAYS))
 
-    def add_price_history(self, product_id: int, price: float):
+        params = (product_id, since.isoformat(), until.isoformat())
+        if span <= constants.HISTORY_RAW_MAX_SPAN and since >= raw_cutoff:
+            sql = """
+                SELECT price, check_date FROM price_history
+                WHERE product_id = ? AND check_date >= ? AND check_date <= ?
+                ORDER BY check_date ASC
+            """
+            return self.conn.execute(sql, params).fetchall()
+
+        table = "price_history_hourly"
+        if span > constants.HISTORY_HOURLY_MAX_SPAN or since < hourly_cutoff:
+            table = "price_history_daily"
+        sql = f"""
+            SELECT avg_price AS price, bucket_start AS check_date,
+                   min_price, max_price, last_price, sample_count
+            FROM {table}
+            WHERE product_id = ? AND bucket_start >= ? AND bucket_start <= ?
+            ORDER BY bucket_start ASC
         """
-        Bir ürün için yeni bir fiyat kaydı ekler.
+        # Aralığın başındaki kısmi kovayı da dahil etmek için başlangıcı kova başına yuvarla
+        bucket_since = since.replace(minute=0, second=0, microsecond=0)
+        if table == "price_history_daily":
+            bucket_since = bucket_since.replace(hour=0)
+        return self.conn.execute(sql, (product_id, bucket_since.isoformat(), until.isoformat())).fetchall()
+
+    def _get_oldest_history_date(self, product_id: int) -> str | None:
+        sql = """
+            SELECT MIN(d) FROM (
+                SELECT MIN(check_date) AS d FROM price_history WHERE product_id = ?
+                UNION ALL SELECT MIN(bucket_start) FROM price_history_hourly WHERE product_id = ?
+                UNION ALL SELECT MIN(bucket_start) FROM price_history_daily WHERE product_id = ?
+            )
         """
-        sql = "INSERT INTO price_history (product_id, price, check_date) VALUES (?, ?, ?)"
-        check_date = datetime.now().isoformat()
+        return self.conn.execute(sql, (product_id, product_id, product_id)).fetchone()[0]
+
+    def _get_int_setting(self, key: str, default: int) -> int:
         try:
-            self.cursor.execute(sql, (product_id, price, check_date))
-            self.conn.commit()
+            return int(self.get_setting(key) or default)
+        except ValueError:
+            return default
+
+    # --- Fiyat Geçmişi Özetleri ve Saklama ---
+
+    def rollup_price_history(self):
+        """
+        Son özetlemeden bu yana eklenen ham kayıtları saatlik, saatlik özetleri de
+        günlük özetlere aktarır. Yalnızca etkilenen kovalar yeniden hesaplanır.
+        """
+        watermark = self.get_setting('history_rollup_watermark') or ''
+        hour_start = watermark[:13]
+        day_start = watermark[:10]
+        latest = self.conn.execute("SELECT MAX(check_date) FROM price_history").fetchone()[0]
+        if latest is None or latest <= watermark:
+            return
+
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO price_history_hourly
+                    (product_id, bucket_start, min_price, max_price, avg_price, last_price, sample_count)
+                SELECT product_id, bucket, MIN(price), MAX(price), AVG(price), MAX(last_price), COUNT(*)
+                FROM (
+                    SELECT product_id, price, substr(check_date, 1, 13) || ':00:00' AS bucket,
+                           FIRST_VALUE(price) OVER (
+                               PARTITION BY product_id, substr(check_date, 1, 13)
+                               ORDER BY check_date DESC
+                           ) AS last_price
+                    FROM price_history
+                    WHERE check_date >= ?
+                )
+                GROUP BY product_id, bucket
+            """, (hour_start,))
+            self.conn.execute("""
+                INSERT OR REPLACE INTO price_history_daily
+                    (product_id, bucket_start, min_price, max_price, avg_price, last_price, sample_count)
+                SELECT product_id, bucket, MIN(min_price), MAX(max_price),
+                       SUM(avg_price * sample_count) / SUM(sample_count), MAX(last_price), SUM(sample_count)
+                FROM (
+                    SELECT product_id, min_price, max_price, avg_price, sample_count,
+                           substr(bucket_start, 1, 10) || 'T00:00:00' AS bucket,
+                           FIRST_VALUE(last_price) OVER (
+                               PARTITION BY product_id, substr(bucket_start, 1, 10)
+                               ORDER BY bucket_start DESC
+                           ) AS last_price
+                    FROM price_history_hourly
+                    WHERE bucket_start >= ?
+                )
+                GROUP BY product_id, bucket
+            """, (day_start,))
+            self.conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('history_rollup_watermark', ?)",
+                              (latest,))
+
+    def apply_history_retention(self, raw_days: int, hourly_days: int):
+        """
+        Saklama süresini aşmış ham ve saatlik kayıtları siler. Henüz özetlenmemiş
+        ham kayıtlara asla dokunulmaz; günlük özetler süresiz saklanır.
+        """
+        now = datetime.now()
+        watermark = self.get_setting('history_rollup_watermark') or ''
+        # Özetleme, filigranın bulunduğu saatin başından itibaren ham kayıtları yeniden okur
+        raw_cutoff = min((now - timedelta(days=raw_days)).isoformat(), watermark[:13])
+        hourly_cutoff = min((now - timedelta(days=hourly_days)).isoformat(), watermark[:10])
+        with self.conn:
+            self.conn.execute("DELETE FROM price_history WHERE check_date < ?", (raw_cutoff,))
+            self.conn.execute("DELETE FROM price_history_hourly WHERE bucket_start < ?", (hourly_cutoff,))
+
+    def maintain_price_history(self, raw_days: int = constants.DEFAULT_HISTORY_RAW_RETENTION_DAYS,
+                               hourly_days: int = constants.DEFAULT_HISTORY_HOURLY_RETENTION_DAYS,
+                               check_runs_days: int = constants.DEFAULT_CHECK_RUNS_RETENTION_DAYS):
+        """
+        Özetleri günceller ve ardından saklama politikasını uygular. Süresi dolmuş
+        kontrol çalıştırması ölçümleri (check_runs) de silinir.
+        """
+        try:
+            self.rollup_price_history()
+            self.apply_history_retention(raw_days, hourly_days)
+            cutoff = (datetime.now() - timedelta(days=check_runs_days)).isoformat()
+            with self.conn:
+                self.conn.execute("DELETE FROM check_runs WHERE started_at < ?", (cutoff,))
         except sqlite3.Error as e:
-            print(f"Fiyat geçmişi eklenirken hata oluştu: {e}")
+            print(f"Fiyat geçmişi bakımı sırasında hata oluştu: {e}")
 
-    def get_price_history(self, product_id: int) -> list[sqlite3.Row]:
+    # --- Sayfa Doğrulayıcıları ---
+
+    def get_page_validators(self, product_ids: list[int] | None = None) -> dict[int, dict]:
         """
-        Belirli bir ürünün tüm fiyat geçmişini, eskiden yeniye doğru sıralı şekilde getirir.
+        Son başarılı kontrolde kaydedilen sayfa doğrulayıcılarını getirir.
+        :param product_ids: Yalnızca bu ürünler; None ise hepsi.
+        :return: {product_id: {'etag', 'last_modified', 'digest'}}
         """
-        sql = "SELECT price, check_date FROM price_history WHERE product_id = ? ORDER BY check_date ASC"
-        self.cursor.execute(sql, (product_id,))
-        return self.cursor.fetchall()    
\ No newline at end of file
+        sql = "SELECT product_id, etag, last_modified, digest FROM page_validators"
+        if product_ids is None:
+            rows = self.conn.execute(sql).fetchall()
+        else:
+            rows = []
+            product_ids = list(product_ids)
+            for start in range(0, len(product_ids), constants.DB_MAX_IN_PARAMS):
+                chunk = product_ids[start:start + constants.DB_MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(self.conn.execute(f"{sql} WHERE product_id IN ({placeholders})", chunk).fetchall())
+        return {
+            row['product_id']: {'etag': row['etag'], 'last_modified': row['last_modified'], 'digest': row['digest']}
+            for row in rows
+        }
+
+    def clear_page_validators(self, product_id: int):
+        """Bir ürünün sayfa doğrulayıcılarını siler (sonraki kontrolde sayfa tamamen işlenir)."""
+        self.conn.execute("DELETE FROM page_validators WHERE product_id = ?", (product_id,))
+        self.conn.commit()
+
+    # --- Bildirim Kuyruğu (Outbox) ---
+
+    _ENQUEUE_NOTIFICATION_SQL = """
+        INSERT INTO notification_outbox (product_id, product_name, product_url, price, created_at)
+        SELECT ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM notification_outbox WHERE product_id = ? AND sent_at IS NULL AND attempts < ?
+        )
+    """
+
+    def enqueue_notification(self, product_id: int, product_name: str, product_url: str, price: float):
+        """
+        Fiyat alarmını gönderilmek üzere kuyruğa ekler. Ürün için henüz gönderilmemiş
+        bir alarm varsa yenisi eklenmez; deneme sınırını aşmış (vazgeçilmiş) alarmlar
+        yeni alarmı engellemez.
+        """
+        self.conn.execute(self._ENQUEUE_NOTIFICATION_SQL,
+                          WriteBatch._notification_row(product_id, product_name, product_url, price))
+        self.conn.commit()
+
+    def get_pending_notifications(self, max_attempts: int) -> list[sqlite3.Row]:
+        """Gönderilmemiş ve deneme sınırına ulaşmamış alarmları eskiden yeniye listeler."""
+        sql = """
+            SELECT * FROM notification_outbox
+            WHERE sent_at IS NULL AND attempts < ?
+            ORDER BY id ASC
+        """
+        return self.conn.execute(sql, (max_attempts,)).fetchall()
+
+    def mark_notifications_sent(self, notification_ids: list[int]):
+        """
+        Alarmları gönderildi olarak işaretler ve tekrar bildirim gitmemesi için
+        ilgili ürünlerin takibini pasif yapar.
+        """
+        if not notification_ids:
+            return
+        sent_at = datetime.now().isoformat()
+        rows = [(notification_id,) for notification_id in notification_ids]
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE products SET is_active = 0 WHERE id = (SELECT product_id FROM notification_outbox WHERE id = ?)",
+                rows,
+            )
+            self.conn.executemany(
+                "UPDATE notification_outbox SET sent_at = ?, attempts = attempts + 1, last_error = NULL WHERE id = ?",
+                [(sent_at, notification_id) for notification_id in notification_ids],
+            )
+
+    def mark_notifications_failed(self, notification_ids: list[int], error: str):
+        """Başarısız gönderim denemesini kaydeder; alarm bir sonraki boşaltmada tekrar denenir."""
+        if not notification_ids:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE notification_outbox SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                [(error, notification_id) for notification_id in notification_ids],
+            )
+
+    # --- Çalıştırma Ölçümleri ---
+
+    def add_check_run(self, summary: dict, run: dict) -> int:
+        """
+        Bir kontrol çalıştırmasının özetini kaydeder.
+        :param summary: metrics.RunMetrics.summary() sonucu.
+        :param run: {'total', 'done', 'cancelled'}
+        :return: Eklenen kaydın ID'si.
+        """
+        sql = """
+            INSERT INTO check_runs (started_at, finished_at, duration, total, done, cancelled,
+                                    tracking, price_alert, error, unchanged, stats_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        statuses = summary['statuses']
+        stats = {'stages': summary['stages'], 'results': summary['results']}
+        with self.conn:
+            cursor = self.conn.execute(sql, (
+                summary['started_at'], summary['finished_at'], summary['duration'],
+                run['total'], run['done'], int(run['cancelled']),
+                statuses.get('TRACKING', 0), statuses.get('PRICE_ALERT', 0), statuses.get('ERROR', 0),
+                summary['unchanged'], json.dumps(stats, ensure_ascii=False),
+            ))
+        return cursor.lastrowid
+
+    def get_recent_check_runs(self, limit: int = 20) -> list[sqlite3.Row]:
+        """Son kontrol çalıştırmalarını yeniden eskiye listeler."""
+        sql = "SELECT * FROM check_runs ORDER BY started_at DESC LIMIT ?"
+        return self.conn.execute(sql, (limit,)).fetchall()
+
+    # --- Toplu Yazma Fonksiyonları ---
+
+    def batch(self, max_items: int = constants.DEFAULT_DB_BATCH_SIZE,
+              max_age: float = constants.DEFAULT_DB_BATCH_INTERVAL) -> 'WriteBatch':
+        """
+        Fiyat geçmişi eklemelerini ve ürün güncellemelerini biriktirip tek bir
+        işlemde (transaction) yazan bir WriteBatch döndürür.
+        Kullanım: `with db.batch() as batch: batch.update_product(...)`
+        """
+        return WriteBatch(self, max_items, max_age)
+
+
+class WriteBatch:
+    """
+    DBManager için unit-of-work: yazma işlemlerini bellekte biriktirir ve her
+    `max_items` kayıtta veya `max_age` saniyede bir, `executemany` ile tek bir
+    işlemde veritabanına aktarır. Her aktarım atomiktir; süreç yarıda kesilirse
+    ya aktarımın tamamı ya da hiçbiri diske yazılmış olur.
+
+    Yazma metotları yalnızca tampona ekler, hiçbir zaman veritabanına yazmaz;
+    aktarım sahibinin çağırdığı flush_if_due()/flush() ile yapılır.
+    """
+
+    def __init__(self, db: DBManager, max_items: int, max_age: float):
+        self.db = db
+        self.max_items = max(1, max_items)
+        self.max_age = max_age
+        self._history = []          # (product_id, price, check_date)
+        self._updates = {}          # product_id -> {'sütun': değer}
+        self._validators = {}       # product_id -> doğrulayıcı satırı veya None (silinecek)
+        self._notifications = []    # kuyruğa eklenecek fiyat alarmları
+        self._oldest = None         # Tampondaki en eski kaydın zamanı (monotonic)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Hata durumunda da o ana kadar işlenmiş sonuçlar kaybolmasın
+        try:
+            self.flush()
+        except sqlite3.Error:
+            # Aktarım hatası yazdırıldı; asıl hatanın üzerine yazmasın
+            if exc_type is None:
+                raise
+
+    def __len__(self):
+        return len(self._history) + len(self._updates) + len(self._validators) + len(self._notifications)
+
+    def add_price_history(self, product_id: int, price: float):
+        """Fiyat kaydını tampona ekler; kayıt zamanı ekleme anıdır."""
+        self._history.append((product_id, price, datetime.now().isoformat()))
+        self._touch()
+
+    def update_product(self, product_id: int, data: dict):
+        """Ürün güncellemesini tampona ekler; aynı ürünün güncellemeleri birleştirilir."""
+        if not data:
+            return
+        self._updates.setdefault(product_id, {}).update(data)
+        self._touch()
+
+    def set_page_validators(self, product_id: int, validators: dict):
+        """Sayfa doğrulayıcılarını tampona ekler; aynı ürün için son değer geçerlidir."""
+        self._validators[product_id] = self._validator_row(product_id, validators)
+        self._touch()
+
+    def clear_page_validators(self, product_id: int):
+        """Sayfa doğrulayıcılarının silinmesini tampona ekler."""
+        self._validators[product_id] = None
+        self._touch()
+
+    def enqueue_notification(self, product_id: int, product_name: str, product_url: str, price: float):
+        """Fiyat alarmını tampona ekler; ürünün gönderilmemiş alarmı varsa aktarımda atlanır."""
+        self._notifications.append(self._notification_row(product_id, product_name, product_url, price))
+        self._touch()
+
+    @staticmethod
+    def _notification_row(product_id: int, product_name: str, product_url: str, price: float) -> tuple:
+        return (product_id, product_name, product_url, price, datetime.now().isoformat(),
+                product_id, constants.OUTBOX_MAX_ATTEMPTS)
+
+    @staticmethod
+    def _validator_row(product_id: int, validators: dict) -> tuple:
+        return (product_id, validators.get('etag'), validators.get('last_modified'),
+                validators.get('digest'), datetime.now().isoformat())
+
+    def _touch(self):
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    def is_due(self) -> bool:
+        """Tampon `max_items` kayda ulaştıysa veya en eski kayıt `max_age` saniyeden eskiyse True."""
+        if self._oldest is None:
+            return False
+        return len(self) >= self.max_items or time.monotonic() - self._oldest >= self.max_age
+
+    def flush_if_due(self):
+        """Aktarım zamanı geldiyse (bkz. is_due) tamponu aktarır."""
+        if self.is_due():
+            self.flush()
+
+    def flush(self):
+        """Tampondaki tüm yazmaları tek bir işlemde veritabanına aktarır."""
+        if not len(self):
+            return
+
+        # Aynı sütun kümesini güncelleyen ürünleri tek bir executemany'de topla
+        update_groups = {}
+        for product_id, data in self._updates.items():
+            columns = tuple(data.keys())
+            update_groups.setdefault(columns, []).append([*data.values(), product_id])
+
+        try:
+            with metrics.timer('db_flush'), self.db.conn:
+                if self._history:
+                    self.db.conn.executemany(
+                        "INSERT INTO price_history (product_id, price, check_date) VALUES (?, ?, ?)",
+                        self._history,
+                    )
+                for columns, rows in update_groups.items():
+                    fields = ", ".join(f"{column} = ?" for column in columns)
+                    self.db.conn.executemany(f"UPDATE products SET {fields} WHERE id = ?", rows)
+                stale = [(product_id,) for product_id, row in self._validators.items() if row is None]
+                fresh = [row for row in self._validators.values() if row is not None]
+                if stale:
+                    self.db.conn.executemany("DELETE FROM page_validators WHERE product_id = ?", stale)
+                if fresh:
+                    self.db.conn.executemany("""
+                        INSERT OR REPLACE INTO page_validators (product_id, etag, last_modified, digest, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, fresh)
+                if self._notifications:
+                    self.db.conn.executemany(DBManager._ENQUEUE_NOTIFICATION_SQL, self._notifications)
+        except sqlite3.Error as e:
+            # İşlem geri alındı; tampon korunur ve bir sonraki aktarımda tekrar denenir
+            print(f"Toplu yazma başarısız oldu, daha sonra tekrar denenecek: {e}")
+            raise
+
+        self._history.clear()
+        self._updates.clear()
+        self._validators.clear()
+        self._notifications.clear()
+        self._oldest = None
@@ -0,0 +1,204 @@
+# src/database/migrations.py
+
+import sqlite3
+from pathlib import Path
+
+# Sıralı şema geçişleri: (sürüm, açıklama, SQL)
+# SQL '.sql' ile bitiyorsa bu dizindeki dosyadan okunur.
+# Yeni bir değişiklik için listenin sonuna bir sonraki sürüm numarasıyla ekleme yapın;
+# mevcut adımları asla değiştirmeyin.
+MIGRATIONS = [
+    (1, "Temel tablolar ve varsayılan ayarlar", "schema.sql"),
+    (2, "Fiyat geçmişi ve aktif ürün sorguları için indeksler", """
+        CREATE INDEX IF NOT EXISTS idx_price_history_product_date
+            ON price_history (product_id, check_date);
+        CREATE INDEX IF NOT EXISTS idx_products_is_active
+            ON products (is_active);
+    """),
+    (3, "Fiyat geçmişi için saatlik ve günlük özet tabloları", """
+        CREATE TABLE IF NOT EXISTS price_history_hourly (
+            product_id INTEGER NOT NULL,
+            bucket_start TEXT NOT NULL, -- 'YYYY-MM-DDTHH:00:00'
+            min_price REAL NOT NULL,
+            max_price REAL NOT NULL,
+            avg_price REAL NOT NULL,
+            last_price REAL NOT NULL,
+            sample_count INTEGER NOT NULL,
+            PRIMARY KEY (product_id, bucket_start),
+            FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS price_history_daily (
+            product_id INTEGER NOT NULL,
+            bucket_start TEXT NOT NULL, -- 'YYYY-MM-DDT00:00:00'
+            min_price REAL NOT NULL,
+            max_price REAL NOT NULL,
+            avg_price REAL NOT NULL,
+            last_price REAL NOT NULL,
+            sample_count INTEGER NOT NULL,
+            PRIMARY KEY (product_id, bucket_start),
+            FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_price_history_check_date
+            ON price_history (check_date);
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('history_raw_retention_days', '30');
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('history_hourly_retention_days', '365');
+    """),
+    (4, "Ürünlerde değişiklik zamanı (updated_at) ve bunu güncel tutan tetikleyiciler", """
+        ALTER TABLE products ADD COLUMN updated_at TEXT;
+        UPDATE products SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now');
+        CREATE INDEX IF NOT EXISTS idx_products_updated_at ON products (updated_at);
+        CREATE TRIGGER IF NOT EXISTS trg_products_insert_updated_at
+        AFTER INSERT ON products
+        BEGIN
+            UPDATE products SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_products_update_updated_at
+        AFTER UPDATE ON products
+        WHEN NEW.updated_at IS OLD.updated_at
+        BEGIN
+            UPDATE products SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+        END;
+    """),
+    (5, "Değişmeyen sayfaları tespit etmek için sayfa doğrulayıcıları (ETag/Last-Modified/özet)", """
+        CREATE TABLE IF NOT EXISTS page_validators (
+            product_id INTEGER PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            digest TEXT,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE
+        );
+    """),
+    (6, "Uyarlanabilir kontrol zamanlaması (next_check_at, volatility, consecutive_errors)", """
+        ALTER TABLE products ADD COLUMN next_check_at TEXT;
+        ALTER TABLE products ADD COLUMN volatility REAL;
+        ALTER TABLE products ADD COLUMN consecutive_errors INTEGER NOT NULL DEFAULT 0;
+        -- Mevcut ürünlerin değişim oranını fiyat geçmişinden başlat
+        UPDATE products SET volatility = (
+            SELECT AVG(changed) FROM (
+                SELECT price != LAG(price) OVER (ORDER BY check_date) AS changed
+                FROM price_history WHERE product_id = products.id
+            ) WHERE changed IS NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_products_due ON products (is_active, next_check_at);
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('check_interval_min_minutes', '15');
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('check_interval_max_minutes', '1440');
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('check_budget_per_site', '0');
+    """),
+    (7, "Fiyat alarmları için kalıcı bildirim kuyruğu (outbox)", """
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            product_id INTEGER NOT NULL,
+            product_name TEXT,
+            product_url TEXT NOT NULL,
+            price REAL NOT NULL,
+            created_at TEXT NOT NULL,
+            sent_at TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE
+        );
+        CREATE INDEX IF NOT EXISTS idx_notification_outbox_pending
+            ON notification_outbox (product_id) WHERE sent_at IS NULL;
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('email_digest_mode', '0');
+    """),
+    (8, "Kontrol çalıştırmalarının özet ölçümleri", """
+        CREATE TABLE IF NOT EXISTS check_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT NOT NULL,
+            duration REAL NOT NULL,
+            total INTEGER NOT NULL,
+            done INTEGER NOT NULL,
+            cancelled INTEGER NOT NULL DEFAULT 0,
+            tracking INTEGER NOT NULL DEFAULT 0,
+            price_alert INTEGER NOT NULL DEFAULT 0,
+            error INTEGER NOT NULL DEFAULT 0,
+            unchanged INTEGER NOT NULL DEFAULT 0,
+            stats_json TEXT -- aşama süreleri ve site/durum sayaçları (metrics.RunMetrics.summary)
+        );
+        CREATE INDEX IF NOT EXISTS idx_check_runs_started_at ON check_runs (started_at);
+        INSERT OR IGNORE INTO settings (key, value) VALUES ('metrics_textfile_path', '');
+    """),
+    (9, "Ürünlerin 'site' değeri, scraper kaydındaki host adına dönüştürülür", """
+        -- Önceden host'un ilk etiketi yazılıyordu ('amazon', 'hepsiburada', mobil sitede 'm').
+        -- URL'de alt dize aranmaz; eski etiket, URL'nin host adıyla birlikte kontrol edilir.
+        CREATE TEMP TABLE _product_hosts AS
+            WITH a AS (
+                SELECT id, site, lower(substr(url, instr(url, '://') + 3)) || '/' AS rest
+                FROM products WHERE site IN ('amazon', 'hepsiburada', 'm') AND instr(url, '://') > 0
+            ), b AS (SELECT id, site, substr(rest, 1, instr(rest, '/') - 1) || '?' AS rest FROM a
+            ), c AS (SELECT id, site, substr(rest, 1, instr(rest, '?') - 1) || '#' AS rest FROM b
+            ), d AS (SELECT id, site, substr(rest, 1, instr(rest, '#') - 1) || ':' AS rest FROM c)
+            SELECT id, site, substr(rest, 1, instr(rest, ':') - 1) AS host FROM d;
+        UPDATE products SET site = 'amazon.com.tr' WHERE id IN (
+            SELECT id FROM _product_hosts WHERE site IN ('amazon', 'm')
+                AND (host = 'amazon.com.tr' OR host LIKE '%.amazon.com.tr'));
+        UPDATE products SET site = 'hepsiburada.com' WHERE id IN (
+            SELECT id FROM _product_hosts WHERE site IN ('hepsiburada', 'm')
+                AND (host = 'hepsiburada.com' OR host LIKE '%.hepsiburada.com'));
+        DROP TABLE _product_hosts;
+    """),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Veritabanının şema sürümünü (PRAGMA user_version) döndürür."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def _load_sql(sql: str) -> str:
+    if sql.strip().endswith(".sql"):
+        with open(Path(__file__).parent / sql.strip(), 'r', encoding='utf-8') as f:
+            return f.read()
+    return sql
+
+def _split_statements(script: str) -> list[str]:
+    """SQL betiğini tek tek deyimlere ayırır (tetikleyici gövdelerindeki ';' bölünmez)."""
+    statements, buffer = [], ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Bekleyen geçişleri sırayla uygular. Her adım, sürüm numarasının
+    güncellenmesiyle birlikte tek bir işlemde yapılır; yarıda kalan bir adım
+    geri alınır. Şema güncelse hiçbir şey yapmaz.
+
+    GUI ve arka plan denetleyicisi aynı anda başlayabildiği için her adım
+    yazma kilidi alınarak (BEGIN IMMEDIATE) başlatılır ve sürüm bu kilit
+    altında yeniden okunur; başka bir süreç adımı uygulamışsa atlanır.
+    :return: Uygulama sonrası şema sürümü.
+    """
+    version = get_schema_version(conn)
+    if version >= LATEST_VERSION:
+        return version
+
+    if conn.in_transaction:
+        conn.commit()
+    for step_version, description, sql in MIGRATIONS:
+        if step_version <= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = get_schema_version(conn)
+            if step_version <= version:
+                conn.commit()
+                continue
+            print(f"Veritabanı şeması güncelleniyor: v{step_version} - {description}")
+            for statement in _split_statements(_load_sql(sql)):
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {step_version}")
+            conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        version = step_version
+    return version
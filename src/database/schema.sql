@@ -1,4 +1,6 @@
 -- database/schema.sql
+-- Şema sürüm 1'in tanımıdır (bkz. migrations.py). Mevcut veritabanlarına da
+-- uygulanabilmesi için yeni değişiklikler buraya değil, migrations.py'ye eklenmelidir.
 
 -- Takip edilen ürünleri saklayan ana tablo
 CREATE TABLE IF NOT EXISTS products (
@@ -27,6 +29,10 @@ INSERT OR IGNORE INTO settings (key, value) VALUES ('theme', 'litera'); -- ttkbo
 INSERT OR IGNORE INTO settings (key, value) VALUES ('user_email', '');
 INSERT OR IGNORE INTO settings (key, value) VALUES ('smtp_host', 'smtp.gmail.com');
 INSERT OR IGNORE INTO settings (key, value) VALUES ('smtp_port', '587');
+-- Site başına hız sınırı: aynı siteye iki istek arası saniye ve art arda izin verilen istek sayısı.
+-- Siteye özel değer için anahtar 'rate_limit_interval:amazon.com.tr' biçiminde eklenebilir.
+INSERT OR IGNORE INTO settings (key, value) VALUES ('rate_limit_interval', '5');
+INSERT OR IGNORE INTO settings (key, value) VALUES ('rate_limit_burst', '1');
 
 
 -- Her ürünün fiyat geçmişini tutan tablo
@@ -4,7 +4,8 @@ from tkinter import ttk, messagebox
 import ttkbootstrap as ttkb
 import threading
 from ..database.db_manager import DBManager
-from ..scraping import scraper_factory
+from ..scraping.scraper_factory import get_site
+from ..utils.url_utils import get_host
 from ..utils.exceptions import ScraperError
 
 class AddProductDialog(ttkb.Toplevel):
@@ -72,6 +73,8 @@ class AddProductDialog(ttkb.Toplevel):
 
     def _fetch_product_name_thread(self, url):
         try:
+            # Scraper/Selenium yığını uygulama açılışını yavaşlatmasın diye ilk kullanımda yüklenir
+            from ..scraping import scraper_factory
             scraper = scraper_factory.get_scraper(url)
             data = scraper.scrape()
             self.after(0, self.name_status_var.set, f"✓ Bulunan Ürün: {data['name'][:50]}...")
@@ -94,16 +97,22 @@ class AddProductDialog(ttkb.Toplevel):
             messagebox.showerror("Hata", "Lütfen hedef fiyat için geçerli bir sayı girin.", parent=self)
             return
         
-        try:
-            domain = url.split('/')[2].replace('www.', '')
-            site = domain.split('.')[0] # 'amazon', 'hepsiburada' vs.
-        except IndexError:
+        if not get_host(url):
             messagebox.showerror("Hata", "Geçersiz URL formatı.", parent=self)
             return
 
+        # Kayıttaki host (örn. 'm.hepsiburada.com' -> 'hepsiburada.com'); site bazlı
+        # zamanlama ve ölçümler bu değere göre gruplanır
+        site = get_site(url)
+        if site is None:
+            messagebox.showerror("Hata", "Bu site henüz desteklenmiyor.", parent=self)
+            return
+
         if self.product_id:
-            # Düzenleme modu
-            self.db.update_product(self.product_id, {'url': url, 'target_price': target_price})
+            # Düzenleme modu: yeni hedef fiyatın etkisi için ürün bir sonraki kontrolde hemen ele alınır
+            self.db.update_product(self.product_id, {'url': url, 'site': site, 'target_price': target_price,
+                                                     'next_check_at': None})
+            self.db.clear_page_validators(self.product_id)
         else:
             # Ekleme modu
             self.db.add_product(url, target_price, site)
@@ -0,0 +1,32 @@
+# src/gui/icon_cache.py
+
+import tkinter as tk
+from pathlib import Path
+from ..utils import constants
+
+def _cache_path(source: Path, size: tuple[int, int]) -> Path:
+    # Kaynak dosya değişirse (mtime) önbellek adı da değişir ve ikon yeniden üretilir
+    mtime = int(source.stat().st_mtime)
+    return constants.ICON_CACHE_DIR / f"{source.stem}_{size[0]}x{size[1]}_{mtime}.png"
+
+def load_icon(master, source: Path, size: tuple[int, int]) -> tk.PhotoImage:
+    """
+    İkonu istenen boyutta yükler. Yeniden boyutlandırılmış PNG önbellekte varsa
+    doğrudan Tk ile okunur; PIL yalnızca önbellek ilk kez oluşturulurken yüklenir.
+    :raises FileNotFoundError: Kaynak ikon dosyası yoksa.
+    """
+    cached = _cache_path(source, size)
+    if cached.exists():
+        try:
+            return tk.PhotoImage(master=master, file=str(cached))
+        except tk.TclError:
+            cached.unlink(missing_ok=True)  # Bozuk önbellek dosyası, yeniden üret
+
+    from PIL import Image, ImageTk
+    img = Image.open(source).resize(size, Image.LANCZOS)
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        img.save(cached, format="PNG")
+    except OSError as e:
+        print(f"İkon önbelleğe yazılamadı ({cached}): {e}")
+    return ImageTk.PhotoImage(img, master=master)
@@ -3,30 +3,51 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import ttkbootstrap as ttkb
-from PIL import Image, ImageTk
 from pathlib import Path
+from collections import deque
+import queue
+import sys
 import threading
+import time
 
 from ..database.db_manager import DBManager
 from ..core.config_manager import ConfigManager
-from ..core.tracker import run_all_active_product_checks
 from .add_product_dialog import AddProductDialog
 from .settings_dialog import SettingsDialog
+from .icon_cache import load_icon
 from ..utils import constants
-from ..scraping.base_scraper import WebDriverManager 
 
+# Selenium ve scraper modülleri pencere açılışını yavaşlatmamak için ilk
+# fiyat kontrolünde (veya ürün adı önizlemesinde) yüklenir.
+_WEBDRIVER_POOL_MODULE = f"{__package__.rsplit('.', 1)[0]}.scraping.webdriver_pool"
 
 
 class App(ttkb.Window):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, db: DBManager | None = None, **kwargs):
+        """
+        :param db: Başlangıçta zaten açılmış bir DBManager varsa tekrar açmamak için verilebilir.
+        """
         super().__init__(*args, **kwargs)
         
         self.title("PricePal - Fiyat Alarm Aracı")
         self.geometry("1200x600")
 
-        self.db = DBManager()
+        self.db = db or DBManager()
         self.config = ConfigManager(self.db)
 
+        # Treeview'i her seferinde baştan çizmek yerine sadece değişen satırları uygularız
+        self._tree_items = {}        # ürün ID'si -> Treeview öğesi
+        self._known_ids = set()      # Veritabanındaki güncel ürün ID'leri
+        self._last_sync = None       # Görülen en büyük 'updated_at' değeri
+        self._pending_rows = deque() # Parça parça çizilecek satırlar
+        self._chunk_job = None
+
+        # Fiyat kontrolü sırasında tracker'dan gelen ürün bazlı olaylar
+        self._check_events = queue.Queue()
+        self._cancel_event = None
+        self._check_started_at = None
+        self._last_run_summary = None
+
         self.icons = self._load_icons()
         self._create_widgets() # Create the widgets first
         self._setup_styles()   # Then apply styles to them
@@ -50,8 +71,7 @@ class App(ttkb.Window):
         
         for name, filename in constants.ICONS.items():
             try:
-                img = Image.open(icon_path / filename).resize((20, 20), Image.LANCZOS)
-                icons[name] = ImageTk.PhotoImage(img)
+                icons[name] = load_icon(self, icon_path / filename, constants.ICON_SIZE)
             except FileNotFoundError:
                 print(f"İkon bulunamadı: {filename}")
                 icons[name] = None
@@ -70,6 +90,10 @@ class App(ttkb.Window):
 
         self.refresh_btn = ttk.Button(toolbar, text=" Fiyatları Kontrol Et", image=self.icons.get("refresh"), compound=tk.LEFT, command=self.check_all_prices, style="info.TButton")
         self.refresh_btn.pack(side=tk.LEFT, padx=(20, 5))
+
+        self.cancel_btn = ttk.Button(toolbar, text=" Durdur", command=self.cancel_price_checks,
+                                     style="danger.TButton", state="disabled")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
         
         self.settings_btn = ttk.Button(toolbar, text=" Ayarlar", image=self.icons.get("settings"), compound=tk.LEFT, command=self.open_settings_dialog)
         self.settings_btn.pack(side=tk.RIGHT, padx=5)
@@ -111,25 +135,67 @@ class App(ttkb.Window):
         self.status_bar.pack(fill=tk.X)
 
 
-    def refresh_product_list(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        
-        products = self.db.get_all_products()
-        for p in products:
-            status = p['status'] or 'Bilinmiyor'
-            tag = status.lower() if status in ['PRICE_ALERT', 'ERROR', 'PENDING', 'TRACKING'] else ''
-            
-            self.tree.insert("", tk.END, values=(
-                p['id'],
-                status,
-                p['name'] or 'Henüz Getirilmedi',
-                f"{p['target_price']:.2f} TL",
-                f"{p['current_price']:.2f} TL" if p['current_price'] else "N/A",
-                p['site'].capitalize(),
-                p['last_check_date'][:16].replace('T', ' ') if p['last_check_date'] else "Hiç"
-            ), tags=(tag,))
-        self.update_status(f"{len(products)} ürün takip ediliyor.")
+    def refresh_product_list(self, full: bool = False):
+        """
+        Listeyi veritabanıyla eşitler. Sadece son eşitlemeden sonra değişen ürünler
+        okunur; silinen ürünlerin satırları kaldırılır. Çok sayıda satır, Tk ana
+        döngüsünü kilitlememek için parçalar halinde çizilir.
+        :param full: True ise tüm liste baştan okunur.
+        """
+        if full:
+            self._last_sync = None
+
+        changed = self.db.get_products_changed_since(self._last_sync)
+        self._known_ids = self.db.get_product_ids()
+
+        for product_id in list(self._tree_items):
+            if product_id not in self._known_ids:
+                self.tree.delete(self._tree_items.pop(product_id))
+
+        for p in changed:
+            if p['updated_at'] and (self._last_sync is None or p['updated_at'] > self._last_sync):
+                self._last_sync = p['updated_at']
+
+        # Satırlar en yeni eklenen üstte olacak şekilde sıralı gelir. Liste boşsa sona,
+        # doluysa yeni ürünler en üste eklenir; bu yüzden ters sırayla uygulanır.
+        append = not self._tree_items and not self._pending_rows
+        if not append:
+            changed = list(reversed(changed))
+        self._pending_rows.extend((p, append) for p in changed)
+        if self._chunk_job is None:
+            self._apply_row_chunk()
+
+    def _apply_row_chunk(self):
+        self._chunk_job = None
+        for _ in range(min(constants.TREE_REFRESH_CHUNK_SIZE, len(self._pending_rows))):
+            self._upsert_row(*self._pending_rows.popleft())
+        if self._pending_rows:
+            self._chunk_job = self.after(1, self._apply_row_chunk)
+        else:
+            self.update_status(f"{len(self._tree_items)} ürün takip ediliyor.")
+
+    def _upsert_row(self, p, append: bool):
+        product_id = p['id']
+        if product_id not in self._known_ids:
+            return  # Çizilmeyi beklerken silinmiş
+        status = p['status'] or 'Bilinmiyor'
+        tag = status.lower() if status in ['PRICE_ALERT', 'ERROR', 'PENDING', 'TRACKING'] else ''
+        values = (
+            product_id,
+            status,
+            p['name'] or 'Henüz Getirilmedi',
+            f"{p['target_price']:.2f} TL",
+            f"{p['current_price']:.2f} TL" if p['current_price'] else "N/A",
+            p['site'].capitalize(),
+            p['last_check_date'][:16].replace('T', ' ') if p['last_check_date'] else "Hiç"
+        )
+        item = self._tree_items.get(product_id)
+        if item is not None:
+            self.tree.item(item, values=values, tags=(tag,))
+        else:
+            index = tk.END if append else 0
+            self._tree_items[product_id] = self.tree.insert("", index, iid=str(product_id),
+                                                            values=values, tags=(tag,))
 
     def open_add_product_dialog(self):
         AddProductDialog(self, self.db, callback=self.refresh_product_list)
@@ -157,23 +223,94 @@ class App(ttkb.Window):
             self.refresh_product_list()
             self.update_status(f"Ürün ID {product_id} silindi.")
 
-    # src/gui/main_window.py dosyasında bu metodu GÜNCELLEYİN
-
-    def _run_price_checks_thread(self):
-        self.after(0, self.update_status, "Fiyatlar kontrol ediliyor...")
-        self.after(0, self.refresh_btn.config, {"state": "disabled"})
-        
+    def _run_price_checks_thread(self, cancel_event: threading.Event):
         try:
-            run_all_active_product_checks()
+            from ..core.tracker import run_all_active_product_checks
+            run_all_active_product_checks(on_event=self._check_events.put, cancel_event=cancel_event)
         except Exception as e:
             print(f"Fiyat kontrol thread'inde bir hata yakalandı: {e}")
-        
-        self.after(0, self.refresh_product_list)
-        self.after(0, self.refresh_btn.config, {"state": "normal"})
-        self.after(0, self.update_status, "Kontrol tamamlandı.")
+        # Olaylar ana döngüde işlenir; thread sadece bittiğini bildirir
+        self._check_events.put({'type': 'thread_done'})
 
     def check_all_prices(self):
-        threading.Thread(target=self._run_price_checks_thread, daemon=True).start()
+        self.refresh_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.update_status("Fiyatlar kontrol ediliyor...")
+        self._cancel_event = threading.Event()
+        self._check_started_at = time.monotonic()
+        threading.Thread(target=self._run_price_checks_thread, args=(self._cancel_event,), daemon=True).start()
+        self.after(constants.CHECK_EVENT_POLL_MS, self._drain_check_events)
+
+    def cancel_price_checks(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self.cancel_btn.config(state="disabled")
+            self.update_status("Durduruluyor... (devam eden kontroller tamamlanıyor)")
+
+    def _drain_check_events(self):
+        """Kontrol thread'inden gelen olayları ana döngüde işler ve satırları yerinde günceller."""
+        finished = False
+        try:
+            while True:
+                event = self._check_events.get_nowait()
+                if event['type'] == 'result':
+                    self._apply_check_result(event)
+                    self._update_progress(event['done'], event['total'])
+                elif event['type'] == 'started':
+                    item = self._tree_items.get(event['product_id'])
+                    if item is not None:
+                        self.tree.set(item, "status", "KONTROL...")
+                elif event['type'] in ('run_finished', 'run_skipped'):
+                    self._last_run_summary = event
+                elif event['type'] == 'thread_done':
+                    finished = True
+        except queue.Empty:
+            pass
+
+        if finished:
+            self._on_price_checks_finished()
+        else:
+            self.after(constants.CHECK_EVENT_POLL_MS, self._drain_check_events)
+
+    def _apply_check_result(self, event: dict):
+        item = self._tree_items.get(event['product_id'])
+        if item is None:
+            return
+        status = event['status']
+        tag = status.lower() if status in ['PRICE_ALERT', 'ERROR', 'PENDING', 'TRACKING'] else ''
+        price = event['price']
+        last_check = event['last_check_date']
+        self.tree.set(item, "status", status)
+        if event['name']:
+            self.tree.set(item, "name", event['name'])
+        self.tree.set(item, "current_price", f"{price:.2f} TL" if price else "N/A")
+        self.tree.set(item, "last_check", last_check[:16].replace('T', ' ') if last_check else "Hiç")
+        self.tree.item(item, tags=(tag,))
+
+    def _update_progress(self, done: int, total: int):
+        elapsed = time.monotonic() - self._check_started_at
+        remaining = elapsed / done * (total - done) if done else 0
+        minutes, seconds = divmod(int(remaining), 60)
+        self.update_status(
+            f"Fiyatlar kontrol ediliyor: {done}/{total} (%{done * 100 // max(total, 1)})"
+            f" - Tahmini kalan süre: {minutes} dk {seconds} sn"
+        )
+
+    def _on_price_checks_finished(self):
+        summary = self._last_run_summary
+        self._last_run_summary = None
+        self._cancel_event = None
+        self.refresh_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        self.refresh_product_list()
+        if summary and summary['type'] == 'run_skipped':
+            message = "Başka bir fiyat kontrolü zaten çalışıyor (örn. arka plan denetleyicisi); kontrol atlandı."
+        elif summary and summary['cancelled']:
+            message = f"Kontrol durduruldu ({summary['done']}/{summary['total']} ürün kontrol edildi)."
+        else:
+            message = "Kontrol tamamlandı."
+        # refresh_product_list satırları parça parça çizer; mesaj onun durum yazısından sonra gelsin
+        self.after(constants.CHECK_EVENT_POLL_MS, self.update_status, message)
 
     def open_settings_dialog(self):
         SettingsDialog(self, self.config)
@@ -185,5 +322,8 @@ class App(ttkb.Window):
         if messagebox.askokcancel("Çıkış", "Uygulamadan çıkmak istediğinize emin misiniz?"):
             print("Uygulama kapatılıyor...")
             self.db.close()
-            WebDriverManager.close_driver()
+            # Tarayıcı havuzu hiç yüklenmediyse kapatılacak tarayıcı da yoktur
+            webdriver_pool = sys.modules.get(_WEBDRIVER_POOL_MODULE)
+            if webdriver_pool is not None:
+                webdriver_pool.WebDriverManager.close_all()
             self.destroy()
\ No newline at end of file
@@ -60,8 +60,13 @@ class SettingsDialog(ttkb.Toplevel):
         help_label = ttk.Label(email_tab, text=help_text, wraplength=350, font="-size 10")
         help_label.grid(row=2, column=0, columnspan=2, pady=(10, 5))
         
+        self.digest_var = tk.BooleanVar()
+        digest_check = ttk.Checkbutton(email_tab, text="Bir kontroldeki tüm alarmları tek e-postada topla",
+                                       variable=self.digest_var)
+        digest_check.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+
         self.test_button = ttk.Button(email_tab, text="Test E-postası Gönder", command=self.send_test_email)
-        self.test_button.grid(row=3, column=1, pady=10, sticky="e")
+        self.test_button.grid(row=4, column=1, pady=10, sticky="e")
 
         # Butonlar
         button_frame = ttk.Frame(main_frame)
@@ -76,6 +81,7 @@ class SettingsDialog(ttkb.Toplevel):
     def _load_settings(self):
         self.theme_var.set(self.config.get('theme', 'litera'))
         self.email_var.set(self.config.get('user_email', ''))
+        self.digest_var.set(self.config.get('email_digest_mode', '0') == '1')
         # Şifre güvenlik nedeniyle yüklenmez, kullanıcı her seferinde girebilir veya keyring'de saklanır
         # Buraya keyring'den okuma eklenebilir ama ayar ekranında göstermek riskli olabilir.
 
@@ -94,6 +100,7 @@ class SettingsDialog(ttkb.Toplevel):
             self.config.set_email_credentials(email, password)
         elif email: # Sadece email girildiyse
             self.config.set('user_email', email)
+        self.config.set('email_digest_mode', '1' if self.digest_var.get() else '0')
         
         messagebox.showinfo("Başarılı", "Ayarlar başarıyla kaydedildi.", parent=self)
         self.destroy()
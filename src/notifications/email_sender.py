@@ -1,29 +1,16 @@
 # src/notifications/email_sender.py
 
+import html
 import smtplib
 import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-def send_price_alert_email(
-    sender_email: str,
-    password: str,
-    recipient_email: str,
-    smtp_host: str,
-    smtp_port: int,
-    product_name: str,
-    new_price: float,
-    product_url: str,
-) -> bool:
-    """
-    Kullanıcıya fiyat alarmı e-postası gönderir.
-
-    :return: E-postanın başarıyla gönderilip gönderilmediğini belirten boolean.
-    """
-    if not all([sender_email, password, recipient_email]):
-        print("Hata: E-posta göndermek için gerekli kimlik bilgileri eksik.")
-        return False
+_FOOTER = "<hr>\n        <p><small>Bu e-posta PricePal tarafından otomatik olarak gönderilmiştir.</small></p>"
 
+def build_price_alert_message(sender_email: str, recipient_email: str, product_name: str,
+                              new_price: float, product_url: str) -> MIMEMultipart:
+    """Tek bir ürün için fiyat alarmı e-postasını oluşturur."""
     message = MIMEMultipart("alternative")
     message["Subject"] = f"💸 Fiyat Alarmı! '{product_name}' için harika fırsat!"
     message["From"] = sender_email
@@ -45,19 +32,130 @@ def send_price_alert_email(
             Ürüne Git
           </a>
         </p>
-        <hr>
-        <p><small>Bu e-posta PricePal tarafından otomatik olarak gönderilmiştir.</small></p>
+        {_FOOTER}
       </body>
     </html>
     """
     message.attach(MIMEText(html_body, "html"))
+    return message
+
+def build_digest_message(sender_email: str, recipient_email: str, alerts: list[dict]) -> MIMEMultipart:
+    """
+    Birden fazla fiyat alarmını tek bir özet e-postada birleştirir.
+    :param alerts: [{'product_name', 'price', 'product_url'}, ...]
+    """
+    message = MIMEMultipart("alternative")
+    message["Subject"] = f"💸 Fiyat Alarmı! {len(alerts)} üründe fiyat hedefin altına düştü"
+    message["From"] = sender_email
+    message["To"] = recipient_email
 
-    # Güvenli SSL bağlantısı oluştur ve e-postayı gönder
-    context = ssl.create_default_context()
+    rows = "\n".join(
+        f"""        <tr>
+          <td style="padding: 6px 10px;"><a href="{html.escape(alert['product_url'], quote=True)}">{html.escape(alert['product_name'] or alert['product_url'])}</a></td>
+          <td style="padding: 6px 10px; font-weight: bold; color: #28a745;">{alert['price']:,.2f} TL</td>
+        </tr>"""
+        for alert in alerts
+    )
+    html_body = f"""
+    <html>
+      <body>
+        <h2>Fiyat Alarmı!</h2>
+        <p>Merhaba,</p>
+        <p>Takip ettiğiniz aşağıdaki ürünlerin fiyatı, belirlediğiniz hedefin altına düştü:</p>
+        <table>
+{rows}
+        </table>
+        {_FOOTER}
+      </body>
+    </html>
+    """
+    message.attach(MIMEText(html_body, "html"))
+    return message
+
+class SmtpConnection:
+    """
+    Kimliği doğrulanmış tek bir SMTP bağlantısı üzerinden çok sayıda e-posta
+    gönderir; TLS el sıkışması ve giriş işlemi her e-posta için tekrarlanmaz.
+    465 numaralı portta doğrudan SSL, diğerlerinde STARTTLS kullanılır.
+    Kullanım: `with SmtpConnection(...) as smtp: smtp.send(message)`
+    """
+
+    def __init__(self, smtp_host: str, smtp_port: int, sender_email: str, password: str):
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.sender_email = sender_email
+        self.password = password
+        self._server = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        """Bağlantıyı açar ve giriş yapar. Hata durumunda smtplib istisnaları yükseltilir."""
+        if self._server is not None:
+            return
+        context = ssl.create_default_context()
+        if self.smtp_port == 465:
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+            server.starttls(context=context)
+        try:
+            server.login(self.sender_email, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+
+    def send(self, message: MIMEMultipart):
+        """
+        E-postayı gönderir. Sunucu boştaki bağlantıyı kapattıysa bir kez yeniden bağlanılır.
+        Gönderim başarısız olursa smtplib istisnaları yükseltilir.
+        """
+        self.open()
+        try:
+            self._server.sendmail(self.sender_email, message["To"], message.as_string())
+        except smtplib.SMTPServerDisconnected:
+            self._server = None
+            self.open()
+            self._server.sendmail(self.sender_email, message["To"], message.as_string())
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+
+def send_price_alert_email(
+    sender_email: str,
+    password: str,
+    recipient_email: str,
+    smtp_host: str,
+    smtp_port: int,
+    product_name: str,
+    new_price: float,
+    product_url: str,
+) -> bool:
+    """
+    Kullanıcıya fiyat alarmı e-postası gönderir.
+
+    :return: E-postanın başarıyla gönderilip gönderilmediğini belirten boolean.
+    """
+    if not all([sender_email, password, recipient_email]):
+        print("Hata: E-posta göndermek için gerekli kimlik bilgileri eksik.")
+        return False
+
+    message = build_price_alert_message(sender_email, recipient_email, product_name, new_price, product_url)
     try:
-        with smtplib.SMTP_SSL(smtp_host, smtp_port, context=context) as server:
-            server.login(sender_email, password)
-            server.sendmail(sender_email, recipient_email, message.as_string())
+        with SmtpConnection(smtp_host, smtp_port, sender_email, password) as smtp:
+            smtp.send(message)
         print(f"Fiyat alarmı e-postası '{recipient_email}' adresine başarıyla gönderildi.")
         return True
     except smtplib.SMTPAuthenticationError:
@@ -65,4 +163,4 @@ def send_price_alert_email(
         return False
     except Exception as e:
         print(f"E-posta gönderilirken bir hata oluştu: {e}")
-        return False
\ No newline at end of file
+        return False
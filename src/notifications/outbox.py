@@ -0,0 +1,124 @@
+# src/notifications/outbox.py
+
+import smtplib
+import threading
+from ..database.db_manager import DBManager
+from ..core.config_manager import ConfigManager
+from ..notifications import email_sender
+from ..utils import constants, metrics
+
+class OutboxSender:
+    """
+    notification_outbox tablosundaki fiyat alarmlarını e-posta ile gönderir.
+    Bir boşaltmadaki tüm e-postalar tek bir kimliği doğrulanmış SMTP bağlantısı
+    üzerinden gider. Özet modunda ('email_digest_mode' = '1') bekleyen tüm
+    alarmlar tek bir e-postada birleştirilir.
+
+    Fiyat kontrolü alarmları yalnızca kuyruğa yazar; gönderim bu sınıfın arka plan
+    iş parçacığında yapıldığı için yavaş bir SMTP sunucusu kontrolleri bekletmez.
+    """
+
+    def __init__(self, db: DBManager, config: ConfigManager):
+        self.db = db
+        self.config = config
+        self.digest_mode = config.get('email_digest_mode', '0') == '1'
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._warned_missing_credentials = False
+
+    def drain(self) -> int:
+        """
+        Bekleyen alarmları gönderir.
+        :return: Gönderilen alarm sayısı.
+        """
+        pending = self.db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)
+        if not pending:
+            return 0
+
+        user_email = self.config.get('user_email')
+        password = self.config.get_email_password()
+        if not all([user_email, password]):
+            # Alarmlar kuyrukta kalır, kimlik bilgileri girildiğinde gönderilir.
+            # Kuyruk birkaç saniyede bir yoklandığı için uyarı bir kez yazdırılır.
+            if not self._warned_missing_credentials:
+                print("Hata: E-posta göndermek için gerekli kimlik bilgileri eksik.")
+                self._warned_missing_credentials = True
+            return 0
+        self._warned_missing_credentials = False
+        smtp = email_sender.SmtpConnection(
+            self.config.get('smtp_host', 'smtp.gmail.com'),
+            self.config.get_int('smtp_port', 587),
+            user_email, password,
+        )
+
+        sent = 0
+        try:
+            # Bağlantı/kimlik doğrulama hataları alarmların deneme hakkını tüketmez
+            smtp.open()
+            if self.digest_mode:
+                message = email_sender.build_digest_message(user_email, user_email, [
+                    {'product_name': row['product_name'], 'price': row['price'], 'product_url': row['product_url']}
+                    for row in pending
+                ])
+                batches = [(message, [row['id'] for row in pending])]
+            else:
+                batches = [
+                    (email_sender.build_price_alert_message(
+                        user_email, user_email, row['product_name'], row['price'], row['product_url']), [row['id']])
+                    for row in pending
+                ]
+            for message, notification_ids in batches:
+                try:
+                    with metrics.timer('smtp_send'):
+                        smtp.send(message)
+                except Exception as e:
+                    print(f"E-posta gönderilirken bir hata oluştu: {e}")
+                    self.db.mark_notifications_failed(notification_ids, str(e))
+                    continue
+                self.db.mark_notifications_sent(notification_ids)
+                sent += len(notification_ids)
+        finally:
+            smtp.close()
+        if sent:
+            print(f"{sent} fiyat alarmı '{user_email}' adresine başarıyla gönderildi.")
+        return sent
+
+    def start(self):
+        """
+        Kuyruğu düzenli aralıklarla boşaltan arka plan iş parçacığını başlatır.
+        Özet modunda alarmlar çalıştırma sonunda tek e-postada toplanacağı için
+        iş parçacığı başlatılmaz; gönderim stop() ile yapılır.
+        """
+        if self.digest_mode or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-sender", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arka plan iş parçacığını durdurur ve kuyrukta kalanları son bir kez gönderir."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.send_pending()
+
+    def _run(self):
+        try:
+            while not self._stop_event.wait(constants.OUTBOX_POLL_INTERVAL):
+                self.send_pending()
+        finally:
+            # Bu iş parçacığına ait veritabanı bağlantısını kapat
+            self.db.close()
+
+    def send_pending(self):
+        """drain() gibi çalışır ancak hataları yükseltmek yerine yazdırır."""
+        try:
+            self.drain()
+        except smtplib.SMTPAuthenticationError:
+            print("E-posta gönderilemedi. SMTP kimlik doğrulama hatası. Lütfen e-posta ve uygulama şifrenizi kontrol edin.")
+            # Şifre keyring'de değiştirilmiş olabilir; sonraki denemede yeniden okunsun
+            self.config.forget_email_password()
+        except Exception as e:
+            # Kimlik doğrulama/bağlantı hatalarında alarmlar kuyrukta kalır
+            print(f"Bildirim kuyruğu boşaltılamadı: {e}")
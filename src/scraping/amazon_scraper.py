@@ -1,14 +1,19 @@
 # src/scraping/amazon_scraper.py
 
+from bs4 import SoupStrainer
 from .base_scraper import BaseScraper
 from ..utils.exceptions import ProductNameNotFoundError, PriceNotFoundError
 
 class AmazonScraper(BaseScraper):
     """Amazon.com.tr için veri kazıma işlemlerini gerçekleştirir."""
+    # Amazon düz HTTP isteklerini sıklıkla bot doğrulamasına yönlendirdiği için tarayıcı kullanılır
+    required_selectors = ("span#productTitle", "span.a-price-whole, span.a-offscreen")
+    # Fiyatın küsurat kısmı ayrı bir düğümde olduğu için değişiklik tespitine o da dahil edilir
+    change_selectors = ("span#productTitle", "span.a-offscreen", "span.a-price-whole", "span.a-price-fraction")
+    # Aranan tüm düğümler <span>; sayfanın büyük kısmını oluşturan script/style/div ağacı kurulmaz
+    parse_only = SoupStrainer("span")
 
-    def scrape(self) -> dict:
-        soup = self.get_page_content()
-
+    def extract(self, soup) -> dict:
         # Ürün Adını Bul
         name_element = soup.find("span", id="productTitle")
         if not name_element:
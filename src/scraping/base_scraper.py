@@ -1,83 +1,258 @@
 # src/scraping/base_scraper.py (YENİ HALİ)
 
 from abc import ABC, abstractmethod
+from importlib.util import find_spec
+import hashlib
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from .http_transport import HttpSessionManager
+from .webdriver_pool import WebDriverManager
+from . import resource_blocking
+from .cookie_store import CookieStore
+from ..utils.url_utils import get_host
 from ..utils.exceptions import ScraperError
-from ..utils import constants   
+from ..utils import constants, metrics
 
-class WebDriverManager:
-    """
-    Selenium WebDriver'ı tek bir örnek (singleton) olarak yönetir.
-    Uygulama boyunca sadece bir tarayıcı penceresi açılmasını sağlar.
-    """
-    _driver = None
-
-    @classmethod
-    def get_driver(cls):
-        if cls._driver is None:
-            print("WebDriver başlatılıyor...")
-            options = Options()
-            options.add_argument("--headless")  # Tarayıcıyı arayüz olmadan (arka planda) çalıştırır
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled") # Bot tespitini zorlaştırır
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument(f"user-agent={constants.DEFAULT_USER_AGENT}")
-            options.add_argument('--log-level=3')   
-            options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            # ---------------------
-            try:
-                service = ChromeService(ChromeDriverManager().install())
-                cls._driver = webdriver.Chrome(service=service, options=options)
-                cls._driver.set_page_load_timeout(45) # Sayfa yükleme zaman aşımını artırdık
-                print("WebDriver başarıyla başlatıldı.")
-            except Exception as e:
-                print(f"WebDriver başlatılamadı: {e}")
-                raise ScraperError(f"WebDriver başlatılamadı: {e}")
-        return cls._driver
-
-    @classmethod
-    def close_driver(cls):
-        if cls._driver is not None:
-            print("WebDriver kapatılıyor...")
-            cls._driver.quit()
-            cls._driver = None
-            print("WebDriver kapatıldı.")
+# lxml kuruluysa çok daha hızlı olduğu için onu, değilse Python'un kendi ayrıştırıcısını kullan
+HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
 
 
 class BaseScraper(ABC):
     """
     Tüm scraper sınıfları için Selenium tabanlı yeni temel arayüz.
+
+    Sayfası sunucu tarafında oluşturulan siteler `supports_http = True`
+    bildirerek önce düz HTTP ile denenir; yanıtta `required_selectors`
+    ile belirtilen düğümler yoksa Selenium yoluna geri dönülür.
+    Aynı seçiciler tarayıcıda sayfanın hazır olduğunu anlamak için de
+    kullanılır; içerik göründüğü anda beklemeden devam edilir.
     """
-    def __init__(self, url: str):
+    # Düz HTTP ile çekilebilen siteler bunu True yapar
+    supports_http = False
+    # Sayfada verinin mevcut olduğunu gösteren CSS seçicileri (hepsi eşleşmeli)
+    required_selectors: tuple[str, ...] = ()
+    # Sayfanın değişip değişmediğine karar verirken özeti alınan bölgeler.
+    # Boşsa required_selectors kullanılır.
+    change_selectors: tuple[str, ...] = ()
+    # Ayrıştırmanın yalnızca bu düğümlerle sınırlandırılması (None ise tüm sayfa).
+    # extract() ve required_selectors'ın ihtiyaç duyduğu tüm düğümleri kapsamalıdır.
+    parse_only: SoupStrainer | None = None
+    # Tarayıcıda sayfanın hazır olmasının en fazla ne kadar bekleneceği (saniye)
+    page_ready_timeout = constants.DEFAULT_PAGE_READY_TIMEOUT
+    # Tarayıcıda engellenecek kaynak profili ve siteye özel profiller (host -> profil)
+    block_profile = constants.DEFAULT_BLOCK_PROFILE
+    block_profile_overrides: dict[str, str] = {}
+    # Site bu kaynaklar olmadan düzgün çalışmıyorsa profilden çıkarılacak kalıplar (örn. "*.css")
+    resource_allowlist: tuple[str, ...] = ()
+
+    def __init__(self, url: str, page_source=None):
+        """
+        :param url: Ürün sayfasının adresi.
+        :param page_source: İsteğe bağlı, url -> HTML döndüren fonksiyon. Verilirse ağ ve
+                            tarayıcı kullanılmaz (örn. kayıtlı sayfalarla çevrimdışı test/ölçüm).
+        """
         self.url = url
-        self.driver = WebDriverManager.get_driver()
+        self.page_source = page_source
+
+    @classmethod
+    def configure(cls, page_ready_timeout: float, block_profile: str | None = None,
+                  block_profile_overrides: dict[str, str] | None = None):
+        """
+        Tüm scraper'lar için sayfa hazır olma zaman aşımını ve tarayıcıda
+        engellenecek kaynak profilini ayarlar.
+        """
+        BaseScraper.page_ready_timeout = max(1.0, float(page_ready_timeout))
+        if block_profile is not None:
+            BaseScraper.block_profile = block_profile
+        if block_profile_overrides is not None:
+            BaseScraper.block_profile_overrides = dict(block_profile_overrides)
+
+    def blocked_resources(self) -> list[str]:
+        """Bu sayfa tarayıcıda yüklenirken engellenecek URL kalıpları."""
+        profile = self.block_profile_overrides.get(get_host(self.url), self.block_profile)
+        return resource_blocking.blocked_patterns(profile, self.resource_allowlist)
+
+    def has_required_data(self, soup: BeautifulSoup) -> bool:
+        """Sayfanın, scrape için gereken tüm düğümleri içerip içermediğini kontrol eder."""
+        return all(soup.select_one(selector) is not None for selector in self.required_selectors)
+
+    def make_soup(self, html: str) -> BeautifulSoup:
+        """
+        Ham HTML'den BeautifulSoup nesnesi oluşturur. Scraper `parse_only` tanımlamışsa
+        ağaç sadece o düğümlerden (ve alt düğümlerinden) kurulur; sayfanın geri kalanı
+        için nesne oluşturulmaz.
+        """
+        return BeautifulSoup(html, HTML_PARSER, parse_only=self.parse_only)
+
+    def fetch(self, validators: dict | None = None, verify: bool = True) -> dict:
+        """
+        Sayfayı çeker. Önceki başarılı kontrolden kalan doğrulayıcılar verilirse
+        sayfanın değişip değişmediği de tespit edilir: HTTP'de ETag/Last-Modified ile
+        koşullu istek yapılır, her iki yolda da ilgili sayfa bölgesinin özeti karşılaştırılır.
+        :param validators: {'etag', 'last_modified', 'digest'} (hepsi isteğe bağlı).
+        :param verify: False ise HTTP yanıtı burada ayrıştırılmaz ('verified' False döner);
+                       gerekli veri kontrolü ve özet, ayrıştırmayla aynı geçişte inspect() ile
+                       yapılmalı, veri yoksa fetch_browser() çağrılmalıdır.
+        :return: {'html': str | None, 'unchanged': bool, 'validators': dict, 'metrics': dict | None,
+                 'verified': bool}.
+                 'unchanged' True ise 'html' None olabilir; ayrıştırmaya gerek yoktur.
+                 'metrics' sayfa ağırlığı ölçümüdür: {'bytes', 'requests', 'load_ms'}.
+        """
+        validators = validators or {}
+        if self.page_source is not None:
+            return {'html': self.page_source(self.url), 'unchanged': False, 'validators': {}, 'metrics': None,
+                    'verified': True}
+        if self.supports_http:
+            result = self._fetch_http(validators, verify)
+            if result is not None:
+                return result
+            print("  -> HTTP yanıtında veri bulunamadı, tarayıcıya geçiliyor...")
+        return self.fetch_browser(validators)
+
+    def fetch_browser(self, validators: dict | None = None) -> dict:
+        """Sayfayı doğrudan tarayıcıyla çeker (bkz. fetch)."""
+        return self._fetch_browser(validators or {})
+
+    def inspect(self, html: str, previous_digest: str | None = None) -> dict | None:
+        """
+        Düz HTTP ile alınmış sayfayı tek ayrıştırmada işler: gerekli düğümleri kontrol
+        eder, değişiklik özetini hesaplar ve sayfa değiştiyse veriyi çıkarır.
+        :return: Gerekli veri yoksa None, aksi halde {'digest', 'unchanged', 'data'}
+                 ('unchanged' True ise 'data' None'dır).
+        """
+        soup = self.make_soup(html)
+        if not self.has_required_data(soup):
+            return None
+        digest = self._digest("http", [str(soup.select_one(selector)) for selector in self._change_selectors])
+        if digest == previous_digest:
+            return {'digest': digest, 'unchanged': True, 'data': None}
+        return {'digest': digest, 'unchanged': False, 'data': self.extract(soup)}
+
+    def fetch_html(self) -> str:
+        """
+        Belirtilen URL'nin ham HTML içeriğini çeker.
+        Site destekliyorsa önce düz HTTP denenir, olmazsa Selenium kullanılır.
+        """
+        return self.fetch()['html']
 
     def get_page_content(self) -> BeautifulSoup:
         """
-        Belirtilen URL'nin HTML içeriğini Selenium ile çeker ve BeautifulSoup nesnesi olarak döndürür.
+        Belirtilen URL'nin HTML içeriğini çeker ve BeautifulSoup nesnesi olarak döndürür.
         """
+        return self.make_soup(self.fetch_html())
+
+    @property
+    def _change_selectors(self) -> tuple[str, ...]:
+        return self.change_selectors or self.required_selectors
+
+    @staticmethod
+    def _digest(source: str, fragments: list[str]) -> str:
+        # HTTP ve tarayıcı aynı bölgeyi farklı serileştirdiği için özet kaynağıyla birlikte saklanır
+        return f"{source}:" + hashlib.sha1("\n".join(fragments).encode('utf-8')).hexdigest()
+
+    def _fetch_http(self, validators: dict, verify: bool = True) -> dict | None:
+        print("  -> Sayfa HTTP ile yükleniyor...")
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        with metrics.timer('http_fetch'):
+            response = HttpSessionManager.get(self.url, headers=headers)
+        if response is None:
+            return None
+        page_metrics = {'bytes': len(response.content), 'requests': 1,
+                        'load_ms': response.elapsed.total_seconds() * 1000}
+        if response.status_code == 304:
+            return {'html': None, 'unchanged': True, 'validators': validators, 'metrics': page_metrics,
+                    'verified': True}
+        if not response.ok:
+            print(f"  -> HTTP isteği başarısız: {response.status_code}")
+            return None
+
+        html = response.text
+        new_validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'digest': None,
+        }
+        if not verify:
+            # Kontrol ayrıştırma aşamasına bırakılır; sayfa iki kez ayrıştırılmaz
+            return {'html': html, 'unchanged': False, 'validators': new_validators, 'metrics': page_metrics,
+                    'verified': False}
+        soup = self.make_soup(html)
+        if not self.has_required_data(soup):
+            return None
+        new_validators['digest'] = self._digest(
+            "http", [str(soup.select_one(selector)) for selector in self._change_selectors])
+        return {'html': html, 'unchanged': new_validators['digest'] == validators.get('digest'),
+                'validators': new_validators, 'metrics': page_metrics, 'verified': True}
+
+    def _fetch_browser(self, validators: dict) -> dict:
         retries = 2
         for attempt in range(retries):
             try:
                 print(f"  -> Sayfa yükleniyor (Deneme {attempt + 1}/{retries})...")
-                self.driver.get(self.url)
-                # Sayfanın dinamik içeriğinin yüklenmesi için bir süre bekleyelim
-                time.sleep(5) 
-                return BeautifulSoup(self.driver.page_source, 'html.parser')
+                # Tarayıcı havuzdan ödünç alınır, sadece gerçekten ihtiyaç duyulduğunda başlatılır
+                with WebDriverManager.driver() as driver:
+                    resource_blocking.apply_blocking(driver, self.blocked_resources())
+                    host = get_host(self.url)
+                    CookieStore.inject_into_driver(driver, host)
+                    with metrics.timer('page_load'):
+                        driver.get(self.url)
+                        self._wait_until_ready(driver)
+                    CookieStore.collect_from_driver(driver, host, self.url)
+                    page_metrics = resource_blocking.collect_page_metrics(driver)
+                    if page_metrics:
+                        print(f"  -> Sayfa: {resource_blocking.format_metrics(page_metrics)}")
+                    digest = self._browser_region_digest(driver)
+                    if digest is not None and digest == validators.get('digest'):
+                        # Büyük sayfa kaynağını tarayıcıdan hiç aktarmadan çık
+                        return {'html': None, 'unchanged': True, 'validators': validators, 'metrics': page_metrics,
+                                'verified': True}
+                    return {'html': driver.page_source, 'unchanged': False, 'validators': {'digest': digest},
+                            'metrics': page_metrics, 'verified': True}
             except Exception as e:
                 print(f"  -> Sayfa yükleme hatası (Deneme {attempt + 1}): {e}")
                 if attempt < retries - 1:
-                    time.sleep(5)
+                    time.sleep(constants.PAGE_RETRY_DELAY)
                 else:
                     raise ScraperError(f"Tüm denemelerden sonra URL yüklenemedi: {self.url}")
 
+    def _browser_region_digest(self, driver) -> str | None:
+        """İlgili bölgelerin outerHTML'inin özetini tarayıcı içinde toplayarak hesaplar."""
+        selectors = self._change_selectors
+        if not selectors:
+            return None
+        fragments = driver.execute_script(
+            "return arguments[0].map(function (s) {"
+            "  var el = document.querySelector(s); return el ? el.outerHTML : '';"
+            "});",
+            list(selectors),
+        )
+        if not any(fragments):
+            return None
+        return self._digest("browser", fragments)
+
+    def _is_ready(self, driver) -> bool:
+        return all(driver.find_elements(By.CSS_SELECTOR, selector) for selector in self.required_selectors)
+
+    def _wait_until_ready(self, driver):
+        """
+        Gerekli düğümler DOM'da belirene kadar bekler (en fazla `page_ready_timeout` saniye).
+        Süre dolarsa mevcut sayfa ile devam edilir; eksik veri scrape aşamasında raporlanır.
+        """
+        if not self.required_selectors:
+            return
+        try:
+            WebDriverWait(driver, self.page_ready_timeout, poll_frequency=constants.PAGE_READY_POLL_INTERVAL) \
+                .until(self._is_ready)
+        except TimeoutException:
+            print(f"  -> Sayfa {self.page_ready_timeout:.0f} sn içinde hazır olmadı, mevcut içerikle devam ediliyor.")
+
     # ... clean_price metodu aynı kalıyor ...
     @staticmethod
     def clean_price(price_text: str) -> float:
@@ -91,6 +266,26 @@ class BaseScraper(ABC):
         except (ValueError, TypeError):
             return 0.0
 
-    @abstractmethod
+    def parse(self, html: str) -> dict:
+        """Ham HTML'den ürün verisini çıkarır. Ağ veya tarayıcı erişimi yapmaz."""
+        return self.extract(self.make_soup(html))
+
     def scrape(self) -> dict:
-        pass
\ No newline at end of file
+        """Sayfayı çeker ve ürün verisini ({'name': ..., 'price': ...}) döndürür."""
+        return self.parse(self.fetch_html())
+
+    @abstractmethod
+    def extract(self, soup: BeautifulSoup) -> dict:
+        pass
+
+
+def parse_page(scraper_cls: type, url: str, html: str) -> dict:
+    """
+    Ayrıştırma işini ayrı bir süreçte (ProcessPoolExecutor) çalıştırabilmek için
+    modül seviyesinde tanımlanmış yardımcı fonksiyon.
+    """
+    return scraper_cls(url).parse(html)
+
+def inspect_page(scraper_cls: type, url: str, html: str, previous_digest: str | None) -> dict | None:
+    """BaseScraper.inspect'in süreç havuzunda çalıştırılabilen karşılığı."""
+    return scraper_cls(url).inspect(html, previous_digest)
\ No newline at end of file
@@ -0,0 +1,206 @@
+# src/scraping/cookie_store.py
+
+import json
+import os
+import threading
+import time
+from http.cookiejar import Cookie
+from pathlib import Path
+from ..utils import constants
+
+class CookieStore:
+    """
+    Site (host) başına kalıcı çerez kavanozu. Tarayıcı (CDP) ve düz HTTP
+    (requests.Session) yolları aynı çerezleri kullanır; böylece bir sitede
+    kabul edilmiş çerez izni, oturum ve bot doğrulama çerezleri sonraki
+    çalıştırmalarda ve diğer yolda da geçerli olur.
+
+    Çerezler CDP biçiminde saklanır: {'name', 'value', 'domain', 'path',
+    'expires', 'secure', 'httpOnly', 'sameSite', 'saved_at'}. Süresi dolmuş
+    çerezler yüklenirken atılır; okunamayan (bozuk) dosyalar kenara alınır.
+    """
+    _lock = threading.Lock()
+    _jars = {}          # host -> {(name, domain, path): çerez}
+    _versions = {}      # host -> değişiklik sayacı
+    _enabled = True
+
+    @classmethod
+    def configure(cls, enabled: bool):
+        cls._enabled = enabled
+
+    @classmethod
+    def _path(cls, host: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in ".-" else "_" for c in host)
+        return constants.COOKIE_DIR / f"{safe}.json"
+
+    @staticmethod
+    def _key(cookie: dict) -> tuple:
+        return (cookie['name'], cookie.get('domain', ''), cookie.get('path', '/'))
+
+    @staticmethod
+    def _is_live(cookie: dict, now: float) -> bool:
+        expires = cookie.get('expires') or 0
+        if expires > 0:
+            return expires > now
+        # Oturum çerezi: tarayıcı kapanınca silinirdi, burada en fazla COOKIE_SESSION_MAX_AGE tutulur
+        return now - cookie.get('saved_at', now) < constants.COOKIE_SESSION_MAX_AGE
+
+    @classmethod
+    def _jar(cls, host: str) -> dict:
+        """Kilit altında çağrılmalıdır."""
+        if host in cls._jars:
+            return cls._jars[host]
+        path = cls._path(host)
+        cookies = []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            if not isinstance(cookies, list):
+                raise ValueError("çerez listesi bekleniyordu")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Çerez dosyası okunamadı, yok sayılıyor ({path.name}): {e}")
+            try:
+                os.replace(path, path.with_suffix(".corrupt"))
+            except OSError:
+                pass
+            cookies = []
+        now = time.time()
+        jar = {}
+        for cookie in cookies:
+            if isinstance(cookie, dict) and 'name' in cookie and 'value' in cookie and cls._is_live(cookie, now):
+                jar[cls._key(cookie)] = cookie
+        cls._jars[host] = jar
+        cls._versions.setdefault(host, 0)
+        return jar
+
+    @classmethod
+    def _save(cls, host: str, jar: dict):
+        """Kilit altında çağrılmalıdır. Dosya atomik olarak yazılır."""
+        path = cls._path(host)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(list(jar.values()), f, ensure_ascii=False)
+            os.replace(temp, path)
+        except OSError as e:
+            print(f"Çerezler kaydedilemedi ({host}): {e}")
+
+    @classmethod
+    def get(cls, host: str) -> tuple[int, list[dict]]:
+        """:return: (sürüm, süresi dolmamış çerezler)"""
+        if not cls._enabled:
+            return 0, []
+        with cls._lock:
+            jar = cls._jar(host)
+            now = time.time()
+            return cls._versions[host], [cookie for cookie in jar.values() if cls._is_live(cookie, now)]
+
+    @classmethod
+    def update(cls, host: str, cookies: list[dict]):
+        """Yeni çerezleri kavanozla birleştirir (aynı ad/alan/yol için yenisi geçerlidir) ve kaydeder."""
+        if not cls._enabled or not cookies:
+            return
+        now = time.time()
+        with cls._lock:
+            jar = cls._jar(host)
+            changed = False
+            for cookie in cookies:
+                cookie = {**cookie, 'saved_at': now}
+                key = cls._key(cookie)
+                previous = jar.get(key)
+                if previous is not None and previous.get('value') == cookie['value'] \
+                        and previous.get('expires') == cookie.get('expires'):
+                    continue
+                jar[key] = cookie
+                changed = True
+            for key in [key for key, cookie in jar.items() if not cls._is_live(cookie, now)]:
+                del jar[key]
+                changed = True
+            if changed:
+                cls._versions[host] += 1
+                cls._save(host, jar)
+
+    # --- Tarayıcı (CDP) ---
+
+    @classmethod
+    def inject_into_driver(cls, driver, host: str):
+        """Kavanozdaki çerezleri sayfa açılmadan önce tarayıcıya yükler (değiştiyse)."""
+        version, cookies = cls.get(host)
+        injected = getattr(driver, '_pricepal_cookie_versions', {})
+        if not cookies or injected.get(host) == version:
+            return
+        allowed = ('name', 'value', 'domain', 'path', 'expires', 'secure', 'httpOnly', 'sameSite')
+        params = []
+        for cookie in cookies:
+            param = {key: cookie[key] for key in allowed if cookie.get(key) not in (None, '')}
+            if param.get('expires', 0) <= 0:
+                param.pop('expires', None)
+            params.append(param)
+        try:
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+            injected[host] = version
+            driver._pricepal_cookie_versions = injected
+        except Exception as e:
+            print(f"  -> Çerezler tarayıcıya yüklenemedi: {e}")
+
+    @classmethod
+    def collect_from_driver(cls, driver, host: str, url: str):
+        """Sayfa yüklendikten sonra tarayıcının bu adres için tuttuğu çerezleri kavanoza alır."""
+        if not cls._enabled:
+            return
+        try:
+            result = driver.execute_cdp_cmd('Network.getCookies', {'urls': [url]})
+        except Exception as e:
+            print(f"  -> Tarayıcı çerezleri okunamadı: {e}")
+            return
+        keys = ('name', 'value', 'domain', 'path', 'expires', 'secure', 'httpOnly', 'sameSite')
+        cls.update(host, [{key: cookie.get(key) for key in keys} for cookie in result.get('cookies', [])])
+        # Tarayıcıdaki güncel hal kavanozla aynı; aynı sürümün tekrar yüklenmesine gerek yok
+        version, _ = cls.get(host)
+        injected = getattr(driver, '_pricepal_cookie_versions', {})
+        injected[host] = version
+        driver._pricepal_cookie_versions = injected
+
+    # --- Düz HTTP (requests) ---
+
+    @staticmethod
+    def _matches(domain: str, host: str) -> bool:
+        """Çerez alan adı host'un kendisi, alt alan adı veya üst alan adıysa True (nokta sınırıyla)."""
+        return domain == host or domain.endswith("." + host) or host.endswith("." + domain)
+
+    @classmethod
+    def apply_to_session(cls, session, host: str):
+        """Kavanozdaki çerezleri requests oturumunun çerez kavanozuna ekler."""
+        _, cookies = cls.get(host)
+        for cookie in cookies:
+            expires = cookie.get('expires') or 0
+            session.cookies.set_cookie(Cookie(
+                version=0, name=cookie['name'], value=cookie['value'], port=None, port_specified=False,
+                domain=cookie.get('domain', ''), domain_specified=bool(cookie.get('domain')),
+                domain_initial_dot=cookie.get('domain', '').startswith('.'),
+                path=cookie.get('path', '/'), path_specified=True, secure=bool(cookie.get('secure')),
+                expires=int(expires) if expires > 0 else None, discard=expires <= 0,
+                comment=None, comment_url=None, rest={},
+            ))
+
+    @classmethod
+    def collect_from_session(cls, session, host: str):
+        """requests oturumunun bu siteye ait çerezlerini kavanoza alır."""
+        if not cls._enabled:
+            return
+        # Oturum tüm fetch iş parçacıklarınca paylaşılır; kavanoz kilidi olmadan gezilirse
+        # eşzamanlı bir istek "dictionary changed size during iteration" hatası verdirebilir
+        with session.cookies._cookies_lock:
+            jar = list(session.cookies)
+        cookies = []
+        for cookie in jar:
+            if not cls._matches(cookie.domain.lstrip('.'), host):
+                continue
+            cookies.append({
+                'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path,
+                'expires': cookie.expires or -1, 'secure': bool(cookie.secure),
+            })
+        cls.update(host, cookies)
@@ -1,6 +1,7 @@
 # src/scraping/hepsiburada_scraper.py (YENİ VE GÜVENİLİR HALİ)
 
 import json
+from bs4 import SoupStrainer
 from .base_scraper import BaseScraper
 from ..utils.exceptions import ProductNameNotFoundError, PriceNotFoundError, ScraperError
 
@@ -10,10 +11,13 @@ class HepsiburadaScraper(BaseScraper):
     JSON verisini okuyarak gerçekleştirir. Bu yöntem, HTML değişikliklerine
     karşı daha dayanıklıdır.
     """
+    # reduxStore JSON'u sunucu tarafında HTML'e gömülü geldiği için tarayıcıya gerek yok
+    supports_http = True
+    required_selectors = ("script#reduxStore",)
+    # Sayfadan sadece veri bloğunu içeren script etiketi ayrıştırılır
+    parse_only = SoupStrainer("script", id="reduxStore")
 
-    def scrape(self) -> dict:
-        soup = self.get_page_content()
-
+    def extract(self, soup) -> dict:
         # 1. Sayfa içindeki veri bloğunu (JSON) içeren script etiketini bul.
         # Bu etiket genellikle "reduxStore" veya benzeri bir ID'ye sahiptir.
         script_tag = soup.find("script", id="reduxStore")
@@ -0,0 +1,63 @@
+# src/scraping/http_transport.py
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .cookie_store import CookieStore
+from ..utils.url_utils import get_host
+from ..utils import constants
+
+class HttpSessionManager:
+    """
+    Sunucu tarafında oluşturulan (server-rendered) sayfalar için, tarayıcı
+    açmadan düz HTTP ile içerik çeken ortak bir requests.Session yönetir.
+    Bağlantılar keep-alive ile havuzda tutulur ve tekrar kullanılır.
+    """
+    _session = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        with cls._lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=constants.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=constants.HTTP_POOL_MAXSIZE,
+                    max_retries=0,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "User-Agent": constants.DEFAULT_USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
+                })
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def get(cls, url: str, headers: dict | None = None,
+            timeout: float = constants.HTTP_TIMEOUT) -> requests.Response | None:
+        """
+        URL'ye düz HTTP GET isteği yapar (koşullu istek başlıkları `headers` ile verilebilir).
+        Sitenin kalıcı çerezleri (bkz. CookieStore) isteğe eklenir, yanıtta gelenler kaydedilir.
+        :return: Yanıt nesnesi (durum kodu ne olursa olsun) veya bağlantı hatasında None.
+        """
+        session = cls.get_session()
+        host = get_host(url)
+        CookieStore.apply_to_session(session, host)
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"  -> HTTP isteği başarısız: {e}")
+            return None
+        CookieStore.collect_from_session(session, host)
+        return response
+
+    @classmethod
+    def close_session(cls):
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
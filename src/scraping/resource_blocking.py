@@ -0,0 +1,75 @@
+# src/scraping/resource_blocking.py
+
+# Tarayıcıda ürün adı ve fiyatı okumak için gerekmeyen kaynakların engellenmesi.
+# Havuzdaki tarayıcılar farklı siteler arasında paylaşıldığı için engelleme, açılışta
+# sabitlenen Chrome tercihleri yerine her sayfadan önce CDP (Network.setBlockedURLs)
+# ile ayarlanır; böylece her site kendi profilini ve izin listesini kullanabilir.
+
+IMAGES = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico")
+FONTS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+MEDIA = ("*.mp4", "*.webm", "*.m3u8", "*.mp3")
+STYLESHEETS = ("*.css",)
+TRACKERS = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+    "*doubleclick.net*", "*adservice.google.*", "*facebook.net*", "*connect.facebook.*",
+    "*hotjar.com*", "*criteo.*", "*scorecardresearch.com*", "*newrelic.com*", "*nr-data.net*",
+    "*clarity.ms*", "*tiktok.com*", "*adjust.com*", "*segment.io*",
+)
+
+# Profil adı -> engellenecek URL kalıpları (ayar: 'browser_block_profile')
+BLOCK_PROFILES = {
+    'off': (),
+    'light': IMAGES + MEDIA,
+    'standard': IMAGES + MEDIA + FONTS + TRACKERS,
+    'aggressive': IMAGES + MEDIA + FONTS + TRACKERS + STYLESHEETS,
+}
+
+# Sayfanın aktarılan bayt, istek sayısı ve yüklenme süresini Performance API ile ölçer.
+# Zamanlama izni (Timing-Allow-Origin) vermeyen üçüncü taraf kaynakların boyutu 0
+# raporlandığı için bayt değeri yaklaşıktır.
+PAGE_METRICS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = nav ? nav.transferSize : 0;
+for (var i = 0; i < resources.length; i++) { bytes += resources[i].transferSize || 0; }
+return {
+    bytes: bytes,
+    requests: resources.length + 1,
+    load_ms: nav && nav.domContentLoadedEventEnd ? nav.domContentLoadedEventEnd - nav.startTime : performance.now(),
+    ready_ms: performance.now()
+};
+"""
+
+def blocked_patterns(profile: str, allowlist: tuple[str, ...] = ()) -> list[str]:
+    """
+    Profilin engellediği kalıplardan sitenin izin listesindekileri çıkarır.
+    Bilinmeyen profil adı 'off' olarak değerlendirilir.
+    """
+    patterns = BLOCK_PROFILES.get(profile)
+    if patterns is None:
+        print(f"Bilinmeyen kaynak engelleme profili '{profile}', engelleme yapılmıyor.")
+        patterns = ()
+    return [pattern for pattern in patterns if pattern not in allowlist]
+
+def apply_blocking(driver, patterns: list[str]):
+    """
+    Sürücünün bir sonraki sayfa yüklemesinde engelleyeceği kalıpları ayarlar.
+    Aynı kalıplar zaten uygulanmışsa CDP çağrısı yapılmaz.
+    """
+    if getattr(driver, '_pricepal_blocked_patterns', None) == patterns:
+        return
+    if not hasattr(driver, '_pricepal_blocked_patterns'):
+        driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    driver._pricepal_blocked_patterns = patterns
+
+def collect_page_metrics(driver) -> dict | None:
+    """:return: {'bytes', 'requests', 'load_ms', 'ready_ms'} veya ölçülemezse None."""
+    try:
+        return driver.execute_script(PAGE_METRICS_JS)
+    except Exception as e:
+        print(f"  -> Sayfa ölçümleri alınamadı: {e}")
+        return None
+
+def format_metrics(metrics: dict) -> str:
+    return f"{metrics['bytes'] / 1024:.0f} KB, {metrics['requests']} istek, {metrics['load_ms']:.0f} ms"
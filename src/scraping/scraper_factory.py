@@ -1,27 +1,145 @@
 # src/scraping/scraper_factory.py
 
-from .base_scraper import BaseScraper
-from .amazon_scraper import AmazonScraper
-from .hepsiburada_scraper import HepsiburadaScraper
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING
+from ..utils.url_utils import get_host
 from ..utils.exceptions import UnsupportedSiteError
 
-def get_scraper(url: str) -> BaseScraper:
+if TYPE_CHECKING:
+    from .base_scraper import BaseScraper
+
+# Harici site eklentilerinin kaydolduğu entry point grubu. Eklenti paketi şöyle bildirir:
+#   [project.entry-points."pricepal.scrapers"]
+#   "trendyol.com" = "pricepal_trendyol.scraper:TrendyolScraper"
+ENTRY_POINT_GROUP = "pricepal.scrapers"
+
+# Yerleşik siteler: host -> 'modul:Sinif'. Modüller ilk kullanımda yüklenir.
+# Yeni bir site için buraya bir satır eklemek yeterlidir.
+BUILTIN_SCRAPERS = {
+    "amazon.com.tr": ".amazon_scraper:AmazonScraper",
+    "hepsiburada.com": ".hepsiburada_scraper:HepsiburadaScraper",
+}
+
+class ScraperRegistry:
+    """
+    Host adına göre indekslenmiş scraper kaydı. Arama, URL'nin host adı ve
+    üst alan adları ('m.hepsiburada.com' -> 'hepsiburada.com') için sözlükte
+    yapılır; site sayısı arttıkça yavaşlamaz.
+
+    Kayıtlar 'modul:Sinif' yolu (veya entry point) olarak tutulur ve sınıf
+    yalnızca o siteye ait ilk URL istendiğinde içe aktarılır. Entry point'ler
+    de ilk aramada bir kez taranır; bu sayede uygulama açılışı etkilenmez.
+    """
+    _lock = threading.Lock()
+    _targets = dict(BUILTIN_SCRAPERS)   # host -> 'modul:Sinif' veya EntryPoint
+    _classes = {}                       # host -> yüklenmiş scraper sınıfı
+    _plugins_loaded = False
+
+    @classmethod
+    def register(cls, host: str, target):
+        """
+        Bir siteyi kaydeder (var olan kaydın üzerine yazar).
+        :param target: 'modul:Sinif' yolu veya BaseScraper alt sınıfı.
+        """
+        host = host.lower().removeprefix("www.")
+        with cls._lock:
+            cls._targets[host] = target
+            cls._classes.pop(host, None)
+
+    @classmethod
+    def _load_plugins(cls):
+        """Kilit altında çağrılmalıdır. Yerleşik siteler eklentilerce ezilmez."""
+        if cls._plugins_loaded:
+            return
+        cls._plugins_loaded = True
+        try:
+            plugins = entry_points(group=ENTRY_POINT_GROUP)
+        except Exception as e:
+            print(f"Scraper eklentileri taranamadı: {e}")
+            return
+        for plugin in plugins:
+            cls._targets.setdefault(plugin.name.lower().removeprefix("www."), plugin)
+
+    @classmethod
+    def _find_host(cls, url: str) -> str | None:
+        """Kilit altında çağrılmalıdır. :return: Kayıtlı en yakın host veya None."""
+        cls._load_plugins()
+        host = get_host(url)
+        while host:
+            if host in cls._targets:
+                return host
+            _, _, host = host.partition(".")
+        return None
+
+    @classmethod
+    def match(cls, url: str) -> str | None:
+        """
+        URL'nin eşleştiği kayıtlı host'u hiçbir modül yüklemeden döndürür
+        (örn. 'https://m.hepsiburada.com/x' -> 'hepsiburada.com').
+        Ürünlerin 'site' sütununa bu değer yazılır.
+        :return: Kayıtlı host veya site desteklenmiyorsa None.
+        """
+        with cls._lock:
+            return cls._find_host(url)
+
+    @classmethod
+    def is_supported(cls, url: str) -> bool:
+        """URL'nin desteklenen bir siteye ait olup olmadığını, hiçbir modül yüklemeden söyler."""
+        return cls.match(url) is not None
+
+    @classmethod
+    def get_class(cls, url: str) -> type["BaseScraper"]:
+        """
+        :raises UnsupportedSiteError: URL kayıtlı bir siteye ait değilse veya
+                                      sitenin scraper'ı yüklenemezse.
+        """
+        with cls._lock:
+            host = cls._find_host(url)
+            if host is None:
+                raise UnsupportedSiteError(f"'{url}' adresine sahip site desteklenmiyor.")
+            scraper_class = cls._classes.get(host)
+            if scraper_class is not None:
+                return scraper_class
+            target = cls._targets[host]
+        # Modül (ve Selenium) kilit dışında yüklenir; yükleme sürerken GUI'deki
+        # is_supported()/get_site() çağrıları beklemez. İçe aktarma kendi kilidiyle korunur.
+        scraper_class = cls._import(target, host)
+        with cls._lock:
+            # Bu arada kayıt değiştiyse yüklenen sınıf önbelleğe alınmaz
+            if cls._targets.get(host) is target:
+                cls._classes[host] = scraper_class
+        return scraper_class
+
+    @staticmethod
+    def _import(target, host: str) -> type:
+        try:
+            if isinstance(target, type):
+                return target
+            if isinstance(target, str):
+                module_name, class_name = target.split(":")
+                return getattr(importlib.import_module(module_name, __package__), class_name)
+            return target.load()  # EntryPoint
+        except Exception as e:
+            raise UnsupportedSiteError(f"'{host}' sitesinin scraper'ı yüklenemedi: {e}")
+
+def is_supported(url: str) -> bool:
+    """Verilen URL için bir scraper bulunup bulunmadığını döndürür (tarayıcı başlatmaz)."""
+    return ScraperRegistry.is_supported(url)
+
+def get_site(url: str) -> str | None:
+    """URL'nin ait olduğu desteklenen sitenin kayıtlı host adı (bkz. ScraperRegistry.match)."""
+    return ScraperRegistry.match(url)
+
+def get_scraper(url: str) -> "BaseScraper":
     """
-    Verilen URL'nin domain'ine göre uygun Scraper sınıfını döndürür.
+    Verilen URL'nin host adına göre uygun Scraper sınıfını döndürür.
+    Scraper oluşturmak tarayıcı başlatmaz; tarayıcı havuzdan yalnızca
+    sayfa çekilirken ödünç alınır.
 
     :param url: Ürünün web adresi.
     :raises UnsupportedSiteError: Eğer URL desteklenen sitelerden birine ait değilse.
     :return: URL için uygun olan BaseScraper alt sınıfının bir örneği.
     """
-    url_low = url.lower()
-
-    if "amazon.com.tr" in url_low:
-        return AmazonScraper(url)
-    elif "hepsiburada.com" in url_low:
-        return HepsiburadaScraper(url)
-    # Gelecekte yeni siteler için buraya 'elif' blokları eklenecek
-    # elif "trendyol.com" in url_low:
-    #     return TrendyolScraper(url)
-    
-    else:
-        raise UnsupportedSiteError(f"'{url}' adresine sahip site desteklenmiyor.")
\ No newline at end of file
+    return ScraperRegistry.get_class(url)(url)
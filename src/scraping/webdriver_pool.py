@@ -0,0 +1,408 @@
+# src/scraping/webdriver_pool.py
+
+import os
+import shutil
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from ..utils.exceptions import ScraperError
+from ..utils import constants, metrics
+from ..utils.file_lock import FileLock
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+class WebDriverManager:
+    """
+    Selenium WebDriver'ları sınırlı boyutlu bir havuz olarak yönetir.
+    Her sürücü aynı anda yalnızca bir iş parçacığına ödünç verilir
+    (checkout/checkin); böylece N ürün aynı anda kontrol edilebilir.
+
+    Her sürücünün sunduğu sayfa sayısı ve (psutil kuruluysa) tarayıcı süreç
+    ağacının bellek kullanımı izlenir. Sınır aşılırsa sürücü iade edilirken
+    kapatılır ve bir sonraki ödünç almada yenisi başlatılır; yani yeniden
+    başlatma her zaman iki ürün arasında olur, bir sayfa işlenirken asla.
+    """
+    _pool_size = constants.DEFAULT_DRIVER_POOL_SIZE
+    _idle = []        # Boşta bekleyen sürücüler (son giren ilk çıkar)
+    _all = set()      # Havuza ait tüm sürücüler (boşta + ödünç verilmiş)
+    _reserved = 0     # Şu anda başlatılmakta olan sürücü sayısı
+    _pages = {}       # Sürücü -> sunduğu sayfa sayısı
+    _max_pages = constants.DEFAULT_DRIVER_MAX_PAGES
+    _max_rss_mb = constants.DEFAULT_DRIVER_MAX_RSS_MB
+    _psutil_warned = False
+    _persistent_profiles = True
+    _slots = {}       # Sürücü -> kullandığı kalıcı profil yuvası
+    _slot_locks = {}  # Bu sürecin tuttuğu yuva -> süreçler arası yuva kilidi
+    _cond = threading.Condition()
+    _driver_path = None   # Çözümlenmiş chromedriver yolu
+    _driver_path_lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, pool_size: int, max_pages: int | None = None, max_rss_mb: float | None = None,
+                  persistent_profiles: bool | None = None):
+        """
+        Havuzun en fazla kaç tarayıcı açabileceğini, tarayıcıların yeniden
+        başlatılma sınırlarını (0: sınır yok) ve kalıcı profil kullanımını belirler.
+        """
+        with cls._cond:
+            cls._pool_size = max(1, int(pool_size))
+            if persistent_profiles is not None:
+                cls._persistent_profiles = persistent_profiles
+            if max_pages is not None:
+                cls._max_pages = max(0, int(max_pages))
+            if max_rss_mb is not None:
+                cls._max_rss_mb = max(0.0, float(max_rss_mb))
+            if cls._max_rss_mb and psutil is None and not cls._psutil_warned:
+                cls._psutil_warned = True
+                print("Uyarı: psutil kurulu değil; 'driver_max_rss_mb' bellek sınırı uygulanamıyor "
+                      "(pip install psutil).")
+            cls._cond.notify_all()
+
+    @classmethod
+    def _resolve_driver_path(cls, refresh: bool = False) -> str:
+        """
+        chromedriver yolunu döndürür. ChromeDriverManager().install() ağ isteği yaptığı
+        için süreç başına bir kez çağrılır ve sonuç CHROMEDRIVER_PATH_CACHE dosyasında
+        saklanır; sonraki süreçler dosya hâlâ mevcutsa doğrudan onu kullanır.
+        :param refresh: True ise önbellek yok sayılıp sürücü yeniden çözümlenir.
+        """
+        with cls._driver_path_lock:
+            if cls._driver_path is not None and not refresh:
+                return cls._driver_path
+            cache_file = constants.CHROMEDRIVER_PATH_CACHE
+            if not refresh:
+                try:
+                    cached = cache_file.read_text(encoding='utf-8').strip()
+                    if cached and os.path.isfile(cached):
+                        cls._driver_path = cached
+                        return cached
+                except OSError:
+                    pass
+            path = ChromeDriverManager().install()
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(path, encoding='utf-8')
+            except OSError as e:
+                print(f"chromedriver yolu önbelleğe yazılamadı: {e}")
+            cls._driver_path = path
+            return path
+
+    @classmethod
+    def _profile_dir(cls, slot: int):
+        return constants.BROWSER_PROFILE_DIR / f"slot-{slot}"
+
+    @classmethod
+    def _acquire_slot(cls) -> int | None:
+        """
+        Boştaki en küçük profil yuvasını ayırır. Chrome aynı profil dizinini iki
+        süreçte açamadığı için aynı anda çalışan her tarayıcının kendi yuvası vardır;
+        yeniden başlatılan tarayıcı boşalan yuvayı ve dolayısıyla profilini devralır.
+        Yuvalar süreçler arası dosya kilidiyle ayrılır (örn. daemon ve GUI aynı anda
+        çalışırken); canlı bir Chrome'un hâlâ kullandığı profiller de atlanır.
+        :return: Yuva numarası veya kalıcı profil kullanılamıyorsa None.
+        """
+        if not cls._persistent_profiles:
+            return None
+        with cls._cond:
+            try:
+                constants.BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+                for slot in range(constants.MAX_BROWSER_PROFILE_SLOTS):
+                    if slot in cls._slot_locks:
+                        continue
+                    lock = FileLock(constants.BROWSER_PROFILE_DIR / f"slot-{slot}.lock")
+                    if not lock.acquire():
+                        continue
+                    if cls._profile_in_use(cls._profile_dir(slot)):
+                        # Kapanmamış eski bir Chrome (örn. çöken bir süreçten kalan) profili tutuyor
+                        lock.release()
+                        continue
+                    cls._slot_locks[slot] = lock
+                    return slot
+            except OSError as e:
+                print(f"Tarayıcı profil dizini kullanılamıyor: {e}")
+                return None
+        print("Boş tarayıcı profil yuvası bulunamadı, geçici profil kullanılıyor.")
+        return None
+
+    @classmethod
+    def _release_slot(cls, driver=None, slot: int | None = None):
+        with cls._cond:
+            if driver is not None:
+                slot = cls._slots.pop(driver, None)
+            lock = cls._slot_locks.pop(slot, None)
+        if lock is not None:
+            lock.release()
+
+    @staticmethod
+    def _profile_in_use(profile_dir) -> bool:
+        """
+        Profilin canlı bir Chrome süreci tarafından kullanılıp kullanılmadığını
+        Chrome'un kendi kilidinden anlar. Emin olunamıyorsa kullanımda sayılır.
+        """
+        if os.name == 'nt':
+            # Windows'ta Chrome çalışırken profildeki 'lockfile' silinemez
+            lockfile = profile_dir / "lockfile"
+            try:
+                lockfile.unlink()
+            except FileNotFoundError:
+                return False
+            except OSError:
+                return True
+            return False
+        try:
+            # Linux/macOS: SingletonLock, 'hostname-pid' hedefli bir sembolik bağdır
+            target = os.readlink(profile_dir / "SingletonLock")
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True
+        host, _, pid = target.rpartition("-")
+        if host != socket.gethostname() or not pid.isdigit():
+            return True  # Başka bir makineden (paylaşılan ev dizini) tutuluyor olabilir
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            return True  # Süreç var ama sinyal izni yok
+        return True
+
+    @staticmethod
+    def _clear_stale_locks(profile_dir):
+        """Ölü bir Chrome'dan kalan tekil kilit dosyalarını siler (profil verisine dokunmaz)."""
+        for name in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+            try:
+                os.unlink(profile_dir / name)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Eski tarayıcı kilidi silinemedi ({name}): {e}")
+
+    @staticmethod
+    def _is_profile_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return "user data directory" in message or "user-data-dir" in message or "profile" in message
+
+    @classmethod
+    def _create_driver(cls):
+        slot = cls._acquire_slot()
+        profile_dir = None if slot is None else cls._profile_dir(slot)
+        try:
+            try:
+                driver = cls._start_chrome(profile_dir)
+            except ScraperError as e:
+                # Profil yalnızca hata profille ilgiliyse ve onu hiçbir canlı süreç kullanmıyorsa onarılır
+                if profile_dir is None or not cls._is_profile_error(e) or cls._profile_in_use(profile_dir):
+                    raise
+                print(f"Tarayıcı profili ({profile_dir.name}) açılamadı, eski kilitler temizleniyor...")
+                cls._clear_stale_locks(profile_dir)
+                try:
+                    driver = cls._start_chrome(profile_dir)
+                except ScraperError as e:
+                    if not cls._is_profile_error(e) or cls._profile_in_use(profile_dir):
+                        raise
+                    print(f"Tarayıcı profili ({profile_dir.name}) bozuk, sıfırlanıyor...")
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                    driver = cls._start_chrome(profile_dir)
+        except Exception:
+            cls._release_slot(slot=slot)
+            raise
+        if slot is not None:
+            with cls._cond:
+                cls._slots[driver] = slot
+        return driver
+
+    @classmethod
+    def _start_chrome(cls, profile_dir):
+        print("WebDriver başlatılıyor...")
+        options = Options()
+        if profile_dir is not None:
+            # Çerezler, çerez izinleri ve HTTP önbelleği çalıştırmalar arasında korunur
+            options.add_argument(f"--user-data-dir={profile_dir}")
+            options.add_argument(f"--disk-cache-size={constants.BROWSER_DISK_CACHE_BYTES}")
+        # DOMContentLoaded'da dön; verinin hazır olmasını scraper kendi koşuluyla bekler
+        options.page_load_strategy = 'eager'
+        options.add_argument("--headless")  # Tarayıcıyı arayüz olmadan (arka planda) çalıştırır
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled") # Bot tespitini zorlaştırır
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument(f"user-agent={constants.DEFAULT_USER_AGENT}")
+        options.add_argument('--log-level=3')   
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        started = time.monotonic()
+        try:
+            driver_path = cls._resolve_driver_path()
+            try:
+                driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+            except Exception as e:
+                # Chrome güncellenmiş olabilir; önbellekteki sürücü uyumsuzsa yeniden çözümle
+                print(f"chromedriver ile başlatılamadı, sürücü yeniden çözümleniyor: {e}")
+                refreshed_path = cls._resolve_driver_path(refresh=True)
+                if refreshed_path == driver_path:
+                    raise
+                driver = webdriver.Chrome(service=ChromeService(refreshed_path), options=options)
+            driver.set_page_load_timeout(45) # Sayfa yükleme zaman aşımını artırdık
+            metrics.observe('driver_start', time.monotonic() - started)
+            print("WebDriver başarıyla başlatıldı.")
+            return driver
+        except Exception as e:
+            print(f"WebDriver başlatılamadı: {e}")
+            raise ScraperError(f"WebDriver başlatılamadı: {e}")
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        """Tarayıcı sürecinin hâlâ komutlara yanıt verip vermediğini kontrol eder."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _rss_mb(driver) -> float | None:
+        """chromedriver ve altındaki tüm tarayıcı süreçlerinin toplam RSS'i (MB)."""
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            total = 0
+            for process in [root, *root.children(recursive=True)]:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass  # Ölçüm sırasında kapanan alt süreç
+            return total / (1024 * 1024)
+        except Exception:
+            return None
+
+    @classmethod
+    def _recycle_reason(cls, driver, pages: int) -> str | None:
+        """Sürücünün yeniden başlatılması gerekiyorsa nedenini döndürür."""
+        if cls._max_pages and pages >= cls._max_pages:
+            return f"{pages} sayfa sınırına ulaşıldı"
+        if cls._max_rss_mb:
+            rss = cls._rss_mb(driver)
+            if rss is not None and rss >= cls._max_rss_mb:
+                return f"bellek kullanımı {rss:.0f} MB"
+        return None
+
+    @classmethod
+    def _quit(cls, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"WebDriver kapatılırken hata oluştu: {e}")
+        finally:
+            cls._release_slot(driver)
+
+    @classmethod
+    def checkout(cls, timeout: float | None = None):
+        """
+        Havuzdan kullanıma hazır bir sürücü ödünç alır. Boşta sürücü yoksa ve
+        havuz dolu değilse yenisini başlatır, doluysa bir sürücü iade edilene kadar bekler.
+        :raises ScraperError: Zaman aşımında veya sürücü başlatılamazsa.
+        """
+        with cls._cond:
+            while True:
+                if cls._idle:
+                    driver = cls._idle.pop()
+                    break
+                if len(cls._all) + cls._reserved < cls._pool_size:
+                    cls._reserved += 1
+                    driver = None
+                    break
+                if not cls._cond.wait(timeout):
+                    raise ScraperError("Zaman aşımı: Havuzda boş WebDriver bulunamadı.")
+
+        if driver is not None:
+            if cls._is_healthy(driver):
+                return driver
+            # Çökmüş sürücüyü havuzdan çıkarıp yerine yenisini başlat
+            print("Yanıt vermeyen WebDriver yeniden başlatılıyor...")
+            cls._quit(driver)
+            with cls._cond:
+                cls._all.discard(driver)
+                cls._pages.pop(driver, None)
+                cls._reserved += 1
+
+        # Tarayıcı başlatmak yavaş olduğu için kilit dışında yapılır
+        try:
+            driver = cls._create_driver()
+        except Exception:
+            with cls._cond:
+                cls._reserved -= 1
+                cls._cond.notify()
+            raise
+        with cls._cond:
+            cls._reserved -= 1
+            cls._all.add(driver)
+        return driver
+
+    @classmethod
+    def checkin(cls, driver, discard: bool = False):
+        """
+        Ödünç alınan sürücüyü havuza iade eder. Sayfa veya bellek sınırını aşan
+        sürücü havuza geri konmaz, kapatılır.
+        :param discard: True ise sürücü kapatılır ve havuzdan çıkarılır.
+        """
+        with cls._cond:
+            pages = cls._pages.get(driver, 0) + 1
+        reason = None if discard else cls._recycle_reason(driver, pages)
+        if reason:
+            print(f"WebDriver yeniden başlatılacak ({reason}).")
+        with cls._cond:
+            cls._pages[driver] = pages
+            over_capacity = len(cls._all) > cls._pool_size
+            if discard or reason or over_capacity or driver not in cls._all:
+                cls._all.discard(driver)
+                cls._pages.pop(driver, None)
+                close = True
+            else:
+                cls._idle.append(driver)
+                close = False
+            cls._cond.notify()
+        if close:
+            cls._quit(driver)
+
+    @classmethod
+    @contextmanager
+    def driver(cls, timeout: float | None = None):
+        """`with WebDriverManager.driver() as driver:` şeklinde güvenli ödünç alma."""
+        driver = cls.checkout(timeout)
+        try:
+            yield driver
+        except Exception:
+            # Hata sonrası sürücünün durumu belirsiz olabilir; sağlıksızsa at
+            cls.checkin(driver, discard=not cls._is_healthy(driver))
+            raise
+        else:
+            cls.checkin(driver)
+
+    @classmethod
+    def close_all(cls):
+        """Havuzdaki tüm boşta sürücüleri kapatır; ödünçteki sürücüler iadede kapatılır."""
+        with cls._cond:
+            drivers = list(cls._idle)
+            cls._idle.clear()
+            for driver in drivers:
+                cls._all.discard(driver)
+                cls._pages.pop(driver, None)
+            # Ödünçteki sürücüler artık havuza ait değil, iadede kapatılacaklar
+            cls._all.clear()
+            cls._cond.notify_all()
+        if drivers:
+            print(f"{len(drivers)} WebDriver kapatılıyor...")
+        for driver in drivers:
+            cls._quit(driver)
+        if drivers:
+            print("WebDriver'lar kapatıldı.")
@@ -1,10 +1,67 @@
 # src/utils/constants.py
 
+import os
+from datetime import timedelta
+from pathlib import Path
+
 # Uygulama genelindeki sabitler
 SERVICE_ID = 'PricePal'
 DB_NAME = "pricepal.db"
+DB_BUSY_TIMEOUT_MS = 10000   # Kilitli veritabanında hata vermeden önce beklenecek süre
+DB_CACHE_SIZE_KB = 16384     # Bağlantı başına SQLite sayfa önbelleği
+DB_MAX_IN_PARAMS = 500       # Tek 'IN (...)' sorgusundaki en fazla parametre (eski SQLite sınırı 999)
+
+# Fiyat geçmişi saklama ve çözünürlük ayarları
+# (ayarlar: 'history_raw_retention_days', 'history_hourly_retention_days')
+DEFAULT_HISTORY_RAW_RETENTION_DAYS = 30
+DEFAULT_HISTORY_HOURLY_RETENTION_DAYS = 365
+# Kontrol çalıştırması ölçümlerinin (check_runs) saklanma süresi (ayar: 'check_runs_retention_days')
+DEFAULT_CHECK_RUNS_RETENTION_DAYS = 90
+HISTORY_RAW_MAX_SPAN = timedelta(days=2)      # bu aralığa kadar ham kayıtlar döndürülür
+HISTORY_HOURLY_MAX_SPAN = timedelta(days=90)  # bu aralığa kadar saatlik, sonrası günlük özet
 DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
+# Düz HTTP ile sayfa çekme ayarları
+HTTP_TIMEOUT = 10  # saniye
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+
+# Tarayıcıda sayfanın hazır olmasını bekleme ayarları (ayar: 'page_ready_timeout')
+DEFAULT_PAGE_READY_TIMEOUT = 15  # saniye
+PAGE_READY_POLL_INTERVAL = 0.1   # saniye
+PAGE_RETRY_DELAY = 1             # başarısız denemeler arası bekleme (saniye)
+
+# Site (host) başına istek hız sınırı varsayılanları
+# (ayarlar: 'rate_limit_interval', 'rate_limit_burst' ve siteye özel 'rate_limit_interval:<host>')
+DEFAULT_RATE_LIMIT_INTERVAL = 5  # aynı siteye iki istek arası saniye
+DEFAULT_RATE_LIMIT_BURST = 1     # art arda yapılabilecek en fazla istek
+SCHEDULER_MAX_IDLE_WAIT = 1      # saniye
+
+# Aynı anda açık tutulacak en fazla headless tarayıcı sayısı (ayar: 'driver_pool_size')
+DEFAULT_DRIVER_POOL_SIZE = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# Uzun ömürlü tarayıcıların bellek şişmesine karşı yeniden başlatılma sınırları
+# (ayarlar: 'driver_max_pages', 'driver_max_rss_mb'; 0 sınırı kapatır).
+# Bellek ölçümü için isteğe bağlı 'psutil' paketi gerekir.
+DEFAULT_DRIVER_MAX_PAGES = 100
+DEFAULT_DRIVER_MAX_RSS_MB = 1500
+
+# Kontrol boru hattında HTML ayrıştıran işçi (süreç) sayısı (ayar: 'pipeline_parse_workers')
+DEFAULT_PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Kontrol sonuçlarının toplu yazılması (ayarlar: 'db_batch_size', 'db_batch_interval')
+DEFAULT_DB_BATCH_SIZE = 50       # bu kadar kayıt birikince yaz
+DEFAULT_DB_BATCH_INTERVAL = 5    # en eski kayıt bu kadar saniye bekleyince yaz
+
+# Uygulamanın kullanıcıya özel önbellek dizini (yeniden boyutlandırılmış ikonlar vb.)
+CACHE_DIR = Path.home() / ".pricepal" / "cache"
+ICON_CACHE_DIR = CACHE_DIR / "icons"
+ICON_SIZE = (20, 20)
+
+# Soğuk açılışta pencerenin ilk kez çizilmesi için hedeflenen en uzun süre (saniye)
+# (bkz. benchmarks/startup_benchmark.py)
+STARTUP_TIME_BUDGET = 2.0
+
 # Arayüz ikonları
 ICONS = {
     "add": "add.png", 
@@ -12,4 +69,57 @@ ICONS = {
     "delete": "delete.png", 
     "refresh": "refresh.png", 
     "settings": "settings.png"
-}
\ No newline at end of file
+}
+
+# Ürün listesi (Treeview) her Tk döngüsünde en fazla bu kadar satır çizer
+TREE_REFRESH_CHUNK_SIZE = 200
+
+# Fiyat kontrolü sırasında ilerleme olaylarının GUI'de işlenme aralığı (ms)
+CHECK_EVENT_POLL_MS = 100
+
+# Uyarlanabilir kontrol zamanlaması (ayarlar: 'check_interval_min_minutes',
+# 'check_interval_max_minutes', 'check_budget_per_site'; bkz. core/check_policy.py)
+DEFAULT_CHECK_INTERVAL_MIN_MINUTES = 15     # sık değişen / hedefe yakın ürünler
+DEFAULT_CHECK_INTERVAL_MAX_MINUTES = 1440   # durağan ve hedeften uzak ürünler
+DEFAULT_CHECK_BUDGET_PER_SITE = 0           # bir çalıştırmada site başına en fazla ürün (0: sınırsız)
+VOLATILITY_SMOOTHING = 0.3   # fiyat değişim oranı ortalamasında son kontrolün ağırlığı
+DEFAULT_VOLATILITY = 0.5     # geçmişi olmayan ürünler için varsayılan değişim oranı
+PROXIMITY_RANGE = 0.25       # hedefin bu oran kadar üstündeki fiyatlar "yakın" sayılmaz
+
+# Bildirim kuyruğu (outbox): arka plan göndericinin kuyruğu yoklama aralığı (saniye)
+# ve bir alarm için en fazla gönderim denemesi
+OUTBOX_POLL_INTERVAL = 2
+OUTBOX_MAX_ATTEMPTS = 5
+
+# Ayarların bellekteki kopyası en fazla bu kadar saniye kullanılır; sonra başka bir
+# süreçte (GUI, arka plan denetleyicisi) yapılmış değişiklikler için yeniden okunur
+CONFIG_CACHE_TTL = 5
+
+# ChromeDriverManager().install() sonucunun (sürücü yolu) saklandığı dosya
+CHROMEDRIVER_PATH_CACHE = CACHE_DIR / "chromedriver_path.txt"
+
+# Arka plan denetleyicisinin daemon modunda iki kontrol turu arası en uzun bekleme
+# (saniye, ayar: 'daemon_interval_seconds' veya --interval)
+DEFAULT_DAEMON_INTERVAL = 300
+# Atlanan veya hata veren daemon turundan sonraki ilk bekleme (saniye); ardışık başarısızlıklarda iki katına çıkar
+DAEMON_RETRY_DELAY = 30
+
+# Tarayıcıda engellenecek kaynaklar (ayar: 'browser_block_profile', siteye özel
+# 'browser_block_profile:<host>'; profiller: off, light, standard, aggressive)
+DEFAULT_BLOCK_PROFILE = "standard"
+
+# Profil modu çıktıları (ayarlar: 'profile_runs', 'profile_output_dir', 'profile_top_n';
+# arka plan denetleyicisinde --profile)
+PROFILE_DIR = Path.home() / ".pricepal" / "profiles"
+DEFAULT_PROFILE_TOP_N = 25
+PROFILE_TRACEMALLOC_FRAMES = 10
+
+# Çalıştırmalar arasında kalıcı tarayıcı oturumları (ayar: 'persistent_browser_sessions'):
+# havuzdaki her tarayıcı yuvası için bir Chrome profili ve site başına bir çerez kavanozu
+BROWSER_PROFILE_DIR = CACHE_DIR / "browser_profiles"
+COOKIE_DIR = CACHE_DIR / "cookies"
+BROWSER_DISK_CACHE_BYTES = 100 * 1024 * 1024
+# Tüm süreçler toplamında en fazla kaç kalıcı profil yuvası açılacağı; dolarsa geçici profil kullanılır
+MAX_BROWSER_PROFILE_SLOTS = 32
+# Son kullanma tarihi olmayan (oturum) çerezlerinin en fazla saklanacağı süre (saniye)
+COOKIE_SESSION_MAX_AGE = 24 * 60 * 60
@@ -0,0 +1,54 @@
+# src/utils/file_lock.py
+
+import os
+from pathlib import Path
+
+class FileLock:
+    """
+    Süreçler arası, beklemeden alınan özel dosya kilidi. Kilit, süreç
+    sonlandığında işletim sistemi tarafından otomatik bırakılır.
+    """
+
+    def __init__(self, lock_path: Path):
+        self.lock_path = Path(lock_path)
+        self._file = None
+
+    def acquire(self) -> bool:
+        """Kilidi beklemeden almaya çalışır. :return: Alındıysa True."""
+        if self._file is not None:
+            return True
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,166 @@
+# src/utils/metrics.py
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# Ölçülen aşamalar (saniye cinsinden süreler):
+#   rate_limit_wait  fetch iş parçacığının site hız sınırı için beklediği süre
+#   driver_start     yeni bir Chrome sürecinin başlatılması
+#   http_fetch       düz HTTP isteği
+#   page_load        tarayıcıda sayfanın açılıp verinin hazır olması
+#   parse            HTML'in ayrıştırılması
+#   persist          sonucun işlenmesi (karşılaştırma, kuyruğa ekleme)
+#   db_flush         toplu yazmanın veritabanına aktarılması
+#   smtp_send        bir e-postanın gönderilmesi
+#   check            bir ürünün çekilmeye başlamasından kaydedilmesine kadar geçen süre
+
+class RunMetrics:
+    """
+    Bir kontrol çalıştırmasının aşama sürelerini ve site/durum sayaçlarını toplar.
+    Farklı iş parçacıklarından aynı anda güvenle kullanılabilir.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._stages = {}       # aşama -> [süre, ...]
+        self._results = {}      # (site, durum) -> adet
+        self._unchanged = 0
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    def count_result(self, site: str, status: str, unchanged: bool = False):
+        with self._lock:
+            key = (site or 'unknown', status or 'UNKNOWN')
+            self._results[key] = self._results.get(key, 0) + 1
+            if unchanged:
+                self._unchanged += 1
+
+    @staticmethod
+    def _quantile(values: list[float], q: float) -> float:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> dict:
+        """
+        :return: {'started_at', 'finished_at', 'duration', 'unchanged',
+                  'stages': {aşama: {'count', 'sum', 'p50', 'p95', 'max'}},
+                  'results': [{'site', 'status', 'count'}, ...],
+                  'statuses': {durum: adet}}
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    'count': len(values),
+                    'sum': sum(values),
+                    'p50': self._quantile(values, 0.5),
+                    'p95': self._quantile(values, 0.95),
+                    'max': max(values),
+                }
+                for stage, values in self._stages.items() if values
+            }
+            results = [{'site': site, 'status': status, 'count': count}
+                       for (site, status), count in sorted(self._results.items())]
+            unchanged = self._unchanged
+        statuses = {}
+        for row in results:
+            statuses[row['status']] = statuses.get(row['status'], 0) + row['count']
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'duration': time.monotonic() - self._started,
+            'unchanged': unchanged,
+            'stages': stages,
+            'results': results,
+            'statuses': statuses,
+        }
+
+# Süreçteki etkin çalıştırma; kontrol çalıştırmaları çalıştırma kilidiyle tek tek yapılır
+_active: RunMetrics | None = None
+
+@contextmanager
+def collect():
+    """`with metrics.collect() as run_metrics:` bloğu boyunca ölçümleri toplar."""
+    global _active
+    previous, _active = _active, RunMetrics()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+def observe(stage: str, seconds: float):
+    """Etkin çalıştırmaya bir aşama süresi ekler; çalıştırma yoksa hiçbir şey yapmaz."""
+    run_metrics = _active
+    if run_metrics is not None:
+        run_metrics.observe(stage, seconds)
+
+@contextmanager
+def timer(stage: str):
+    """Bloğun süresini `stage` aşaması olarak kaydeder (hata olsa da)."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        observe(stage, time.monotonic() - started)
+
+def count_result(site: str, status: str, unchanged: bool = False):
+    run_metrics = _active
+    if run_metrics is not None:
+        run_metrics.count_result(site, status, unchanged)
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def to_prometheus(summary: dict, run: dict) -> str:
+    """
+    Çalıştırma özetini Prometheus metin biçimine (node_exporter textfile collector) çevirir.
+    :param run: {'total', 'done', 'cancelled'}
+    """
+    finished = datetime.fromisoformat(summary['finished_at']).timestamp()
+    lines = [
+        "# HELP pricepal_check_run_last_finished_timestamp_seconds Son kontrol çalıştırmasının bitiş zamanı.",
+        "# TYPE pricepal_check_run_last_finished_timestamp_seconds gauge",
+        f"pricepal_check_run_last_finished_timestamp_seconds {finished:.3f}",
+        "# HELP pricepal_check_run_duration_seconds Son kontrol çalıştırmasının süresi.",
+        "# TYPE pricepal_check_run_duration_seconds gauge",
+        f"pricepal_check_run_duration_seconds {summary['duration']:.3f}",
+        "# HELP pricepal_check_run_products Son çalıştırmadaki ürün sayıları.",
+        "# TYPE pricepal_check_run_products gauge",
+        f'pricepal_check_run_products{{state="total"}} {run["total"]}',
+        f'pricepal_check_run_products{{state="done"}} {run["done"]}',
+        f'pricepal_check_run_products{{state="unchanged"}} {summary["unchanged"]}',
+        "# HELP pricepal_check_run_cancelled Son çalıştırma yarıda durdurulduysa 1.",
+        "# TYPE pricepal_check_run_cancelled gauge",
+        f"pricepal_check_run_cancelled {1 if run['cancelled'] else 0}",
+        "# HELP pricepal_check_results Son çalıştırmada site ve duruma göre sonuç sayısı.",
+        "# TYPE pricepal_check_results gauge",
+    ]
+    for row in summary['results']:
+        lines.append(f'pricepal_check_results{{site="{_escape_label(row["site"])}",'
+                     f'status="{_escape_label(row["status"])}"}} {row["count"]}')
+    lines += [
+        "# HELP pricepal_stage_seconds Son çalıştırmada aşama sürelerinin dağılımı.",
+        "# TYPE pricepal_stage_seconds summary",
+    ]
+    for stage, stats in sorted(summary['stages'].items()):
+        label = _escape_label(stage)
+        lines.append(f'pricepal_stage_seconds{{stage="{label}",quantile="0.5"}} {stats["p50"]:.6f}')
+        lines.append(f'pricepal_stage_seconds{{stage="{label}",quantile="0.95"}} {stats["p95"]:.6f}')
+        lines.append(f'pricepal_stage_seconds_sum{{stage="{label}"}} {stats["sum"]:.6f}')
+        lines.append(f'pricepal_stage_seconds_count{{stage="{label}"}} {stats["count"]}')
+    return "\n".join(lines) + "\n"
+
+def write_prometheus_textfile(path: str, summary: dict, run: dict):
+    """Metin dosyasını atomik olarak yazar; toplayıcı yarım yazılmış dosya görmez."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temp.write_text(to_prometheus(summary, run), encoding='utf-8')
+    os.replace(temp, target)
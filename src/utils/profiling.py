@@ -0,0 +1,150 @@
+# src/utils/profiling.py
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from . import constants
+
+class RunProfiler:
+    """
+    Bir kontrol çalıştırmasının CPU profilini (cProfile) ve bellek ayırma
+    anlık görüntülerini (tracemalloc) zaman damgalı bir dizine kaydeder.
+
+    Çalıştırma sırasında başlatılan her iş parçacığı (fetch/parse/persist
+    aşamaları, bildirim göndericisi) kendi cProfile nesnesiyle ölçülür ve
+    sonuçlar pstats ile birleştirilir. Ayrı süreçlerde yapılan ayrıştırma
+    profile dahil değildir; dahil etmek için 'pipeline_parse_processes' = '0'.
+
+    Oluşturulan dosyalar:
+        cpu.prof            pstats/snakeviz ile açılabilen birleşik CPU profili
+        memory_start.snapshot, memory_end.snapshot   tracemalloc anlık görüntüleri
+        summary.txt         en yoğun N fonksiyon ve en çok bellek ayıran N satır
+    """
+
+    def __init__(self, output_root: str | Path | None = None, top_n: int = constants.DEFAULT_PROFILE_TOP_N,
+                 label: str = "run"):
+        self.output_root = Path(output_root) if output_root else constants.PROFILE_DIR
+        self.top_n = max(1, top_n)
+        self.label = label
+        self.output_dir = None
+        self._profile = cProfile.Profile()
+        self._thread_profiles = []
+        self._lock = threading.Lock()
+        self._threads_supported = True
+        self._started_tracemalloc = False
+        self._memory_start = None
+
+    def prepare(self) -> Path:
+        """
+        Çıktı dizinini oluşturur. Aynı saniyede başlayan çalıştırmalar (örn. GUI ve
+        daemon) birbirinin üzerine yazmasın diye ad süreç kimliği ve gerekirse bir
+        sayaçla benzersiz yapılır.
+        :raises OSError: Dizin oluşturulamazsa.
+        """
+        if self.output_dir is not None:
+            return self.output_dir
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.output_root.mkdir(parents=True, exist_ok=True)
+        base = f"{stamp}-{self.label}-{os.getpid()}"
+        for attempt in range(100):
+            candidate = self.output_root / (base if attempt == 0 else f"{base}-{attempt}")
+            try:
+                candidate.mkdir()
+            except FileExistsError:
+                continue
+            self.output_dir = candidate
+            return candidate
+        raise FileExistsError(f"Benzersiz profil dizini oluşturulamadı: {self.output_root / base}")
+
+    def __enter__(self):
+        self.prepare()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(constants.PROFILE_TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._memory_start = tracemalloc.take_snapshot()
+        threading.setprofile(self._start_thread_profile)
+        self._profile.enable()
+        return self
+
+    def _start_thread_profile(self, frame, event, arg):
+        # Yeni iş parçacığının ilk olayında bu kanca kaldırılır ve yerine cProfile kurulur
+        sys.setprofile(None)
+        if not self._threads_supported:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Bazı Python sürümlerinde aynı anda yalnızca bir profil etkin olabilir
+            self._threads_supported = False
+            return
+        with self._lock:
+            self._thread_profiles.append(profile)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profile.disable()
+        threading.setprofile(None)
+        memory_end = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        self._profile.create_stats()
+        stats = pstats.Stats(self._profile)
+        with self._lock:
+            thread_profiles = list(self._thread_profiles)
+        for profile in thread_profiles:
+            profile.create_stats()
+            if profile.stats:
+                stats.add(profile)
+        summary = self._summary(stats, memory_end, peak, len(thread_profiles))
+        print(summary)
+        try:
+            stats.dump_stats(self.output_dir / "cpu.prof")
+            self._memory_start.dump(str(self.output_dir / "memory_start.snapshot"))
+            memory_end.dump(str(self.output_dir / "memory_end.snapshot"))
+            (self.output_dir / "summary.txt").write_text(summary, encoding='utf-8')
+        except OSError as e:
+            # Profil yazılamaması çalıştırmanın sonucunu etkilemez
+            print(f"Profil çıktıları kaydedilemedi: {e}")
+            return
+        print(f"Profil çıktıları: {self.output_dir}")
+
+    def _summary(self, stats: pstats.Stats, memory_end, peak: int, thread_count: int) -> str:
+        out = io.StringIO()
+        out.write(f"=== CPU: en yoğun {self.top_n} fonksiyon (kendi süresi; {thread_count + 1} iş parçacığı) ===\n")
+        if not self._threads_supported:
+            out.write("(Uyarı: bu Python sürümünde yalnızca ana iş parçacığı ölçülebildi)\n")
+        stats.stream = out
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top_n)
+        out.write(f"=== Bellek: en çok artan {self.top_n} satır (en yüksek: {peak / 1024 / 1024:.1f} MB) ===\n")
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen *>")]
+        differences = memory_end.filter_traces(filters).compare_to(
+            self._memory_start.filter_traces(filters), 'lineno')
+        for difference in differences[:self.top_n]:
+            out.write(f"{difference}\n")
+        return out.getvalue()
+
+def profile_run(enabled: bool, output_root: str | Path | None = None,
+                top_n: int = constants.DEFAULT_PROFILE_TOP_N, label: str = "run"):
+    """
+    `with profile_run(...)` — etkin değilse veya çıktı dizini oluşturulamıyorsa
+    (hatalı 'profile_output_dir', izin sorunu) hiçbir şey yapmayan bağlam
+    yöneticisi döndürür; profil ayarı hiçbir zaman kontrolleri durdurmaz.
+    """
+    if not enabled:
+        return nullcontext()
+    profiler = RunProfiler(output_root, top_n, label)
+    try:
+        profiler.prepare()
+    except OSError as e:
+        print(f"Profil dizini oluşturulamadı, çalıştırma profillenmeden sürdürülüyor: {e}")
+        return nullcontext()
+    return profiler
@@ -0,0 +1,11 @@
+# src/utils/url_utils.py
+
+from urllib.parse import urlsplit
+
+def get_host(url: str) -> str:
+    """
+    URL'nin küçük harfli, 'www.' öneki atılmış host adını döndürür.
+    Örn: 'https://www.Amazon.com.tr/dp/X' -> 'amazon.com.tr'
+    """
+    host = (urlsplit(url.strip()).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
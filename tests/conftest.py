@@ -0,0 +1,19 @@
+# tests/conftest.py
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Testler depo kökünden 'src' paketi olarak içe aktarır
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.db_manager import DBManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Geçici dizinde, tüm geçişleri uygulanmış boş bir veritabanı."""
+    manager = DBManager(tmp_path / "pricepal_test.db")
+    yield manager
+    manager.close()
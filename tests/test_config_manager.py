@@ -0,0 +1,55 @@
+# tests/test_config_manager.py
+
+import smtplib
+
+import pytest
+
+from src.core import config_manager
+from src.core.config_manager import ConfigManager
+from src.notifications.outbox import OutboxSender
+from src.utils import constants
+
+
+@pytest.fixture
+def keyring_reads(db, monkeypatch):
+    """Keyring yerine sayaçlı bir sözlük; önbellekler testler arasında paylaşılmasın."""
+    reads = []
+    monkeypatch.setattr(ConfigManager, "_snapshots", {})
+    monkeypatch.setattr(ConfigManager, "_passwords", {})
+    monkeypatch.setattr(config_manager.keyring, "get_password",
+                        lambda service, email: reads.append(email) or "app-password")
+    ConfigManager(db).set('user_email', "user@example.com")
+    return reads
+
+
+def test_password_is_read_from_keyring_once_per_process(db, keyring_reads, monkeypatch):
+    # Ayar kopyasının süresi dolsa da şifre önbellekte kalır
+    monkeypatch.setattr(constants, "CONFIG_CACHE_TTL", 0)
+    config = ConfigManager(db)
+    assert config.get_email_password() == "app-password"
+    assert ConfigManager(db).get_email_password() == "app-password"
+    assert keyring_reads == ["user@example.com"]
+
+
+def test_invalidate_and_forget_drop_the_cached_password(db, keyring_reads):
+    config = ConfigManager(db)
+    config.get_email_password()
+    config.invalidate()
+    config.get_email_password()
+    config.forget_email_password()
+    config.get_email_password()
+    assert len(keyring_reads) == 3
+
+
+def test_smtp_authentication_failure_drops_the_cached_password(db, keyring_reads, monkeypatch):
+    config = ConfigManager(db)
+    config.get_email_password()
+    outbox = OutboxSender(db, config)
+
+    def drain():
+        raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    monkeypatch.setattr(outbox, "drain", drain)
+    outbox.send_pending()
+    config.get_email_password()
+    assert len(keyring_reads) == 2
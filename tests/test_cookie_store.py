@@ -0,0 +1,42 @@
+# tests/test_cookie_store.py
+
+import pytest
+import requests
+
+from src.scraping.cookie_store import CookieStore
+from src.utils import constants
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Çerezler geçici dizine yazılsın, kavanozlar testler arasında paylaşılmasın."""
+    monkeypatch.setattr(constants, "COOKIE_DIR", tmp_path / "cookies")
+    monkeypatch.setattr(CookieStore, "_jars", {})
+    monkeypatch.setattr(CookieStore, "_versions", {})
+    monkeypatch.setattr(CookieStore, "_enabled", True)
+    return CookieStore
+
+
+def test_collect_from_session_keeps_only_the_site_and_its_subdomains(store):
+    session = requests.Session()
+    session.cookies.set("exact", "1", domain="hepsiburada.com")
+    session.cookies.set("parent", "1", domain=".hepsiburada.com")
+    session.cookies.set("sub", "1", domain="www.hepsiburada.com")
+    session.cookies.set("lookalike", "1", domain="evilhepsiburada.com")
+    session.cookies.set("other", "1", domain="amazon.com.tr")
+
+    store.collect_from_session(session, "hepsiburada.com")
+
+    _, cookies = store.get("hepsiburada.com")
+    assert sorted(cookie['name'] for cookie in cookies) == ["exact", "parent", "sub"]
+
+
+def test_collect_from_session_accepts_parent_domain_cookies_for_a_subdomain(store):
+    session = requests.Session()
+    session.cookies.set("parent", "1", domain=".hepsiburada.com")
+    session.cookies.set("lookalike", "1", domain="burada.com")
+
+    store.collect_from_session(session, "m.hepsiburada.com")
+
+    _, cookies = store.get("m.hepsiburada.com")
+    assert [cookie['name'] for cookie in cookies] == ["parent"]
@@ -0,0 +1,82 @@
+# tests/test_migrations.py
+
+import sqlite3
+import threading
+
+from src.database import migrations
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def test_migrate_from_empty_database_reaches_latest_version(tmp_path):
+    conn = _connect(tmp_path / "fresh.db")
+    assert migrations.get_schema_version(conn) == 0
+    assert migrations.migrate(conn) == migrations.LATEST_VERSION
+    assert migrations.get_schema_version(conn) == migrations.LATEST_VERSION
+
+    tables = {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {'products', 'price_history', 'settings', 'page_validators',
+            'notification_outbox', 'check_runs'} <= tables
+    columns = {row['name'] for row in conn.execute("PRAGMA table_info(products)")}
+    assert {'updated_at', 'next_check_at', 'volatility', 'consecutive_errors'} <= columns
+    # Tetikleyici gövdeleri deyimlere bölünürken parçalanmamalı
+    triggers = {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert triggers == {'trg_products_insert_updated_at', 'trg_products_update_updated_at'}
+
+
+def test_migrate_is_a_no_op_when_up_to_date(tmp_path):
+    conn = _connect(tmp_path / "fresh.db")
+    migrations.migrate(conn)
+    assert migrations.migrate(conn) == migrations.LATEST_VERSION
+
+
+def test_concurrent_migrations_apply_each_step_once(tmp_path, capsys):
+    path = tmp_path / "shared.db"
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(migrations.migrate(_connect(path)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == [migrations.LATEST_VERSION] * 4
+    applied = [line for line in capsys.readouterr().out.splitlines() if "şeması güncelleniyor" in line]
+    assert len(applied) == len(migrations.MIGRATIONS)
+
+
+def test_site_labels_are_mapped_by_url_host(tmp_path, monkeypatch):
+    conn = _connect(tmp_path / "labels.db")
+    # Site etiketlerinin host adına dönüştürüldüğü adımdan önceki şema
+    monkeypatch.setattr(migrations, "MIGRATIONS", [step for step in migrations.MIGRATIONS if step[0] < 9])
+    monkeypatch.setattr(migrations, "LATEST_VERSION", 8)
+    migrations.migrate(conn)
+    products = [
+        ("https://www.amazon.com.tr/dp/B000?ref=hepsiburada.com", "amazon"),
+        ("https://www.hepsiburada.com/urun-p-1", "hepsiburada"),
+        ("https://m.hepsiburada.com/urun-p-2", "m"),
+        ("https://m.amazon.com.tr/dp/B001", "m"),
+        ("https://www.hepsiburada.com.evil.example/urun-p-3", "hepsiburada"),
+        ("https://www.amazon.com/dp/B002", "amazon"),
+    ]
+    conn.executemany(
+        "INSERT INTO products (url, target_price, site, added_date, status) VALUES (?, 1, ?, '2024-01-01', 'TRACKING')",
+        products)
+    conn.commit()
+    monkeypatch.undo()
+
+    migrations.migrate(conn)
+
+    sites = [row['site'] for row in conn.execute("SELECT site FROM products ORDER BY id")]
+    assert sites == ["amazon.com.tr", "hepsiburada.com", "hepsiburada.com", "amazon.com.tr", "hepsiburada", "amazon"]
@@ -0,0 +1,67 @@
+# tests/test_outbox.py
+
+from src.core.config_manager import ConfigManager
+from src.notifications.outbox import OutboxSender
+from src.utils import constants
+
+
+def _add_product(db):
+    return db.add_product("https://www.hepsiburada.com/urun-p-1", 100.0, "hepsiburada.com")
+
+
+def test_enqueue_keeps_one_pending_alert_per_product(db):
+    product_id = _add_product(db)
+    db.enqueue_notification(product_id, "Ürün", "https://www.hepsiburada.com/urun-p-1", 90.0)
+    db.enqueue_notification(product_id, "Ürün", "https://www.hepsiburada.com/urun-p-1", 80.0)
+    pending = db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)
+    assert [row['price'] for row in pending] == [90.0]
+
+
+def test_batched_enqueue_uses_the_same_guard(db):
+    product_id = _add_product(db)
+    with db.batch() as batch:
+        batch.enqueue_notification(product_id, "Ürün", "u", 90.0)
+        batch.enqueue_notification(product_id, "Ürün", "u", 80.0)
+    assert len(db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)) == 1
+
+
+def test_dead_lettered_alert_does_not_block_new_alerts(db):
+    product_id = _add_product(db)
+    db.enqueue_notification(product_id, "Ürün", "u", 90.0)
+    ids = [row['id'] for row in db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)]
+    for _ in range(constants.OUTBOX_MAX_ATTEMPTS):
+        db.mark_notifications_failed(ids, "SMTP kapalı")
+    assert db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS) == []
+
+    db.enqueue_notification(product_id, "Ürün", "u", 85.0)
+    pending = db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)
+    assert [row['price'] for row in pending] == [85.0]
+
+
+def test_sent_alert_deactivates_product(db):
+    product_id = _add_product(db)
+    db.enqueue_notification(product_id, "Ürün", "u", 90.0)
+    ids = [row['id'] for row in db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)]
+    db.mark_notifications_sent(ids)
+    assert db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS) == []
+    assert db.get_product_by_id(product_id)['is_active'] == 0
+
+
+def test_deleting_product_drops_its_pending_alerts(db):
+    product_id = _add_product(db)
+    db.enqueue_notification(product_id, "Ürün", "u", 90.0)
+    db.delete_product(product_id)
+    assert db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS) == []
+
+
+def test_missing_credentials_are_reported_once_per_sender(db, capsys, monkeypatch):
+    monkeypatch.setattr(ConfigManager, "get_email_password", lambda self: None)
+    product_id = _add_product(db)
+    db.enqueue_notification(product_id, "Ürün", "u", 90.0)
+    outbox = OutboxSender(db, ConfigManager(db))
+    for _ in range(3):
+        assert outbox.drain() == 0
+    outbox.stop()
+
+    assert capsys.readouterr().out.count("kimlik bilgileri eksik") == 1
+    assert len(db.get_pending_notifications(constants.OUTBOX_MAX_ATTEMPTS)) == 1
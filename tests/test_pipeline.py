@@ -0,0 +1,157 @@
+# tests/test_pipeline.py
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.core.config_manager import ConfigManager
+from src.core import tracker
+from src.core.pipeline import CheckPipeline
+from src.core.tracker import process_check_result, run_product_checks
+from src.scraping import scraper_factory
+from src.scraping.base_scraper import BaseScraper
+
+SITE = "shop.example"
+
+
+class PageScraper(BaseScraper):
+    """Sayfayı ağdan değil `page_source` ile alan, süreç havuzunda da çalışabilen scraper."""
+
+    def extract(self, soup) -> dict:
+        return {'name': soup.find("h1").get_text(), 'price': self.clean_price(soup.find("span").get_text())}
+
+
+def _page(url: str) -> str:
+    number = url.rsplit("-", 1)[-1]
+    return f"<html><body><h1>Ürün {number}</h1><span>{number}00,00 TL</span></body></html>"
+
+
+@pytest.fixture
+def config(db, monkeypatch):
+    monkeypatch.setattr(scraper_factory, "get_scraper", lambda url: PageScraper(url, page_source=_page))
+    config = ConfigManager(db)
+    for key, value in {
+        'rate_limit_interval': '0',
+        'persistent_browser_sessions': '0',
+        'pipeline_fetch_workers': '1',
+        'pipeline_parse_processes': '0',
+        'db_batch_interval': '0.05',
+    }.items():
+        config.set(key, value)
+    return config
+
+
+def _add_products(db, count: int) -> list:
+    for number in range(1, count + 1):
+        db.add_product(f"https://{SITE}/urun-{number}", 150.0, SITE)
+    return db.get_active_products_for_check()
+
+
+def test_results_are_persisted(db, config):
+    products = _add_products(db, 3)
+    events = []
+    run_product_checks(products, db, config, on_event=events.append)
+
+    rows = {row['url']: row for row in db.get_all_products()}
+    assert rows[f"https://{SITE}/urun-1"]['current_price'] == 100.0
+    assert rows[f"https://{SITE}/urun-1"]['status'] == 'PRICE_ALERT'
+    assert rows[f"https://{SITE}/urun-3"]['name'] == "Ürün 3"
+    assert rows[f"https://{SITE}/urun-3"]['status'] == 'TRACKING'
+    assert events[-1] == {'type': 'run_finished', 'done': 3, 'total': 3, 'cancelled': False}
+
+
+def test_results_are_persisted_with_parse_processes(db, config):
+    config.set('pipeline_parse_processes', '1')
+    config.set('pipeline_parse_workers', '2')
+    products = _add_products(db, 4)
+    run = CheckPipeline(db, config, process_check_result).run(products)
+
+    assert run == {'total': 4, 'done': 4, 'cancelled': False}
+    assert sorted(row['current_price'] for row in db.get_all_products()) == [100.0, 200.0, 300.0, 400.0]
+
+
+def test_cancel_stops_fetching_but_persists_fetched_pages(db, config):
+    products = _add_products(db, 10)
+    cancel_event = threading.Event()
+
+    def on_event(event):
+        if event['type'] == 'started':
+            cancel_event.set()
+
+    run = CheckPipeline(db, config, process_check_result, on_event, cancel_event).run(products)
+
+    assert run['cancelled'] is True
+    assert 1 <= run['done'] < run['total']
+    checked = [row for row in db.get_all_products() if row['last_check_date'] is not None]
+    assert len(checked) == run['done']
+
+
+def test_failing_flush_does_not_hang_the_run(db, config, monkeypatch):
+    from src.database.db_manager import WriteBatch
+
+    def failing_flush(self):
+        if len(self):
+            raise sqlite3.OperationalError("database is locked")
+
+    def slow_page(url):
+        # Yazıcı kuyrukta beklerken zamanı gelen aktarımı denesin
+        time.sleep(0.1)
+        return _page(url)
+
+    monkeypatch.setattr(WriteBatch, "flush", failing_flush)
+    monkeypatch.setattr(scraper_factory, "get_scraper", lambda url: PageScraper(url, page_source=slow_page))
+    config.set('pipeline_queue_size', '1')
+    config.set('db_batch_size', '100')
+    products = _add_products(db, 10)
+    errors = []
+
+    def run():
+        try:
+            CheckPipeline(db, config, process_check_result).run(products)
+        except sqlite3.Error as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+
+    assert not worker.is_alive(), "çalıştırma yazma hatasından sonra bitmedi"
+    # Son aktarım da başarısız olduğu için hata çağırana iletilir
+    assert len(errors) == 1
+
+
+def test_transient_flush_failure_does_not_change_check_results(db, config, monkeypatch):
+    from src.database.db_manager import WriteBatch
+
+    flush = WriteBatch.flush
+    failures = []
+
+    def flaky_flush(self):
+        if len(self) and not failures:
+            failures.append(True)
+            raise sqlite3.OperationalError("database is locked")
+        flush(self)
+
+    monkeypatch.setattr(WriteBatch, "flush", flaky_flush)
+    config.set('db_batch_size', '1')
+    products = _add_products(db, 3)
+    CheckPipeline(db, config, process_check_result).run(products)
+
+    assert failures == [True]
+    rows = sorted(db.get_all_products(), key=lambda row: row['id'])
+    assert [row['status'] for row in rows] == ['PRICE_ALERT', 'TRACKING', 'TRACKING']
+    assert [row['current_price'] for row in rows] == [100.0, 200.0, 300.0]
+    assert [row['consecutive_errors'] for row in rows] == [0, 0, 0]
+
+
+def test_run_is_reported_as_skipped_while_another_check_holds_the_lock(db, config, monkeypatch):
+    _add_products(db, 2)
+    monkeypatch.setattr(tracker, "DBManager", lambda: db)
+    events = []
+    with db.run_lock():
+        tracker.run_all_active_product_checks(on_event=events.append)
+
+    assert events == [{'type': 'run_skipped', 'reason': 'locked'}]
+    assert all(row['last_check_date'] is None for row in db.get_all_products())
@@ -0,0 +1,75 @@
+# tests/test_scheduler.py
+
+import threading
+
+from src.core.scheduler import TokenBucket, DomainScheduler
+
+
+def test_token_bucket_starts_full_and_refills_at_rate():
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    now = bucket.updated_at
+    assert bucket.wait_time(now) == 0.0
+    bucket.consume(now)
+    bucket.consume(now)
+    assert bucket.wait_time(now) == 0.5
+    assert bucket.wait_time(now + 0.5) == 0.0
+
+
+def test_token_bucket_never_exceeds_capacity():
+    bucket = TokenBucket(rate=10.0, capacity=3)
+    bucket.consume(bucket.updated_at)
+    bucket.wait_time(bucket.updated_at + 100)
+    assert bucket.tokens == 3
+
+
+def test_token_bucket_unlimited_rate_is_always_ready():
+    bucket = TokenBucket(rate=float('inf'), capacity=1)
+    now = bucket.updated_at
+    for _ in range(5):
+        assert bucket.wait_time(now) == 0.0
+        bucket.consume(now)
+
+
+def _unlimited(host):
+    return TokenBucket(float('inf'), 1)
+
+
+def test_domain_scheduler_round_robins_between_hosts():
+    items = [{'url': f"https://{host}/p{i}"} for host in ("a.com", "b.com") for i in range(3)]
+    scheduler = DomainScheduler(items, _unlimited)
+    order = []
+    while (item := scheduler.next_item()) is not None:
+        order.append(item['url'].split('/')[2])
+    assert order == ["a.com", "b.com"] * 3
+    assert scheduler.remaining() == 0
+
+
+def test_domain_scheduler_does_not_let_a_slow_host_block_others():
+    items = [{'url': "https://slow.com/1"}, {'url': "https://slow.com/2"}, {'url': "https://fast.com/1"}]
+    scheduler = DomainScheduler(
+        items, lambda host: TokenBucket(0.001 if host == "slow.com" else float('inf'), 1))
+    first, second = scheduler.next_item(), scheduler.next_item()
+    assert {first['url'], second['url']} == {"https://slow.com/1", "https://fast.com/1"}
+    # slow.com'un ikinci işi ~1000 sn sonra hazır olur; durdurma isteği beklemeyi keser
+    stop = threading.Event()
+    threading.Timer(0.1, stop.set).start()
+    assert scheduler.next_item(stop) is None
+    assert scheduler.remaining() == 1
+
+
+def test_domain_scheduler_hands_each_item_out_once_across_threads():
+    items = [{'url': f"https://h{i % 4}.com/{i}"} for i in range(200)]
+    scheduler = DomainScheduler(items, _unlimited)
+    taken, lock = [], threading.Lock()
+
+    def worker():
+        while (item := scheduler.next_item()) is not None:
+            with lock:
+                taken.append(item['url'])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(taken) == sorted(item['url'] for item in items)
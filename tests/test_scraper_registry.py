@@ -0,0 +1,81 @@
+# tests/test_scraper_registry.py
+
+import sys
+import threading
+
+import pytest
+
+from src.scraping import scraper_factory
+from src.scraping.base_scraper import BaseScraper
+from src.scraping.scraper_factory import ScraperRegistry
+from src.utils.exceptions import UnsupportedSiteError
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Testlerin eklediği kayıtlar diğer testlere sızmasın."""
+    monkeypatch.setattr(ScraperRegistry, "_targets", dict(ScraperRegistry._targets))
+    monkeypatch.setattr(ScraperRegistry, "_classes", dict(ScraperRegistry._classes))
+    return ScraperRegistry
+
+
+@pytest.mark.parametrize("url, site", [
+    ("https://www.amazon.com.tr/dp/B000", "amazon.com.tr"),
+    ("https://AMAZON.com.tr/dp/B000", "amazon.com.tr"),
+    ("https://www.hepsiburada.com/urun-p-1", "hepsiburada.com"),
+    ("https://m.hepsiburada.com/urun-p-1", "hepsiburada.com"),
+    ("https://www.example.com/?u=amazon.com.tr", None),
+    ("https://notamazon.com.tr/dp/B000", None),
+    ("https://hepsiburada.com.evil.example/urun", None),
+    ("gecersiz-adres", None),
+])
+def test_host_lookup(registry, url, site):
+    assert registry.match(url) == site
+    assert scraper_factory.is_supported(url) is (site is not None)
+
+
+def test_lookup_does_not_import_the_scraper_module(registry):
+    registry.register("lazy.example", "tests.does_not_exist:Scraper")
+    assert registry.is_supported("https://shop.lazy.example/p/1")
+    assert "tests.does_not_exist" not in sys.modules
+
+
+def test_get_scraper_loads_registered_class(registry):
+    from src.scraping.hepsiburada_scraper import HepsiburadaScraper
+    scraper = scraper_factory.get_scraper("https://m.hepsiburada.com/urun-p-1")
+    assert isinstance(scraper, HepsiburadaScraper)
+    assert scraper.url == "https://m.hepsiburada.com/urun-p-1"
+
+
+def test_unsupported_and_broken_entries_raise(registry):
+    with pytest.raises(UnsupportedSiteError):
+        scraper_factory.get_scraper("https://www.example.com/p/1")
+    registry.register("broken.example", "tests.does_not_exist:Scraper")
+    with pytest.raises(UnsupportedSiteError):
+        scraper_factory.get_scraper("https://broken.example/p/1")
+
+
+def test_lookups_do_not_wait_for_a_slow_scraper_import(registry):
+    importing, release = threading.Event(), threading.Event()
+
+    class SlowTarget:
+        """Yüklenmesi uzun süren bir entry point gibi davranır."""
+        def load(self):
+            importing.set()
+            release.wait(5)
+            return BaseScraper
+
+    registry.register("slow.example", SlowTarget())
+    loader = threading.Thread(target=registry.get_class, args=("https://slow.example/p/1",))
+    loader.start()
+    try:
+        assert importing.wait(5)
+        # Yükleme sürerken kilit tutulsaydı bu çağrı 5 sn beklerdi
+        finished = threading.Event()
+        threading.Thread(target=lambda: (registry.match("https://www.amazon.com.tr/dp/B000"), finished.set()),
+                         daemon=True).start()
+        assert finished.wait(1)
+    finally:
+        release.set()
+        loader.join()
+    assert registry._classes["slow.example"] is BaseScraper